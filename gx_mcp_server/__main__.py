@@ -13,7 +13,7 @@ import argparse
 import asyncio
 import os
 import sys
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
 
 from gx_mcp_server.server import create_server
@@ -88,7 +88,40 @@ Examples:
         "--storage-backend",
         type=str,
         default="memory",
-        help="Storage backend URI (default: memory). Use sqlite:///path/to/gx.db",
+        help=(
+            "Storage backend URI (default: memory). Use memory?max_bytes=N "
+            "for a byte budget, sqlite:///path/to/gx.db, "
+            "tiered:///path/to/spill-dir, arrow:///path/to/dir, "
+            "shm://namespace or redis://host:6379/0"
+        ),
+    )
+
+    parser.add_argument(
+        "--dedup-datasets",
+        action="store_true",
+        help="Store identical datasets once and hand out aliased handles",
+    )
+
+    parser.add_argument(
+        "--dataset-ttl",
+        metavar="SECONDS",
+        type=float,
+        default=os.getenv("MCP_DATASET_TTL_SECONDS"),
+        help=(
+            "Expire datasets this many seconds after loading "
+            "(default: never, or from MCP_DATASET_TTL_SECONDS env var)"
+        ),
+    )
+
+    parser.add_argument(
+        "--result-ttl",
+        metavar="SECONDS",
+        type=float,
+        default=os.getenv("MCP_RESULT_TTL_SECONDS"),
+        help=(
+            "Expire validation results this many seconds after they were "
+            "written (default: never, or from MCP_RESULT_TTL_SECONDS env var)"
+        ),
     )
 
     parser.add_argument(
@@ -192,12 +225,17 @@ def setup_logging(level: str, trace: bool = False) -> None:
 async def run_stdio() -> None:
     """Run MCP server in STDIO mode."""
     from gx_mcp_server import logger
+    from gx_mcp_server.core import offload, storage
 
     logger.info("Starting GX MCP Server in STDIO mode")
     mcp = create_server()
 
     # Run the server in STDIO mode
-    await mcp.run_stdio_async()
+    try:
+        async with storage.expiry_sweeper():
+            await mcp.run_stdio_async()
+    finally:
+        offload.shutdown(wait=False)
 
 
 def setup_tracing(app: Any) -> None:
@@ -247,6 +285,8 @@ async def run_http(
     from starlette.middleware import Middleware
     from gx_mcp_server.tools.health import health
     from gx_mcp_server.oauth_token import oauth_token_endpoint
+    from gx_mcp_server.core import offload, storage
+    from contextlib import asynccontextmanager
     import uvicorn
 
     logger.info(f"Starting GX MCP Server in HTTP mode on {host}:{port}")
@@ -309,8 +349,16 @@ async def run_http(
     if trace_enabled:
         setup_tracing(mcp_app)
 
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        try:
+            async with mcp_app.lifespan(app), storage.expiry_sweeper():
+                yield
+        finally:
+            offload.shutdown(wait=False)
+
     app = Starlette(
-        lifespan=mcp_app.lifespan,
+        lifespan=lifespan,
         routes=[
             Route("/mcp/health", health, methods=["GET", "OPTIONS"], name="health"),
             Route(
@@ -408,6 +456,8 @@ def main() -> None:
     from gx_mcp_server.core import storage
 
     storage.configure_storage_backend(args.storage_backend)
+    storage.configure_dataset_dedup(args.dedup_datasets)
+    storage.configure_ttl(args.dataset_ttl, args.result_ttl)
 
     if args.disable_analytics:
         os.environ["GX_ANALYTICS_ENABLED"] = "false"
@@ -0,0 +1,121 @@
+"""Memory-optimizing dtype conversion for loaded datasets.
+
+:func:`optimize` turns low-cardinality string columns into categoricals,
+narrows integer columns to the smallest type holding their range and stores
+float columns as 32-bit when that round-trips every value. Conversions keep
+the column's dtype family (NumPy, pandas nullable or Arrow), so nulls and
+values compare the same before and after.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from gx_mcp_server.core.storage import is_polars_frame
+
+# Columns with at most this share of distinct values become categoricals
+CATEGORY_RATIO = 0.5
+_INT_TYPES = [np.dtype(t) for t in ("int8", "int16", "int32")]
+
+
+def _like(dtype: Any, target: np.dtype) -> Any:
+    """Return ``target`` in the dtype family of ``dtype``."""
+    if isinstance(dtype, pd.ArrowDtype):
+        return pd.ArrowDtype(pa.from_numpy_dtype(target))
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        kind = "Int" if target.kind == "i" else "Float"
+        return pd.api.types.pandas_dtype(f"{kind}{target.itemsize * 8}")
+    return target
+
+
+def _is_string(series: pd.Series) -> bool:
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        return pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(
+            dtype.pyarrow_dtype
+        )
+    if isinstance(dtype, pd.StringDtype):
+        return True
+    return (
+        pd.api.types.is_object_dtype(dtype)
+        and pd.api.types.infer_dtype(series) == "string"
+    )
+
+
+def _optimized(series: pd.Series, category_ratio: float) -> Optional[Any]:
+    """Return a smaller dtype for ``series``, or ``None`` to keep it."""
+    values = series.dropna()
+    if values.empty:
+        return None
+    if _is_string(series):
+        if values.nunique() <= category_ratio * len(series):
+            return "category"
+        return None
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return None
+    if pd.api.types.is_integer_dtype(series.dtype):
+        if series.dtype.itemsize <= 1:
+            return None
+        low, high = values.min(), values.max()
+        for target in _INT_TYPES:
+            if target.itemsize >= series.dtype.itemsize:
+                return None
+            info = np.iinfo(target)
+            if info.min <= low and high <= info.max:
+                return _like(series.dtype, target)
+        return None
+    if pd.api.types.is_float_dtype(series.dtype) and series.dtype.itemsize == 8:
+        as_float = values.to_numpy(dtype=np.float64)
+        narrowed = as_float.astype(np.float32)
+        with np.errstate(invalid="ignore"):
+            lossless = np.array_equal(
+                narrowed.astype(np.float64), as_float, equal_nan=True
+            )
+        return _like(series.dtype, np.dtype("float32")) if lossless else None
+    return None
+
+
+def _optimize_polars(df: Any, category_ratio: float) -> Any:
+    import polars as pl
+
+    columns = []
+    for series in df.get_columns():
+        values = series.drop_nulls()
+        if values.is_empty():
+            columns.append(series)
+        elif series.dtype == pl.String:
+            if values.n_unique() <= category_ratio * len(series):
+                series = series.cast(pl.Categorical)
+            columns.append(series)
+        elif series.dtype.is_integer():
+            columns.append(series.shrink_dtype())
+        elif series.dtype == pl.Float64:
+            narrowed = series.cast(pl.Float32)
+            if (narrowed.cast(pl.Float64) == series).all():
+                series = narrowed
+            columns.append(series)
+        else:
+            columns.append(series)
+    return pl.DataFrame(columns)
+
+
+def optimize(df: Any, category_ratio: float = CATEGORY_RATIO) -> Any:
+    """Return ``df`` with memory-optimized column dtypes.
+
+    Args:
+        df: pandas or Polars frame
+        category_ratio: Convert string columns whose distinct values make up
+            at most this share of the rows to categoricals
+    """
+    if is_polars_frame(df):
+        return _optimize_polars(df, category_ratio)
+    changes = {}
+    for name, series in df.items():
+        target = _optimized(series, category_ratio)
+        if target is not None:
+            changes[name] = target
+    return df.astype(changes) if changes else df
@@ -0,0 +1,338 @@
+"""Pooled HTTP fetching for URL sources with a conditional-request cache.
+
+Requests go through one ``httpx.AsyncClient`` running on a background event
+loop, so connections are pooled and kept alive across loads and callers.
+Bodies are handed to parsers as blocking streams while they download, and
+complete bodies with an ``ETag`` or ``Last-Modified`` header are copied to
+an on-disk cache as they stream past. The next load of the same URL sends a
+conditional request; a ``304 Not Modified`` answer is served from the cache,
+together with the frame parsed from it by an earlier load with the same
+read options.
+
+Cached bodies are trusted like fresh downloads, so the cache directory must
+belong to the current user and not be writable by anyone else; it is created
+with mode ``0o700``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import json
+import os
+import stat
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, Coroutine, Iterator, Optional, cast
+
+import httpx
+import pandas as pd
+
+from gx_mcp_server.core import ingest
+from gx_mcp_server.logging import logger
+from gx_mcp_server.storage import arrow_codec
+
+_TIMEOUT = 30.0
+_MAX_CONNECTIONS = 20
+_MAX_CACHED_URLS = 64
+# Parsed frames kept per cached body, one per set of read options
+_MAX_FRAMES_PER_URL = 4
+
+_loop: asyncio.AbstractEventLoop | None = None
+_client: httpx.AsyncClient | None = None
+_client_lock = threading.Lock()
+
+_cache_dir: Path | None = Path(
+    os.getenv("MCP_HTTP_CACHE_DIR") or Path(tempfile.gettempdir()) / "gx_mcp_http"
+)
+# Cache directories already checked, and whether they passed
+_checked_dirs: dict[Path, bool] = {}
+
+
+def configure_cache(directory: str | Path | None) -> None:
+    """Cache URL downloads in ``directory``, or disable caching with ``None``."""
+    global _cache_dir
+    _cache_dir = Path(directory) if directory is not None else None
+
+
+def _cache_root() -> Path | None:
+    """Return the cache directory, creating it private to the current user.
+
+    Returns ``None`` when caching is disabled or the directory is a symlink,
+    owned by another user or writable by group or others.
+    """
+    directory = _cache_dir
+    if directory is None:
+        return None
+    usable = _checked_dirs.get(directory)
+    if usable is None:
+        try:
+            directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            info = directory.lstat()
+        except OSError as e:
+            logger.warning("Not caching URL downloads in %s: %s", directory, e)
+            usable = False
+        else:
+            usable = (
+                stat.S_ISDIR(info.st_mode)
+                and (not hasattr(os, "getuid") or info.st_uid == os.getuid())
+                and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+            )
+            if not usable:
+                logger.warning(
+                    "Not caching URL downloads in %s: not private to this user",
+                    directory,
+                )
+        _checked_dirs[directory] = usable
+    return directory if usable else None
+
+
+def _ensure_client() -> tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]:
+    global _loop, _client
+    with _client_lock:
+        if _loop is None or _client is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="gx-http", daemon=True
+            ).start()
+            _client = httpx.AsyncClient(
+                timeout=_TIMEOUT,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=_MAX_CONNECTIONS),
+            )
+            _loop = loop
+        return _loop, _client
+
+
+def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run ``coro`` on the client loop and wait for its result."""
+    loop, _ = _ensure_client()
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def close() -> None:
+    """Close the shared client and stop its event loop."""
+    global _loop, _client
+    with _client_lock:
+        loop, client = _loop, _client
+        _loop = _client = None
+    if loop is None or client is None:
+        return
+    asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+
+
+async def _next_chunk(chunks: AsyncIterator[bytes]) -> bytes | None:
+    try:
+        return await chunks.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+class _Body(io.RawIOBase):
+    """Blocking reader over a streamed response body, copying it to ``sink``."""
+
+    def __init__(self, chunks: AsyncIterator[bytes], sink: BinaryIO | None) -> None:
+        self._chunks = chunks
+        self._sink = sink
+        self._pending = b""
+        self.complete = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        while not self._pending and not self.complete:
+            chunk = _run(_next_chunk(self._chunks))
+            if chunk is None:
+                self.complete = True
+            else:
+                self._pending = chunk
+                if self._sink is not None:
+                    self._sink.write(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+@dataclass
+class Download:
+    """An open URL body and the cache version it belongs to."""
+
+    stream: io.BufferedReader
+    # Identifies the body when the server sent validators, else None
+    version: Optional[str]
+    not_modified: bool
+
+
+def _key(url: str) -> str:
+    return hashlib.sha256(url.encode()).hexdigest()[:32]
+
+
+def _read_meta(key: str) -> dict | None:
+    cache_dir = _cache_root()
+    if cache_dir is None:
+        return None
+    try:
+        return json.loads((cache_dir / f"{key}.json").read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _version(headers: httpx.Headers) -> str | None:
+    validator = headers.get("ETag") or headers.get("Last-Modified")
+    if not validator:
+        return None
+    return hashlib.sha256(validator.encode()).hexdigest()[:16]
+
+
+def _remove_stale(key: str, version: str | None) -> None:
+    """Delete cached bodies and frames of ``key`` other than ``version``."""
+    assert _cache_dir is not None
+    for path in _cache_dir.glob(f"{key}.*"):
+        if path.suffix != ".json" and path.name.split(".")[1] != version:
+            path.unlink(missing_ok=True)
+
+
+def _prune() -> None:
+    """Drop the least recently validated URLs past ``_MAX_CACHED_URLS``."""
+    assert _cache_dir is not None
+    metas = sorted(_cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+    for meta in metas[: max(0, len(metas) - _MAX_CACHED_URLS)]:
+        meta.unlink(missing_ok=True)
+        _remove_stale(meta.stem, None)
+
+
+def _commit(key: str, url: str, headers: httpx.Headers, part: Path) -> None:
+    """Move a completely downloaded body into the cache."""
+    assert _cache_dir is not None
+    version = _version(headers)
+    os.replace(part, _cache_dir / f"{key}.{version}.body")
+    meta = {
+        "url": url,
+        "version": version,
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+    }
+    tmp = _cache_dir / f".{key}.{uuid.uuid4().hex}.json"
+    tmp.write_text(json.dumps(meta))
+    os.replace(tmp, _cache_dir / f"{key}.json")
+    _remove_stale(key, version)
+    _prune()
+
+
+@contextmanager
+def open_url(
+    url: str, limit_bytes: int, conditional: bool = True
+) -> Iterator[Download]:
+    """Open ``url`` for streaming, answering from the cache when unchanged.
+
+    Only bodies that are read to the end are cached, so loads that stop
+    early (``max_rows``) do not populate the cache.
+
+    Raises:
+        ingest.SizeLimitExceeded: If the body is larger than ``limit_bytes``
+        httpx.HTTPStatusError: For error responses
+    """
+    key = _key(url)
+    meta = _read_meta(key) if conditional else None
+    headers = {}
+    if meta is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    _, client = _ensure_client()
+    request = client.build_request("GET", url, headers=headers)
+    resp = _run(client.send(request, stream=True))
+    part: Path | None = None
+    try:
+        if resp.status_code == 304 and meta is not None:
+            assert _cache_dir is not None
+            try:
+                raw = open(_cache_dir / f"{key}.{meta['version']}.body", "rb")
+            except FileNotFoundError:
+                logger.info("Cached body for %s is gone, fetching it again", url)
+            else:
+                os.utime(_cache_dir / f"{key}.json")
+                with raw:
+                    stream = ingest.limited_stream(raw, limit_bytes)
+                    yield Download(stream, meta["version"], True)
+                return
+            with open_url(url, limit_bytes, conditional=False) as download:
+                yield download
+            return
+
+        resp.raise_for_status()
+        size = int(resp.headers.get("Content-Length", 0))
+        if size > limit_bytes:
+            raise ingest.SizeLimitExceeded(limit_bytes)
+        cache_dir = _cache_root()
+        version = _version(resp.headers) if cache_dir is not None else None
+        if version is not None:
+            assert cache_dir is not None
+            part = cache_dir / f".{key}.{uuid.uuid4().hex}.part"
+        with open(part, "wb") if part is not None else nullcontext() as sink:
+            body = _Body(resp.aiter_bytes(), sink)
+            # _Body never returns None from read(), as it blocks for data
+            stream = ingest.limited_stream(cast(BinaryIO, body), limit_bytes)
+            yield Download(stream, version, False)
+        if part is not None and body.complete:
+            _commit(key, url, resp.headers, part)
+            part = None
+    finally:
+        if part is not None:
+            part.unlink(missing_ok=True)
+        _run(resp.aclose())
+
+
+def _frame_path(url: str, version: str, options: dict) -> Path | None:
+    cache_dir = _cache_root()
+    if cache_dir is None:
+        return None
+    digest = hashlib.sha256(
+        json.dumps(options, sort_keys=True, default=str).encode()
+    ).hexdigest()[:16]
+    return cache_dir / f"{_key(url)}.{version}.{digest}.arrow"
+
+
+def load_frame(url: str, version: str, options: dict) -> pd.DataFrame | None:
+    """Return the frame cached for this body version and read options."""
+    path = _frame_path(url, version, options)
+    if path is None:
+        return None
+    try:
+        blob = path.read_bytes()
+        # Frames are pruned least recently used first
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    return arrow_codec.decode_dataframe(blob)
+
+
+def store_frame(url: str, version: str, options: dict, df: pd.DataFrame) -> None:
+    """Cache the frame parsed from this body version with ``options``."""
+    path = _frame_path(url, version, options)
+    if path is None or not path.with_name(f"{_key(url)}.json").exists():
+        return
+    try:
+        blob = arrow_codec.encode_dataframe(df)
+    except Exception as e:  # not every frame converts to Arrow
+        logger.debug("Not caching parsed frame for %s: %s", url, e)
+        return
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+    tmp.write_bytes(blob)
+    os.replace(tmp, path)
+    frames = sorted(
+        path.parent.glob(f"{_key(url)}.{version}.*.arrow"),
+        key=lambda p: p.stat().st_mtime,
+    )
+    for stale in frames[: max(0, len(frames) - _MAX_FRAMES_PER_URL)]:
+        stale.unlink(missing_ok=True)
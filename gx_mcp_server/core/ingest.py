@@ -0,0 +1,909 @@
+"""Ingest of CSV, Parquet, Arrow IPC/Feather and JSON Lines sources.
+
+Text sources are parsed straight from a byte stream: the pandas C parser
+pulls fixed-size blocks from the stream as it goes, so neither the raw bytes
+nor a decoded copy of the whole input is ever held in memory. Size limits are
+enforced while reading, before an oversized body has been downloaded.
+Parquet and Arrow files are read through Arrow, keeping their dtypes; local
+files are memory-mapped so only the projected columns and the row groups
+that survive ``filters`` are read. Text sources are filtered chunk by chunk
+as they are parsed, so rows that are filtered out are never accumulated.
+Multi-file sources (globs, directories) are parsed in parallel with Arrow's
+readers and concatenated into one frame.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import io
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Literal, Optional, Sequence
+from urllib.parse import urlparse
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
+import pyarrow.json as pajson
+import pyarrow.parquet as pq
+
+from gx_mcp_server.core import predicates, sampling
+from gx_mcp_server.core.schema import SampleOptions
+
+SourceFormat = Literal["csv", "parquet", "arrow", "jsonl"]
+CsvEngine = Literal["pandas", "pyarrow"]
+
+_BLOCK_SIZE = 1 << 20
+_NO_LIMIT = 1 << 62
+_CHUNK_ROWS = 100_000
+_PARQUET_ROWS_PER_BATCH = 65_536
+# The default ``na_values`` of ``pandas.read_csv``
+_CSV_NULL_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+_EXTENSIONS: dict[str, SourceFormat] = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".ipc": "arrow",
+    ".feather": "arrow",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+_FORMAT_ALIASES: dict[str, SourceFormat] = {"feather": "arrow", "json": "jsonl"}
+_MAGIC: list[tuple[bytes, SourceFormat]] = [
+    (b"PAR1", "parquet"),
+    (b"ARROW1", "arrow"),
+    (b"FEA1", "arrow"),  # Feather v1
+    (b"\xff\xff\xff\xff", "arrow"),  # Arrow IPC stream
+]
+
+
+Compression = Literal["gzip", "bz2", "zstd"]
+
+_COMPRESSION_EXTENSIONS: dict[str, Compression] = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+_COMPRESSION_MAGIC: list[tuple[bytes, Compression]] = [
+    (b"\x1f\x8b", "gzip"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+]
+
+
+class SizeLimitExceeded(ValueError):
+    """Raised when a stream yields more bytes than allowed."""
+
+    def __init__(self, limit_bytes: int) -> None:
+        super().__init__(f"Stream exceeds {limit_bytes} bytes")
+        self.limit_bytes = limit_bytes
+
+
+class DecompressedSizeLimitExceeded(SizeLimitExceeded):
+    """Raised when a compressed stream inflates past its limit."""
+
+
+class ByteBudget:
+    """A byte allowance shared by several readers, possibly on other threads."""
+
+    def __init__(self, limit_bytes: int) -> None:
+        self.limit_bytes = limit_bytes
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def consume(self, size: int) -> bool:
+        """Charge ``size`` bytes and return whether the budget still holds."""
+        with self._lock:
+            self._used += size
+            return self._used <= self.limit_bytes
+
+
+class LimitedReader(io.RawIOBase):
+    """Read-only view of ``raw`` that fails once ``limit_bytes`` are exceeded.
+
+    With a ``budget``, bytes are also charged to it and reading fails once
+    the budget is spent, whichever limit comes first.
+    """
+
+    def __init__(
+        self,
+        raw: BinaryIO,
+        limit_bytes: int,
+        error: type[SizeLimitExceeded] = SizeLimitExceeded,
+        budget: Optional[ByteBudget] = None,
+    ) -> None:
+        self._raw = raw
+        self._limit = limit_bytes
+        self._error = error
+        self._budget = budget
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        data = self._raw.read(len(buffer))
+        if not data:
+            return 0
+        self.bytes_read += len(data)
+        if self.bytes_read > self._limit:
+            raise self._error(self._limit)
+        if self._budget is not None and not self._budget.consume(len(data)):
+            raise self._error(self._budget.limit_bytes)
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def limited_stream(
+    raw: BinaryIO,
+    limit_bytes: int,
+    error: type[SizeLimitExceeded] = SizeLimitExceeded,
+    budget: Optional[ByteBudget] = None,
+) -> io.BufferedReader:
+    """Wrap ``raw`` in a buffered reader enforcing ``limit_bytes``."""
+    reader = LimitedReader(raw, limit_bytes, error, budget)
+    return io.BufferedReader(reader, _BLOCK_SIZE)
+
+
+def detect_compression(name: Optional[str], head: bytes = b"") -> Compression | None:
+    """Detect gzip, bz2 or zstd compression from a name or URL, then magic bytes."""
+    if name:
+        suffix = _path_of(name).suffix.lower()
+        if suffix in _COMPRESSION_EXTENSIONS:
+            return _COMPRESSION_EXTENSIONS[suffix]
+    for magic, compression in _COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return compression
+    if head.startswith(b"BZh") and head[3:4].isdigit():
+        return "bz2"
+    return None
+
+
+def decompressed_stream(
+    raw: BinaryIO,
+    compression: Compression,
+    limit_bytes: int,
+    budget: Optional[ByteBudget] = None,
+) -> io.BufferedReader:
+    """Decompress ``raw`` while it is read, failing past ``limit_bytes`` out.
+
+    Raises:
+        DecompressedSizeLimitExceeded: Once more than ``limit_bytes`` have
+            been decompressed, or ``budget`` is spent
+    """
+    stream = pa.CompressedInputStream(pa.PythonFile(raw, mode="r"), compression)
+    return limited_stream(stream, limit_bytes, DecompressedSizeLimitExceeded, budget)
+
+
+def maybe_decompress(
+    stream: io.BufferedReader, name: Optional[str], limit_bytes: int
+) -> io.BufferedReader:
+    """Return ``stream`` decompressed when its name or first bytes call for it."""
+    compression = detect_compression(name, stream.peek(4)[:4])
+    if compression is None:
+        return stream
+    return decompressed_stream(stream, compression, limit_bytes)
+
+
+def file_compression(path: str | Path) -> Compression | None:
+    """Return the compression of a local file."""
+    with open(path, "rb") as f:
+        return detect_compression(str(path), f.read(4))
+
+
+def read_csv(
+    raw: BinaryIO, limit_bytes: int, max_rows: Optional[int] = None
+) -> pd.DataFrame:
+    """Parse CSV from a binary stream, reading at most ``limit_bytes``.
+
+    Args:
+        raw: Binary stream such as an HTTP response body or an open file
+        limit_bytes: Maximum number of bytes to read from ``raw``
+        max_rows: Stop after this many rows; the rest is never read
+
+    Raises:
+        SizeLimitExceeded: If the stream holds more than ``limit_bytes``
+    """
+    return pd.read_csv(limited_stream(raw, limit_bytes), nrows=max_rows)
+
+
+def normalize_format(fmt: str) -> SourceFormat | Literal["auto"]:
+    """Map user-facing format names (``feather``, ``json``...) to readers."""
+    fmt = _FORMAT_ALIASES.get(fmt.lower(), fmt.lower())  # type: ignore[assignment]
+    if fmt != "auto" and fmt not in _EXTENSIONS.values():
+        raise ValueError(f"Unsupported source format: {fmt}")
+    return fmt  # type: ignore[return-value]
+
+
+def _path_of(name: str) -> Path:
+    return Path(urlparse(name).path if "://" in name else name)
+
+
+def _data_suffix(name: str) -> str:
+    """Return the data extension of ``name``, looking past ``.gz`` and co."""
+    path = _path_of(name)
+    if path.suffix.lower() in _COMPRESSION_EXTENSIONS:
+        path = path.with_suffix("")
+    return path.suffix.lower()
+
+
+def has_known_extension(name: str) -> bool:
+    """Return whether ``name`` ends in a (possibly compressed) data extension."""
+    return _data_suffix(name) in _EXTENSIONS
+
+
+def detect_format(name: Optional[str], head: bytes = b"") -> SourceFormat:
+    """Detect a source format from a file name or URL, then magic bytes.
+
+    ``head`` holds the first (decompressed) bytes of the data.
+    """
+    if name:
+        suffix = _data_suffix(name)
+        if suffix in _EXTENSIONS:
+            return _EXTENSIONS[suffix]
+    for magic, fmt in _MAGIC:
+        if head.startswith(magic):
+            return fmt
+    return "jsonl" if head.lstrip().startswith(b"{") else "csv"
+
+
+def decode_inline(source: str, fmt: SourceFormat | Literal["auto"]) -> bytes | None:
+    """Return the bytes of a base64 inline source, or ``None`` for text.
+
+    With ``fmt="auto"`` the source is treated as base64 only when its decoded
+    prefix carries Parquet or Arrow magic bytes.
+    """
+    if fmt in ("csv", "jsonl"):
+        return None
+    if fmt == "auto":
+        try:
+            head = base64.b64decode(source[:16])
+        except (binascii.Error, ValueError):
+            return None
+        if not any(head.startswith(magic) for magic, _ in _MAGIC):
+            return None
+    try:
+        return base64.b64decode(source, validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError("Inline Parquet/Arrow sources must be base64") from None
+
+
+def _parquet(
+    source: Any,
+    max_rows: Optional[int],
+    columns: Optional[Sequence[str]],
+    filters: Optional[list],
+) -> pa.Table:
+    cols = list(columns) if columns is not None else None
+    if max_rows is None or filters is not None:
+        expression = None
+        dnf = predicates.normalize(filters)
+        if dnf is not None:
+            schema = pq.read_schema(source, memory_map=True)
+            expression = predicates.to_arrow(dnf, schema)
+        # Row groups whose statistics rule out ``filters`` are skipped
+        table = pq.read_table(source, columns=cols, filters=expression, memory_map=True)
+        return table if max_rows is None else table.slice(0, max_rows)
+    # Only decode the row groups needed for the first ``max_rows`` rows
+    batches = []
+    remaining = max_rows
+    parquet_file = pq.ParquetFile(source, memory_map=True)
+    for batch in parquet_file.iter_batches(
+        batch_size=min(max_rows, _PARQUET_ROWS_PER_BATCH) or 1, columns=cols
+    ):
+        batches.append(batch.slice(0, remaining))
+        remaining -= len(batches[-1])
+        if remaining <= 0:
+            break
+    if not batches:
+        empty = parquet_file.schema_arrow.empty_table()
+        return empty if cols is None else empty.select(cols)
+    return pa.Table.from_batches(batches)
+
+
+def _arrow(source: Any) -> pa.Table:
+    if isinstance(source, (str, Path)):
+        with pa.memory_map(str(source)) as mm:
+            head = mm.read(6)
+        source = str(source)
+    else:
+        head = bytes(memoryview(source)[:6])
+        source = pa.BufferReader(source)
+    if head.startswith(b"\xff\xff\xff\xff"):
+        return pa.ipc.open_stream(source).read_all()
+    # Feather v1 and v2 (the Arrow IPC file format)
+    return feather.read_table(source, memory_map=True)
+
+
+def _to_pandas(
+    table: pa.Table, dtypes: Optional[dict], dtype_backend: Optional[str]
+) -> pd.DataFrame:
+    if dtype_backend == "pyarrow":
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    else:
+        df = table.to_pandas()
+        if dtype_backend == "numpy_nullable":
+            df = df.convert_dtypes()
+    if not dtypes:
+        return df
+    # astype(str) spells nulls "nan"; read_csv(dtype=str) keeps them missing
+    nulls = {
+        column: df[column].isna()
+        for column, dtype in dtypes.items()
+        if column in df and _is_str_dtype(dtype)
+    }
+    df = df.astype(dtypes)
+    for column, mask in nulls.items():
+        if mask.any():
+            df[column] = df[column].mask(mask)
+    return df
+
+
+def _is_str_dtype(dtype: Any) -> bool:
+    try:
+        return pd.api.types.pandas_dtype(dtype).kind in "SU"
+    except TypeError:
+        return False
+
+
+def read_frame(
+    source: str | Path | bytes | BinaryIO,
+    fmt: SourceFormat,
+    max_rows: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[list] = None,
+    dtypes: Optional[dict[str, str]] = None,
+    dtype_backend: Optional[Literal["numpy_nullable", "pyarrow"]] = None,
+    sample: Optional[SampleOptions] = None,
+    engine: CsvEngine = "pandas",
+) -> pd.DataFrame:
+    """Read a file path, bytes or binary stream in ``fmt`` into pandas.
+
+    Args:
+        source: Local path, in-memory bytes or a (size-limited) stream
+        fmt: Source format
+        max_rows: Maximum rows to read
+        columns: Only read these columns
+        filters: Row filters in DNF, e.g.
+            ``[["year", ">=", 2020], ["country", "in", ["DE", "FR"]]]``;
+            ``max_rows`` then counts matching rows
+        dtypes: Column dtypes; CSV and JSON Lines columns listed here skip
+            type inference
+        dtype_backend: Read into pandas nullable or Arrow-backed dtypes
+        sample: Sample rows in one pass over chunks of the source instead
+            of reading it whole; ``max_rows`` then caps the rows scanned
+        engine: CSV parser; "pyarrow" uses Arrow's multithreaded reader and
+            Arrow-backed dtypes unless ``dtype_backend`` says otherwise
+
+    Raises:
+        ValueError: If a filter compares a column with an incompatible value
+    """
+    if sample is not None:
+        chunks = iter_frames(
+            source, fmt, max_rows, columns, filters, dtypes, dtype_backend
+        )
+        return sampling.sample(chunks, sample)
+    backend: dict[str, Any] = {}
+    if dtype_backend is not None:
+        backend["dtype_backend"] = dtype_backend
+    if fmt in ("csv", "jsonl"):
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        if fmt == "csv" and engine == "pyarrow":
+            table = _arrow_csv(source, max_rows, columns, filters, dtypes)
+            return _to_pandas(table, dtypes, dtype_backend or "pyarrow")
+        if filters:
+            frames = list(
+                iter_frames(
+                    source, fmt, max_rows, columns, filters, dtypes, dtype_backend
+                )
+            )
+            if not frames:
+                return pd.DataFrame(columns=list(columns or []))
+            return pd.concat(frames, ignore_index=True)
+        if fmt == "csv":
+            return pd.read_csv(
+                source, nrows=max_rows, usecols=columns, dtype=dtypes, **backend
+            )
+        df = pd.read_json(source, lines=True, nrows=max_rows, dtype=dtypes, **backend)
+        return df if columns is None else df[list(columns)]
+
+    if not isinstance(source, (str, Path, bytes)):
+        source = source.read()  # Parquet and Arrow need random access
+    table = _columnar_table(source, fmt, max_rows, columns, filters)
+    return _to_pandas(table, dtypes, dtype_backend)
+
+
+def _read_columns(
+    columns: Optional[Sequence[str]], filters: Optional[list]
+) -> Optional[list[str]]:
+    """Return ``columns`` plus the columns ``filters`` needs, if projecting."""
+    if columns is None:
+        return None
+    read = list(columns)
+    return read + [c for c in predicates.columns(filters) if c not in read]
+
+
+class _Prefixed(io.RawIOBase):
+    """``raw`` with ``head``, already read from it, put back in front."""
+
+    def __init__(self, head: bytes, raw: BinaryIO) -> None:
+        self._head = memoryview(head)
+        self._raw = raw
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        if self._head:
+            size = min(len(buffer), len(self._head))
+            buffer[:size] = self._head[:size]
+            self._head = self._head[size:]
+            return size
+        data = self._raw.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+class _Recorded(io.RawIOBase):
+    """``raw`` keeping a copy of the bytes read, so they can be read again."""
+
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+        self._data = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        data = self._raw.read(len(buffer))
+        buffer[: len(data)] = data
+        self._data += data
+        return len(data)
+
+    def replay(self) -> io.BufferedReader:
+        """Return the source from its start: the bytes read, then the rest."""
+        return io.BufferedReader(_Prefixed(bytes(self._data), self._raw), _BLOCK_SIZE)
+
+
+def _csv_head(source: Any) -> tuple[bytes, Any]:
+    """Return the lines of the first block of a CSV path or stream.
+
+    Arrow infers column types from this block. Streams are returned with the
+    block put back, so the source is still read only once.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            head = f.read(_BLOCK_SIZE)
+    else:
+        head = source.read(_BLOCK_SIZE)
+        source = io.BufferedReader(_Prefixed(head, source), _BLOCK_SIZE)
+    if len(head) == _BLOCK_SIZE:
+        head = head[: head.rfind(b"\n") + 1]
+    return head, source
+
+
+def _arrow_types(dtypes: Optional[dict[str, str]]) -> dict[str, pa.DataType]:
+    """Return the Arrow types to parse the ``dtypes`` columns as.
+
+    Text dtypes (``str``, ``object``, ``string``, ``category``) become
+    strings, so values such as ``00123`` keep their leading zeros. Dtypes
+    without an Arrow equivalent are left to inference and the final cast.
+    """
+    types: dict[str, pa.DataType] = {}
+    for column, dtype in (dtypes or {}).items():
+        try:
+            resolved = pd.api.types.pandas_dtype(dtype)
+        except TypeError:
+            continue
+        if isinstance(resolved, pd.ArrowDtype):
+            types[column] = resolved.pyarrow_dtype
+        elif resolved.kind in "OSU":
+            types[column] = pa.string()
+        else:
+            try:
+                types[column] = pa.from_numpy_dtype(
+                    getattr(resolved, "numpy_dtype", resolved)
+                )
+            except (pa.ArrowNotImplementedError, TypeError):
+                continue
+    return types
+
+
+def _csv_convert_options(
+    head: bytes,
+    columns: Optional[Sequence[str]],
+    filters: Optional[list],
+    dtypes: Optional[dict[str, str]] = None,
+) -> pacsv.ConvertOptions:
+    """Return Arrow CSV options that read like ``pandas.read_csv`` does.
+
+    Empty fields and pandas' default NA markers are nulls, columns listed in
+    ``dtypes`` are parsed as those types without inference, and columns that
+    Arrow would infer from ``head`` as dates or times stay strings.
+    """
+    options = pacsv.ConvertOptions(
+        column_types=_arrow_types(dtypes),
+        include_columns=_read_columns(columns, filters),
+        null_values=_CSV_NULL_VALUES,
+        strings_can_be_null=True,
+        quoted_strings_can_be_null=True,
+    )
+    if head.strip():
+        with pacsv.open_csv(pa.BufferReader(head), convert_options=options) as reader:
+            options.column_types = {
+                **{
+                    field.name: pa.string()
+                    for field in reader.schema
+                    if pa.types.is_temporal(field.type)
+                },
+                **_arrow_types(dtypes),
+            }
+    return options
+
+
+def _filter_table(
+    table: pa.Table, filters: Optional[list], columns: Optional[Sequence[str]]
+) -> pa.Table:
+    dnf = predicates.normalize(filters)
+    if dnf is not None:
+        table = table.filter(predicates.to_arrow(dnf, table.schema))
+    return table if columns is None else table.select(list(columns))
+
+
+def _arrow_csv(
+    source: Any,
+    max_rows: Optional[int],
+    columns: Optional[Sequence[str]],
+    filters: Optional[list] = None,
+    dtypes: Optional[dict[str, str]] = None,
+) -> pa.Table:
+    """Parse CSV with Arrow's reader, using all cores when reading it whole.
+
+    Values are typed as :func:`_csv_convert_options` describes. With
+    ``max_rows`` the file is streamed and types are fixed by the first
+    block; if a later value does not fit them, the source is read again
+    whole so types are unified over all blocks.
+    """
+    if isinstance(source, Path):
+        source = str(source)
+    head, source = _csv_head(source)
+    options = _csv_convert_options(head, columns, filters, dtypes)
+    read_options = pacsv.ReadOptions(block_size=_BLOCK_SIZE)
+    if max_rows is None:
+        table = pacsv.read_csv(
+            source, read_options=read_options, convert_options=options
+        )
+        return _filter_table(table, filters, columns)
+    # Stop after the blocks holding the first ``max_rows`` matching rows
+    recorded = None if isinstance(source, str) else _Recorded(source)
+    tables = []
+    rows = 0
+    try:
+        with pacsv.open_csv(
+            source if recorded is None else io.BufferedReader(recorded, _BLOCK_SIZE),
+            read_options=read_options,
+            convert_options=options,
+        ) as reader:
+            tables.append(_filter_table(reader.schema.empty_table(), filters, columns))
+            for batch in reader:
+                table = pa.Table.from_batches([batch])
+                tables.append(_filter_table(table, filters, columns))
+                rows += tables[-1].num_rows
+                if rows >= max_rows:
+                    break
+    except pa.ArrowInvalid:
+        # A value after the first block does not fit the types it fixed
+        table = pacsv.read_csv(
+            source if recorded is None else recorded.replay(),
+            read_options=read_options,
+            convert_options=options,
+        )
+        return _filter_table(table, filters, columns).slice(0, max_rows)
+    return pa.concat_tables(tables).slice(0, max_rows)
+
+
+def _columnar_table(
+    source: Any,
+    fmt: SourceFormat,
+    max_rows: Optional[int],
+    columns: Optional[Sequence[str]],
+    filters: Optional[list],
+) -> pa.Table:
+    """Read a Parquet or Arrow path or bytes into an Arrow table."""
+    if fmt == "parquet":
+        if isinstance(source, bytes):
+            source = pa.BufferReader(source)
+        return _parquet(source, max_rows, columns, filters)
+    table = _filter_table(_arrow(source), filters, columns)
+    if max_rows is not None:
+        table = table.slice(0, max_rows)
+    return table
+
+
+def _columnar_batches(
+    source: Any,
+    fmt: SourceFormat,
+    columns: Optional[Sequence[str]],
+    filters: Optional[list],
+    chunk_rows: int,
+) -> Iterator[pa.Table]:
+    """Yield a Parquet or Arrow path or bytes as tables of ``chunk_rows``."""
+    if fmt == "parquet":
+        read = _read_columns(columns, filters)
+        if isinstance(source, bytes):
+            source = pa.BufferReader(source)
+        parquet_file = pq.ParquetFile(source, memory_map=True)
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=read):
+            yield _filter_table(pa.Table.from_batches([batch]), filters, columns)
+        return
+    table = _columnar_table(source, fmt, None, columns, filters)
+    for batch in table.to_batches(max_chunksize=chunk_rows):
+        yield pa.Table.from_batches([batch])
+
+
+def _limit_rows(
+    frames: Iterator[pd.DataFrame], max_rows: Optional[int]
+) -> Iterator[pd.DataFrame]:
+    remaining = max_rows
+    for frame in frames:
+        if remaining is not None:
+            if remaining <= 0:
+                return
+            frame = frame.iloc[:remaining]
+            remaining -= len(frame)
+        yield frame
+
+
+def _filter_frames(
+    frames: Iterator[pd.DataFrame],
+    columns: Optional[Sequence[str]],
+    filters: Optional[list],
+) -> Iterator[pd.DataFrame]:
+    """Drop the rows of each frame not matching ``filters``, then project.
+
+    Chunks left empty are skipped; one is kept if nothing matches so the
+    result still has the source columns.
+    """
+    dnf = predicates.normalize(filters)
+    empty: Optional[pd.DataFrame] = None
+    matched = False
+    for frame in frames:
+        if dnf is not None:
+            frame = frame[predicates.mask(frame, dnf)]
+        if columns is not None:
+            frame = frame[list(columns)]
+        if dnf is None or len(frame):
+            matched = True
+            yield frame
+        elif empty is None:
+            empty = frame
+    if not matched and empty is not None:
+        yield empty
+
+
+def iter_frames(
+    source: str | Path | bytes | BinaryIO,
+    fmt: SourceFormat,
+    max_rows: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[list] = None,
+    dtypes: Optional[dict[str, str]] = None,
+    dtype_backend: Optional[Literal["numpy_nullable", "pyarrow"]] = None,
+    chunk_rows: int = _CHUNK_ROWS,
+) -> Iterator[pd.DataFrame]:
+    """Yield ``source`` as DataFrames of up to ``chunk_rows`` rows.
+
+    Text is parsed chunk by chunk from the stream and Parquet one batch at a
+    time, so only the current chunk is held in memory; ``filters`` are
+    applied to each chunk as it is read. Arguments are as for
+    :func:`read_frame`.
+    """
+    backend: dict[str, Any] = {}
+    if dtype_backend is not None:
+        backend["dtype_backend"] = dtype_backend
+    if fmt in ("csv", "jsonl"):
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        # With filters, ``max_rows`` counts matching rows rather than lines
+        nrows = None if filters else max_rows
+        if fmt == "csv":
+            reader = pd.read_csv(
+                source,
+                nrows=nrows,
+                usecols=_read_columns(columns, filters),
+                dtype=dtypes,
+                chunksize=chunk_rows,
+                **backend,
+            )
+        else:
+            reader = pd.read_json(
+                source,
+                lines=True,
+                nrows=nrows,
+                dtype=dtypes,
+                chunksize=chunk_rows,
+                **backend,
+            )
+        with reader:
+            frames = _filter_frames(iter(reader), columns, filters)
+            yield from _limit_rows(frames, max_rows if filters else None)
+        return
+
+    if not isinstance(source, (str, Path, bytes)):
+        source = source.read()  # Parquet and Arrow need random access
+    tables = _columnar_batches(source, fmt, columns, filters, chunk_rows)
+    frames = (_to_pandas(table, dtypes, dtype_backend) for table in tables)
+    yield from _limit_rows(frames, max_rows)
+
+
+def detect_file_format(path: str | Path) -> SourceFormat:
+    """Detect the format of a local file from its name, then its first bytes."""
+    with open(path, "rb") as f:
+        head = f.read(8)
+        compression = detect_compression(str(path), head)
+        if compression is not None:
+            f.seek(0)
+            stream = pa.CompressedInputStream(pa.PythonFile(f, mode="r"), compression)
+            head = stream.read(8)
+    return detect_format(str(path), head)
+
+
+def read_table(
+    path: str | Path,
+    fmt: SourceFormat,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[list] = None,
+    dtypes: Optional[dict[str, str]] = None,
+    limit_bytes: Optional[int] = None,
+    budget: Optional[ByteBudget] = None,
+) -> pa.Table:
+    """Read one local file into an Arrow table using Arrow's own readers.
+
+    CSV columns listed in ``dtypes`` are parsed as those types rather than
+    inferred. Compressed files are decompressed as they
+    are parsed; ``limit_bytes`` caps their decompressed size, and ``budget``
+    the size of several files.
+    """
+    compression = file_compression(path)
+
+    @contextmanager
+    def source() -> Iterator[Any]:
+        if compression is None:
+            yield str(path)
+            return
+        with open(path, "rb") as raw:
+            yield decompressed_stream(
+                raw, compression, limit_bytes or _NO_LIMIT, budget
+            )
+
+    with source() as data:
+        if fmt == "csv":
+            return _arrow_csv(data, None, columns, filters, dtypes)
+        if fmt == "jsonl":
+            return _filter_table(pajson.read_json(data), filters, columns)
+        if compression is not None:
+            data = data.read()  # Parquet and Arrow need random access
+        return _columnar_table(data, fmt, None, columns, filters)
+
+
+def _iter_files(
+    paths: Sequence[str | Path],
+    fmt: SourceFormat | Literal["auto"],
+    columns: Optional[Sequence[str]],
+    filters: Optional[list],
+    dtypes: Optional[dict[str, str]],
+    dtype_backend: Optional[Literal["numpy_nullable", "pyarrow"]],
+    budget: Optional[ByteBudget],
+) -> Iterator[pd.DataFrame]:
+    for path in paths:
+        file_fmt = detect_file_format(path) if fmt == "auto" else fmt
+        options = (file_fmt, None, columns, filters, dtypes, dtype_backend)
+        compression = file_compression(path)
+        if compression is None:
+            yield from iter_frames(str(path), *options)
+            continue
+        with open(path, "rb") as raw:
+            stream = decompressed_stream(raw, compression, _NO_LIMIT, budget)
+            yield from iter_frames(stream, *options)
+
+
+def read_files(
+    paths: Sequence[str | Path],
+    fmt: SourceFormat | Literal["auto"] = "auto",
+    max_rows: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[list] = None,
+    dtypes: Optional[dict[str, str]] = None,
+    dtype_backend: Optional[Literal["numpy_nullable", "pyarrow"]] = None,
+    max_workers: Optional[int] = None,
+    limit_bytes: Optional[int] = None,
+    sample: Optional[SampleOptions] = None,
+) -> pd.DataFrame:
+    """Read several local files in parallel into one DataFrame.
+
+    Each file is parsed to an Arrow table on a thread pool (Arrow's readers
+    release the GIL), the tables are concatenated without copying their
+    buffers and converted to pandas once. Column types are unified across
+    files, e.g. an integer column that is all null in one partition.
+
+    Args:
+        paths: Files to read, in output order
+        fmt: Source format, or "auto" to detect it per file
+        max_workers: Parser threads (default: one per CPU)
+        limit_bytes: Maximum decompressed size of all compressed files together
+        sample: Sample rows in one pass over the files, read one after
+            another in chunks rather than in parallel
+        Other arguments as for :func:`read_frame`
+    """
+    # One allowance for all files, however the reads are spread over threads
+    budget = ByteBudget(limit_bytes) if limit_bytes is not None else None
+    if sample is not None:
+        return sampling.sample(
+            _limit_rows(
+                _iter_files(
+                    paths, fmt, columns, filters, dtypes, dtype_backend, budget
+                ),
+                max_rows,
+            ),
+            sample,
+        )
+
+    def read(path: str | Path) -> pa.Table:
+        file_fmt = detect_file_format(path) if fmt == "auto" else fmt
+        return read_table(path, file_fmt, columns, filters, dtypes, budget=budget)
+
+    workers = min(len(paths), max_workers or os.cpu_count() or 1) or 1
+    with ThreadPoolExecutor(workers, thread_name_prefix="gx-ingest") as pool:
+        if max_rows is None:
+            tables = list(pool.map(read, paths))
+        else:
+            # Keep only ``workers`` files in flight and stop queueing more
+            # once the files read so far hold ``max_rows`` rows
+            tables = []
+            rows = 0
+            queue = iter(paths)
+            pending: deque[Future[pa.Table]] = deque(
+                pool.submit(read, path) for _, path in zip(range(workers), queue)
+            )
+            while pending and rows < max_rows:
+                tables.append(pending.popleft().result())
+                rows += tables[-1].num_rows
+                path = next(queue, None)
+                if path is not None and rows < max_rows:
+                    pending.append(pool.submit(read, path))
+            for future in pending:
+                future.cancel()
+    table = pa.concat_tables(tables, promote_options="permissive")
+    if max_rows is not None:
+        table = table.slice(0, max_rows)
+    return _to_pandas(table, dtypes, dtype_backend)
@@ -0,0 +1,101 @@
+"""Run blocking tools off the event loop, on one bounded pool per tool.
+
+FastMCP calls synchronous tools on the event loop, so a long parse or
+validation would stall every other request on the STDIO loop or HTTP
+worker, including ``ping`` and result polling. :func:`offload` wraps such a
+tool in a coroutine that runs it on a thread pool of its own. The pool size
+is the tool's concurrency limit: further calls queue without holding a
+thread or the loop, and a call cancelled while queued never runs.
+
+Limits are read from ``MCP_<TOOL>_CONCURRENCY`` (e.g.
+``MCP_LOAD_DATASET_CONCURRENCY``) when a tool's pool is first used.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, TypeVar
+
+from gx_mcp_server.logging import logger
+
+T = TypeVar("T")
+
+# Parsing and validation hold whole frames in memory, so keep them low
+DEFAULT_CONCURRENCY = {
+    "load_dataset": 2,
+    "run_checkpoint": 2,
+    # Suite updates are serialized by a lock anyway
+    "add_expectation": 1,
+}
+_MAX_CONCURRENCY = 64
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_tool_concurrency(tool: str) -> int:
+    """
+    Get the number of concurrent calls allowed for ``tool`` from the
+    environment, defaulting to ``DEFAULT_CONCURRENCY`` (else 1).
+    Limits to range [1, 64].
+    """
+    default = DEFAULT_CONCURRENCY.get(tool, 1)
+    value = os.getenv(f"MCP_{tool.upper()}_CONCURRENCY")
+    try:
+        limit = int(value) if value else default
+        if limit < 1 or limit > _MAX_CONCURRENCY:
+            limit = default
+    except Exception:
+        limit = default
+    return limit
+
+
+def _get_executor(tool: str) -> ThreadPoolExecutor:
+    with _executors_lock:
+        executor = _executors.get(tool)
+        if executor is None:
+            limit = get_tool_concurrency(tool)
+            logger.debug("Running %s on up to %d threads", tool, limit)
+            executor = ThreadPoolExecutor(
+                max_workers=limit, thread_name_prefix=f"gx-{tool}"
+            )
+            _executors[tool] = executor
+        return executor
+
+
+async def run_blocking(
+    tool: str, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Run ``func`` on the pool of ``tool`` and wait for it without blocking."""
+    loop = asyncio.get_running_loop()
+    # Keep logging and tracing context, as ``asyncio.to_thread`` does
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(_get_executor(tool), call)
+
+
+def offload(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """Return an async tool running ``func`` via :func:`run_blocking`.
+
+    The wrapper keeps the name, docstring and signature of ``func``, so the
+    tool schema FastMCP derives from it is unchanged.
+    """
+
+    @functools.wraps(func)
+    async def tool(*args: Any, **kwargs: Any) -> T:
+        return await run_blocking(func.__name__, func, *args, **kwargs)
+
+    return tool
+
+
+def shutdown(wait: bool = True) -> None:
+    """Shut down the tool pools; they are recreated, with fresh limits, on use."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,200 @@
+"""Native Polars evaluation for common expectations.
+
+Suites made only of supported expectations are evaluated directly on a
+Polars frame, producing results shaped like GX's ``to_json_dict()`` output
+with the BASIC result format. :func:`validate` returns ``None`` for anything
+else (unsupported expectations or arguments, missing columns, type errors)
+so the caller can fall back to pandas and GX.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+import great_expectations as gx
+import polars as pl
+
+_PARTIAL_UNEXPECTED_LIMIT = 20
+
+# Supported expectation types and the kwargs each accepts
+_SUPPORTED: dict[str, set[str]] = {
+    "expect_column_to_exist": {"column"},
+    "expect_column_values_to_not_be_null": {"column", "mostly"},
+    "expect_column_values_to_be_null": {"column", "mostly"},
+    "expect_column_values_to_be_in_set": {"column", "value_set", "mostly"},
+    "expect_column_values_to_be_between": {
+        "column",
+        "min_value",
+        "max_value",
+        "strict_min",
+        "strict_max",
+        "mostly",
+    },
+    "expect_column_values_to_be_unique": {"column", "mostly"},
+    "expect_table_row_count_to_be_between": {"min_value", "max_value"},
+    "expect_table_column_count_to_equal": {"value"},
+}
+
+
+def _supported(config: dict, df: pl.DataFrame) -> bool:
+    kwargs = config["kwargs"]
+    allowed = _SUPPORTED.get(config["type"])
+    if allowed is None or not set(kwargs) <= allowed:
+        return False
+    # Suite parameters ({"$PARAMETER": ...}) are resolved by GX only
+    if any(isinstance(v, dict) for v in kwargs.values()):
+        return False
+    if config["type"] == "expect_column_to_exist":
+        return True
+    return "column" not in kwargs or kwargs["column"] in df.columns
+
+
+def _percent(part: int, whole: int) -> Optional[float]:
+    return 100.0 * part / whole if whole else None
+
+
+def _passes(unexpected: int, total: int, mostly: Optional[float]) -> bool:
+    if total == 0:
+        return True
+    return (total - unexpected) / total >= (1.0 if mostly is None else mostly)
+
+
+def _null_result(df: pl.DataFrame, kwargs: dict, expect_null: bool) -> tuple:
+    column = df[kwargs["column"]]
+    unexpected = column.filter(
+        column.is_not_null() if expect_null else column.is_null()
+    )
+    count = len(unexpected)
+    result = {
+        "element_count": df.height,
+        "unexpected_count": count,
+        "unexpected_percent": _percent(count, df.height),
+        "partial_unexpected_list": unexpected.head(_PARTIAL_UNEXPECTED_LIMIT).to_list(),
+    }
+    return _passes(count, df.height, kwargs.get("mostly")), result
+
+
+def _map_result(
+    df: pl.DataFrame, kwargs: dict, is_unexpected: Callable[[pl.Series], pl.Series]
+) -> tuple:
+    """Evaluate a column map expectation over the non-null values."""
+    column = df[kwargs["column"]]
+    missing = column.null_count()
+    values = column.drop_nulls()
+    unexpected = values.filter(is_unexpected(values))
+    count = len(unexpected)
+    result = {
+        "element_count": df.height,
+        "unexpected_count": count,
+        "unexpected_percent": _percent(count, len(values)),
+        "partial_unexpected_list": unexpected.head(_PARTIAL_UNEXPECTED_LIMIT).to_list(),
+        "missing_count": missing,
+        "missing_percent": _percent(missing, df.height),
+        "unexpected_percent_total": _percent(count, df.height),
+        "unexpected_percent_nonmissing": _percent(count, len(values)),
+    }
+    return _passes(count, len(values), kwargs.get("mostly")), result
+
+
+def _between(values: pl.Series, kwargs: dict) -> pl.Series:
+    ok = pl.Series([True] * len(values))
+    low, high = kwargs.get("min_value"), kwargs.get("max_value")
+    if low is not None:
+        ok &= values > low if kwargs.get("strict_min") else values >= low
+    if high is not None:
+        ok &= values < high if kwargs.get("strict_max") else values <= high
+    return ~ok
+
+
+def _range_result(observed: int, kwargs: dict) -> tuple:
+    low, high = kwargs.get("min_value"), kwargs.get("max_value")
+    success = (low is None or observed >= low) and (high is None or observed <= high)
+    return success, {"observed_value": observed}
+
+
+def _evaluate(df: pl.DataFrame, kind: str, kwargs: dict) -> tuple[bool, dict]:
+    if kind == "expect_column_to_exist":
+        return kwargs["column"] in df.columns, {}
+    if kind == "expect_column_values_to_not_be_null":
+        return _null_result(df, kwargs, expect_null=False)
+    if kind == "expect_column_values_to_be_null":
+        return _null_result(df, kwargs, expect_null=True)
+    if kind == "expect_column_values_to_be_in_set":
+        value_set = list(kwargs["value_set"])
+        return _map_result(df, kwargs, lambda v: ~v.is_in(value_set))
+    if kind == "expect_column_values_to_be_between":
+        return _map_result(df, kwargs, lambda v: _between(v, kwargs))
+    if kind == "expect_column_values_to_be_unique":
+        return _map_result(df, kwargs, lambda v: v.is_duplicated())
+    if kind == "expect_table_row_count_to_be_between":
+        return _range_result(df.height, kwargs)
+    if kind == "expect_table_column_count_to_equal":
+        return df.width == kwargs["value"], {"observed_value": df.width}
+    raise ValueError(f"Unsupported expectation: {kind}")
+
+
+def validate(df: pl.DataFrame, suite: Any) -> Optional[dict]:
+    """Validate ``df`` against ``suite`` natively, or return ``None``."""
+    # Like GX's validator, evaluate only the last expectation per type and
+    # domain; ``column`` is part of the domain of column map expectations only
+    latest: dict[tuple[str, Optional[str]], dict] = {}
+    for expectation in suite.expectations:
+        config = expectation.configuration.to_json_dict()
+        column = None
+        if config["type"].startswith("expect_column_values_"):
+            column = config["kwargs"].get("column")
+        latest.pop((config["type"], column), None)
+        latest[(config["type"], column)] = config
+    configs = list(latest.values())
+    if not all(_supported(config, df) for config in configs):
+        return None
+    if any(
+        config["kwargs"].get("min_value") is None
+        and config["kwargs"].get("max_value") is None
+        for config in configs
+        if config["type"].endswith("_to_be_between")
+    ):
+        return None  # GX rejects open ranges; let it report the error
+
+    results: list[dict[str, Any]] = []
+    for config in configs:
+        try:
+            success, result = _evaluate(df, config["type"], config["kwargs"])
+        except (pl.exceptions.PolarsError, TypeError):
+            return None
+        results.append(
+            {
+                "success": bool(success),
+                "expectation_config": config,
+                "result": result,
+                "meta": {},
+                "exception_info": {
+                    "raised_exception": False,
+                    "exception_traceback": None,
+                    "exception_message": None,
+                },
+            }
+        )
+
+    successful = sum(r["success"] for r in results)
+    now = datetime.now(timezone.utc)
+    return {
+        "success": successful == len(results),
+        "results": results,
+        "suite_name": suite.name,
+        "suite_parameters": {},
+        "statistics": {
+            "evaluated_expectations": len(results),
+            "successful_expectations": successful,
+            "unsuccessful_expectations": len(results) - successful,
+            "success_percent": _percent(successful, len(results)),
+        },
+        "meta": {
+            "great_expectations_version": gx.__version__,
+            "expectation_suite_name": suite.name,
+            "validation_time": now.strftime("%Y%m%dT%H%M%S.%fZ"),
+            "engine": "polars",
+        },
+        "id": None,
+    }
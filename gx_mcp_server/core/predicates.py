@@ -0,0 +1,232 @@
+"""Row predicates for load-time filtering.
+
+Predicates are kept in the disjunctive normal form used by
+``pyarrow.parquet`` filters: a list of conjunctions, each a list of
+``(column, op, value)`` triples, where a row matches when every triple of
+some conjunction holds. :func:`parse` builds this form from a restricted
+Python expression such as ``"country == 'US' and ts >= '2024-01-01'"``; the
+expression is walked as an AST and never evaluated. Rows whose column is
+null never match, as in Arrow.
+"""
+
+from __future__ import annotations
+
+import ast
+import operator
+from typing import Any, Callable, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+Predicate = tuple[str, str, Any]
+Dnf = list[list[Predicate]]
+
+# Largest DNF produced when distributing ``and`` over ``or``
+_MAX_CONJUNCTIONS = 64
+
+_COMPARISONS: dict[type, str] = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.In: "in",
+    ast.NotIn: "not in",
+}
+_FLIPPED = {"<": ">", "<=": ">=", ">": "<", ">=": "<=", "==": "==", "!=": "!="}
+_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _literal(node: ast.expr) -> Any:
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        raise ValueError(f"Expected a literal, got: {ast.unparse(node)}") from None
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return value
+
+
+def _comparison(left: ast.expr, op: ast.cmpop, right: ast.expr) -> Predicate:
+    name = _COMPARISONS.get(type(op))
+    if name is None:
+        raise ValueError(f"Unsupported operator: {type(op).__name__}")
+    if isinstance(left, ast.Name):
+        column, value = left.id, _literal(right)
+    elif isinstance(right, ast.Name) and name in _FLIPPED:
+        column, value, name = right.id, _literal(left), _FLIPPED[name]
+    else:
+        raise ValueError(f"Expected column {name} literal: {ast.unparse(left)}")
+    if name in ("in", "not in") and not isinstance(value, list):
+        raise ValueError(f"'{name}' needs a list of values")
+    return (column, name, value)
+
+
+def _and(left: Dnf, right: Dnf) -> Dnf:
+    product = [a + b for a in left for b in right]
+    if len(product) > _MAX_CONJUNCTIONS:
+        raise ValueError("Filter expression is too complex")
+    return product
+
+
+def _to_dnf(node: ast.expr) -> Dnf:
+    if isinstance(node, ast.BoolOp):
+        parts = [_to_dnf(value) for value in node.values]
+        if isinstance(node.op, ast.Or):
+            return [conjunction for part in parts for conjunction in part]
+        result = parts[0]
+        for part in parts[1:]:
+            result = _and(result, part)
+        return result
+    if isinstance(node, ast.Compare):
+        # ``a < x <= b`` is ``a < x and x <= b``
+        operands = [node.left, *node.comparators]
+        return [
+            [
+                _comparison(operands[i], op, operands[i + 1])
+                for i, op in enumerate(node.ops)
+            ]
+        ]
+    raise ValueError(f"Unsupported filter syntax: {ast.unparse(node)}")
+
+
+def parse(expression: str) -> Dnf:
+    """Parse a filter expression into DNF.
+
+    Supports comparisons of a column name with a literal (``==``, ``!=``,
+    ``<``, ``<=``, ``>``, ``>=``, chained like ``1 <= x < 5``), ``in`` and
+    ``not in`` with a list, ``and``, ``or`` and parentheses.
+
+    Raises:
+        ValueError: For anything else
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"{e.msg} at offset {e.offset}") from None
+    return _to_dnf(tree.body)
+
+
+def normalize(filters: Sequence[Any] | None) -> Dnf | None:
+    """Return ``filters`` (one conjunction or a DNF) as a DNF of tuples."""
+    if not filters:
+        return None
+    conjunctions = [filters] if isinstance(filters[0][0], str) else filters
+    return [[tuple(p) for p in conjunction] for conjunction in conjunctions]  # type: ignore[misc]
+
+
+def combine(*filters: Sequence[Any] | None) -> Dnf | None:
+    """Return the DNF matching rows that satisfy all of ``filters``."""
+    result: Dnf | None = None
+    for dnf in map(normalize, filters):
+        if dnf is not None:
+            result = dnf if result is None else _and(result, dnf)
+    return result
+
+
+def columns(filters: Sequence[Any] | None) -> list[str]:
+    """Return the columns referenced by ``filters`` in first-use order."""
+    names: list[str] = []
+    for conjunction in normalize(filters) or []:
+        for column, _, _ in conjunction:
+            if column not in names:
+                names.append(column)
+    return names
+
+
+def _predicate_mask(series: pd.Series, op: str, value: Any) -> pd.Series:
+    if op == "in":
+        matched = series.isin(value)
+    elif op == "not in":
+        matched = ~series.isin(value)
+    else:
+        try:
+            matched = _OPERATORS[op](series, value)
+        except TypeError:
+            raise ValueError(
+                f"Cannot compare column {series.name} ({series.dtype}) with {value!r}"
+            ) from None
+    return matched.fillna(False).astype(bool) & series.notna()
+
+
+def mask(df: pd.DataFrame, dnf: Dnf) -> pd.Series:
+    """Return the boolean mask of the rows of ``df`` matching ``dnf``."""
+    result = pd.Series(False, index=df.index)
+    for conjunction in dnf:
+        matched = pd.Series(True, index=df.index)
+        for column, op, value in conjunction:
+            matched &= _predicate_mask(df[column], op, value)
+        result |= matched
+    return result
+
+
+def _arrow_value(schema: pa.Schema | None, column: str, value: Any) -> Any:
+    """Cast a string literal compared with a date or timestamp column."""
+    if not isinstance(value, str) or schema is None:
+        return value
+    if schema.get_field_index(column) < 0:
+        return value
+    field_type = schema.field(column).type
+    if not pa.types.is_temporal(field_type):
+        return value
+    try:
+        return pa.scalar(value).cast(field_type)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        raise ValueError(
+            f"Cannot compare column {column} ({field_type}) with {value!r}"
+        ) from None
+
+
+def to_arrow(dnf: Dnf, schema: pa.Schema | None = None) -> pc.Expression:
+    """Return ``dnf`` as an Arrow expression, with literals cast to ``schema``.
+
+    The expression can be passed as ``filters`` to ``pyarrow.parquet`` so
+    row groups whose statistics rule it out are skipped.
+    """
+
+    def predicate(column: str, op: str, value: Any) -> pc.Expression:
+        field = pc.field(column)
+        if op in ("in", "not in"):
+            values = [_arrow_value(schema, column, v) for v in value]
+            matched = field.isin(pa.array(values))
+            return ~matched & field.is_valid() if op == "not in" else matched
+        return _OPERATORS[op](field, _arrow_value(schema, column, value))
+
+    disjunction = None
+    for conjunction in dnf:
+        expr = predicate(*conjunction[0])
+        for item in conjunction[1:]:
+            expr = expr & predicate(*item)
+        disjunction = expr if disjunction is None else disjunction | expr
+    return disjunction
+
+
+def to_polars(dnf: Dnf) -> Any:
+    """Return ``dnf`` as a Polars expression for lazy predicate pushdown."""
+    import polars as pl
+
+    def predicate(column: str, op: str, value: Any) -> Any:
+        col = pl.col(column)
+        if op == "in":
+            return col.is_in(value)
+        if op == "not in":
+            return ~col.is_in(value) & col.is_not_null()
+        return _OPERATORS[op](col, value)
+
+    disjunction = None
+    for conjunction in dnf:
+        expr = predicate(*conjunction[0])
+        for item in conjunction[1:]:
+            expr = expr & predicate(*item)
+        disjunction = expr if disjunction is None else disjunction | expr
+    return disjunction
@@ -0,0 +1,94 @@
+"""Single-pass row sampling over a stream of DataFrame chunks.
+
+Samplers see each chunk once and keep only the rows sampled so far, so
+memory is bounded by the sample rather than the source. Reservoir sampling
+is Algorithm R, vectorized per chunk: every row past the first ``size``
+draws a slot and overwrites it if the slot is inside the reservoir, later
+rows winning ties exactly as in the sequential algorithm. The sample is
+returned in source row order.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from gx_mcp_server.core.schema import SampleOptions
+
+
+class _Reservoir:
+    """Uniform sample of at most ``size`` rows, tracking source positions."""
+
+    def __init__(self, size: int, rng: np.random.Generator) -> None:
+        self.size = size
+        self.rng = rng
+        self.seen = 0
+        self.rows: pd.DataFrame | None = None
+        self.positions = np.empty(0, dtype=np.int64)
+
+    def add(self, chunk: pd.DataFrame, positions: np.ndarray) -> None:
+        n = len(chunk)
+        if n == 0:
+            return
+        held = 0 if self.rows is None else len(self.rows)
+        # Index of each row among all rows seen by this reservoir
+        index = np.arange(self.seen, self.seen + n)
+        self.seen += n
+        slots = np.where(index < self.size, index, self.rng.integers(0, index + 1))
+        take = np.flatnonzero(slots < self.size)
+        if len(take) == 0:
+            return
+        slots = slots[take]
+        # As in the sequential algorithm, the last row drawn for a slot wins
+        unique, first_from_end = np.unique(slots[::-1], return_index=True)
+        source = np.arange(min(self.size, self.seen))
+        source[unique] = held + len(slots) - 1 - first_from_end
+        new_rows = chunk.iloc[take]
+        if self.rows is not None:
+            new_rows = pd.concat([self.rows, new_rows], ignore_index=True)
+        self.rows = new_rows.iloc[source].reset_index(drop=True)
+        self.positions = np.concatenate([self.positions, positions[take]])[source]
+
+
+def _ordered(rows: pd.DataFrame, positions: np.ndarray) -> pd.DataFrame:
+    return rows.iloc[np.argsort(positions, kind="stable")].reset_index(drop=True)
+
+
+def sample(chunks: Iterable[pd.DataFrame], options: SampleOptions) -> pd.DataFrame:
+    """Sample rows from ``chunks`` in one pass according to ``options``."""
+    rng = np.random.default_rng(options.seed)
+    if options.method == "bernoulli":
+        assert options.fraction is not None
+        fraction = options.fraction
+        kept = [chunk[rng.random(len(chunk)) < fraction] for chunk in chunks]
+        return pd.concat(kept, ignore_index=True) if kept else pd.DataFrame()
+
+    assert options.size is not None
+    offset = 0
+    empty: pd.DataFrame | None = None
+    reservoirs: dict[object, _Reservoir] = {}
+    for chunk in chunks:
+        empty = chunk.iloc[:0] if empty is None else empty
+        positions = np.arange(offset, offset + len(chunk))
+        offset += len(chunk)
+        if options.method == "reservoir":
+            reservoir = reservoirs.setdefault(None, _Reservoir(options.size, rng))
+            reservoir.add(chunk, positions)
+            continue
+        if options.column not in chunk.columns:
+            raise KeyError(f"Stratification column not found: {options.column}")
+        groups = chunk.groupby(
+            options.column, sort=False, dropna=False, observed=True
+        ).indices
+        for stratum, rows in groups.items():
+            key = None if pd.isna(stratum) else stratum
+            reservoir = reservoirs.setdefault(key, _Reservoir(options.size, rng))
+            reservoir.add(chunk.iloc[rows], positions[rows])
+
+    filled = [r for r in reservoirs.values() if r.rows is not None]
+    if not filled:
+        return empty if empty is not None else pd.DataFrame()
+    rows = pd.concat([r.rows for r in filled], ignore_index=True)
+    return _ordered(rows, np.concatenate([r.positions for r in filled]))
@@ -1,11 +1,38 @@
 # gx_mcp_server/core/schema.py
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 
 class DatasetHandle(BaseModel):
     handle: str
+    memory_bytes: Optional[int] = None
+    memory_saved_bytes: Optional[int] = None
+
+
+class SampleOptions(BaseModel):
+    """How ``load_dataset`` samples rows in a single pass over the source.
+
+    ``reservoir`` keeps ``size`` uniformly chosen rows, ``bernoulli`` keeps
+    each row with probability ``fraction`` and ``stratified`` keeps up to
+    ``size`` rows per distinct value of ``column``.
+    """
+
+    method: Literal["reservoir", "bernoulli", "stratified"] = "reservoir"
+    size: Optional[int] = Field(default=None, gt=0)
+    fraction: Optional[float] = Field(default=None, gt=0, le=1)
+    column: Optional[str] = None
+    seed: int = 0
+
+    @model_validator(mode="after")
+    def _check_method_arguments(self) -> "SampleOptions":
+        if self.method == "bernoulli" and self.fraction is None:
+            raise ValueError("bernoulli sampling needs a fraction")
+        if self.method != "bernoulli" and self.size is None:
+            raise ValueError(f"{self.method} sampling needs a size")
+        if self.method == "stratified" and self.column is None:
+            raise ValueError("stratified sampling needs a column")
+        return self
 
 
 class SuiteHandle(BaseModel):
@@ -26,3 +53,10 @@ class ValidationResultDetail(BaseModel):
     results: Any
     success: bool
     error: Optional[str] = None
+
+
+class ValidationSummary(BaseModel):
+    status: str
+    statistics: Dict[str, Any] = {}
+    success: Optional[bool] = None
+    error: Optional[str] = None
@@ -3,78 +3,353 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import heapq
+import itertools
 import threading
+import time
 import uuid
 from collections import OrderedDict
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncIterator, Callable, Sequence
+from urllib.parse import parse_qs
 
 import pandas as pd
 
+from gx_mcp_server import metrics
+from gx_mcp_server.logging import logger
+from gx_mcp_server.storage import exports, result_codec
+
 _MAX_ITEMS = 100
+_DEFAULT_SHARDS = 16
+
+
+def is_polars_frame(df: Any) -> bool:
+    """Return whether ``df`` is a Polars DataFrame, without importing Polars."""
+    return type(df).__module__.startswith("polars")
+
+
+def _as_pandas(df: Any) -> pd.DataFrame:
+    return df.to_pandas() if is_polars_frame(df) else df
+
+
+def frame_size(df: Any) -> int:
+    """Return the in-memory size of a pandas or Polars frame in bytes."""
+    if is_polars_frame(df):
+        return int(df.estimated_size())
+    return int(df.memory_usage(deep=True).sum())
+
 
 # ---------------------------------------------------------------------------
 # In-memory implementation
 # ---------------------------------------------------------------------------
-_df_store: OrderedDict[str, pd.DataFrame] = OrderedDict()
-_result_store: OrderedDict[str, Any] = OrderedDict()
-_df_lock = threading.Lock()
-_result_lock = threading.Lock()
+
+
+class _Shard:
+    """One partition of the in-memory store with its own lock and LRU order."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.items: OrderedDict[str, Any] = OrderedDict()
+        self.sizes: dict[str, int] = {}
+        self.written: dict[str, float] = {}  # write time, for expiry
+        self.ticks: dict[str, int] = {}  # last use, ordered store-wide
+        self.bytes = 0
+
+    def put(
+        self, key: str, value: Any, size: int = 0, written: float | None = None
+    ) -> bool:
+        """Insert or replace ``key``; returns whether it is a new item."""
+        new = key not in self.items
+        self.bytes += size - self.sizes.get(key, 0)
+        self.items[key] = value
+        self.items.move_to_end(key)
+        self.sizes[key] = size
+        self.written[key] = time.time() if written is None else written
+        self.ticks[key] = next(_clock)
+        return new
+
+    def touch(self, key: str) -> Any:
+        """Return the value of ``key`` and mark it most recently used."""
+        value = self.items[key]
+        self.items.move_to_end(key)
+        self.ticks[key] = next(_clock)
+        return value
+
+    def pop(self, key: str) -> tuple[Any, int] | None:
+        if key not in self.items:
+            return None
+        self.bytes -= self.sizes.get(key, 0)
+        self.written.pop(key, None)
+        self.ticks.pop(key, None)
+        return self.items.pop(key), self.sizes.pop(key, 0)
+
+    def expire(self, cutoff: float) -> list[tuple[str, int]]:
+        """Drop items written before ``cutoff``. Needs ``lock``."""
+        expired: list[tuple[str, int]] = []
+        for key in [k for k, written in self.written.items() if written < cutoff]:
+            removed = self.pop(key)
+            if removed is not None:
+                expired.append((key, removed[1]))
+        return expired
+
+
+class _Totals:
+    """Store-wide item and byte counts and LRU queue of a list of shards.
+
+    The queue is a min-heap of ``(tick, key)`` written on insert only, so
+    reads never leave their shard. An entry is stale once its key was used
+    again, replaced or removed; eviction skips or requeues those.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # Serializes eviction passes so concurrent inserts do not over-evict
+        self.evict_lock = threading.Lock()
+        self.items = 0
+        self.bytes = 0
+        self.queue: list[tuple[int, str]] = []
+        self.queued: dict[str, int] = {}  # key -> tick of its live queue entry
+
+    def added(self, key: str, tick: int, size: int, new: bool) -> None:
+        """Count an inserted or replaced item and queue it at ``tick``."""
+        with self.lock:
+            self.items += int(new)
+            self.bytes += size
+            self._push(key, tick)
+
+    def removed(self, key: str, size: int) -> None:
+        with self.lock:
+            self.items -= 1
+            self.bytes -= size
+            self.queued.pop(key, None)
+
+    def requeue(self, key: str, tick: int) -> None:
+        with self.lock:
+            self._push(key, tick)
+
+    def pop_oldest(self) -> tuple[int, str] | None:
+        """Return the oldest live queue entry, removing it from the queue."""
+        with self.lock:
+            while self.queue:
+                tick, key = heapq.heappop(self.queue)
+                if self.queued.get(key) == tick:
+                    del self.queued[key]
+                    return tick, key
+        return None
+
+    def reset(self, entries: list[tuple[int, str]], items: int, size: int) -> None:
+        with self.lock:
+            self.items = items
+            self.bytes = size
+            self.queued = {key: tick for tick, key in entries}
+            self.queue = sorted(entries)
+
+    def _push(self, key: str, tick: int) -> None:
+        self.queued[key] = tick
+        heapq.heappush(self.queue, (tick, key))
+        # Rebuild once stale entries outnumber live ones
+        if len(self.queue) > 2 * len(self.queued) + 64:
+            self.queue = [(t, k) for k, t in self.queued.items()]
+            heapq.heapify(self.queue)
+
+    def over(self, max_items: int, max_bytes: int | None) -> bool:
+        # The newest item may exceed the byte budget on its own
+        if self.items <= 1:
+            return False
+        if max_bytes is not None:
+            return self.bytes > max_bytes
+        return self.items > max_items
+
+
+# Orders uses across shards for store-wide LRU eviction
+_clock = itertools.count()
+
+# Handles are spread over shards by hash so unrelated requests rarely contend;
+# budgets apply to the store as a whole
+_df_shards: list[_Shard] = [_Shard() for _ in range(_DEFAULT_SHARDS)]
+_result_shards: list[_Shard] = [_Shard() for _ in range(_DEFAULT_SHARDS)]
+_df_totals = _Totals()
+_result_totals = _Totals()
+# When set, datasets are evicted by memory footprint instead of by count
+_df_max_bytes: int | None = None
+
+
+def _shard_for(shards: list[_Shard], key: str) -> _Shard:
+    return shards[hash(key) % len(shards)]
+
+
+def _evict(
+    shards: list[_Shard],
+    totals: _Totals,
+    max_bytes: int | None,
+    keep: str | None = None,
+) -> list[tuple[str, int]]:
+    """Evict the least recently used items of the whole store beyond budget.
+
+    Victims come off the store-wide queue, so only their own shard is
+    locked. ``keep``, the item just inserted, is never evicted, so only the
+    newest item can exceed ``max_bytes``. Returns the evicted keys with
+    their sizes.
+    """
+    evicted: list[tuple[str, int]] = []
+    if not totals.over(_MAX_ITEMS, max_bytes):
+        return evicted
+    kept: int | None = None
+    with totals.evict_lock:
+        while totals.over(_MAX_ITEMS, max_bytes):
+            entry = totals.pop_oldest()
+            if entry is None:
+                break
+            tick, key = entry
+            shard = _shard_for(shards, key)
+            with shard.lock:
+                current = shard.ticks.get(key)
+                removed = None
+                if current == tick and key != keep:
+                    removed = shard.pop(key)
+            if removed is not None:
+                totals.removed(key, removed[1])
+                evicted.append((key, removed[1]))
+            elif key == keep and current is not None:
+                kept = current
+            elif current is not None:
+                # Used since it was queued
+                totals.requeue(key, current)
+        if kept is not None and keep is not None:
+            totals.requeue(keep, kept)
+    return evicted
+
+
+def _evict_datasets(keep: str | None = None) -> list[str]:
+    """Apply the dataset budget to the store, keeping ``keep``."""
+    evicted = _evict(_df_shards, _df_totals, _df_max_bytes, keep)
+    for _, size in evicted:
+        metrics.DATASET_STORE_EVICTIONS.inc()
+        metrics.DATASET_STORE_BYTES.dec(size)
+        metrics.DATASET_STORE_ITEMS.dec()
+    return [key for key, _ in evicted]
+
+
+def _store_result(vid: str, result: Any) -> None:
+    # Results are held as (summary JSON, compressed results) pairs
+    encoded = result_codec.encode(result)
+    size = len(encoded[0]) + len(encoded[1] or b"")
+    shard = _shard_for(_result_shards, vid)
+    with shard.lock:
+        before = shard.sizes.get(vid, 0)
+        new = shard.put(vid, encoded, size)
+        tick = shard.ticks[vid]
+    _result_totals.added(vid, tick, size - before, new)
+    _evict(_result_shards, _result_totals, None, keep=vid)
+
+
+def _load_result(vid: str) -> tuple[str, bytes | None]:
+    shard = _shard_for(_result_shards, vid)
+    with shard.lock:
+        return shard.touch(vid)
 
 
 class _InMemoryDataStorage:
+    # Polars frames are stored as they are rather than converted to pandas
+    native_polars = True
+
     @staticmethod
     def add(df: pd.DataFrame) -> str:
         handle = str(uuid.uuid4())
-        with _df_lock:
-            if len(_df_store) >= _MAX_ITEMS:
-                _df_store.popitem(last=False)
-            _df_store[handle] = df
+        size = frame_size(df)
+        shard = _shard_for(_df_shards, handle)
+        with shard.lock:
+            shard.put(handle, df, size)
+            tick = shard.ticks[handle]
+        _df_totals.added(handle, tick, size, True)
+        metrics.DATASET_STORE_BYTES.inc(size)
+        metrics.DATASET_STORE_ITEMS.inc()
+        for old in _evict_datasets(keep=handle):
+            dataset_dropped(old)
         return handle
 
     @staticmethod
-    def get(handle: str) -> pd.DataFrame:
-        with _df_lock:
-            return _df_store[handle]
+    def get(handle: str, columns: Sequence[str] | None = None) -> pd.DataFrame:
+        shard = _shard_for(_df_shards, handle)
+        with shard.lock:
+            df = shard.touch(handle)
+        if columns is None:
+            return df
+        return df.select(list(columns)) if is_polars_frame(df) else df[list(columns)]
 
     @staticmethod
-    def get_handle_path(handle: str) -> str:
-        path = f"/tmp/{handle}.csv"
-        with _df_lock:
-            _df_store[handle].to_csv(path, index=False)
-        return path
+    def contains(handle: str) -> bool:
+        shard = _shard_for(_df_shards, handle)
+        with shard.lock:
+            return handle in shard.items
+
+    @staticmethod
+    def delete(handle: str) -> None:
+        shard = _shard_for(_df_shards, handle)
+        with shard.lock:
+            removed = shard.pop(handle)
+        if removed is not None:
+            _df_totals.removed(handle, removed[1])
+            metrics.DATASET_STORE_BYTES.dec(removed[1])
+            metrics.DATASET_STORE_ITEMS.dec()
+
+    @staticmethod
+    def purge(cutoff: float) -> list[str]:
+        """Remove datasets added before ``cutoff`` and return their handles."""
+        expired: list[tuple[str, int]] = []
+        for shard in _df_shards:
+            with shard.lock:
+                expired.extend(shard.expire(cutoff))
+        for key, size in expired:
+            _df_totals.removed(key, size)
+            metrics.DATASET_STORE_BYTES.dec(size)
+            metrics.DATASET_STORE_ITEMS.dec()
+        return [key for key, _ in expired]
 
 
 class _InMemoryValidationStorage:
     @staticmethod
     def add(result: Any) -> str:
         vid = str(uuid.uuid4())
-        with _result_lock:
-            if len(_result_store) >= _MAX_ITEMS:
-                _result_store.popitem(last=False)
-            _result_store[vid] = result
+        _store_result(vid, result)
         return vid
 
     @classmethod
     def reserve(cls) -> str:
         """Reserve an ID for an asynchronous validation run."""
         vid = str(uuid.uuid4())
-        with _result_lock:
-            if len(_result_store) >= _MAX_ITEMS:
-                _result_store.popitem(last=False)
-            _result_store[vid] = {"status": "pending"}
+        _store_result(vid, {"status": "pending"})
         return vid
 
     @classmethod
     def set(cls, vid: str, result: Any) -> None:
         """Store a validation result for a pre-reserved ID."""
-        with _result_lock:
-            _result_store[vid] = result
+        _store_result(vid, result)
 
     @classmethod
     def get(cls, vid: str) -> Any:
         """Retrieve a stored validation result by ID."""
-        with _result_lock:
-            return _result_store[vid]
+        return result_codec.decode(*_load_result(vid))
+
+    @classmethod
+    def get_summary(cls, vid: str) -> dict:
+        """Retrieve a stored result without decoding per-expectation results."""
+        return result_codec.decode_summary(_load_result(vid)[0])
+
+    @classmethod
+    def purge(cls, cutoff: float) -> list[str]:
+        """Remove results last written before ``cutoff`` and return their IDs."""
+        expired: list[tuple[str, int]] = []
+        for shard in _result_shards:
+            with shard.lock:
+                expired.extend(shard.expire(cutoff))
+        for key, size in expired:
+            _result_totals.removed(key, size)
+        return [key for key, _ in expired]
 
 
 # ---------------------------------------------------------------------------
@@ -84,8 +359,62 @@ _data_backend: type[_InMemoryDataStorage] | Any = _InMemoryDataStorage
 _validation_backend: type[_InMemoryValidationStorage] | Any = _InMemoryValidationStorage
 
 
+def _reshard(shards: list[_Shard], totals: _Totals, count: int) -> list[_Shard]:
+    """Redistribute the items of ``shards`` over ``count`` new shards."""
+    if count == len(shards):
+        return shards
+    new_shards = [_Shard() for _ in range(count)]
+    items: list[tuple[int, str, Any, int, float]] = []
+    for shard in shards:
+        with shard.lock:
+            items.extend(
+                (shard.ticks[key], key, value, shard.sizes[key], shard.written[key])
+                for key, value in shard.items.items()
+            )
+    # Oldest first, so the store-wide LRU order survives
+    items.sort(key=lambda item: item[0])
+    entries = []
+    for _, key, value, size, written in items:
+        shard = _shard_for(new_shards, key)
+        shard.put(key, value, size, written)
+        entries.append((shard.ticks[key], key))
+    totals.reset(entries, len(items), sum(item[3] for item in items))
+    return new_shards
+
+
+def configure_memory_store(
+    max_bytes: int | None = None, shards: int = _DEFAULT_SHARDS
+) -> None:
+    """Configure budgets and lock striping of the in-memory store.
+
+    Args:
+        max_bytes: Maximum total ``memory_usage(deep=True)`` of stored
+            datasets, or ``None`` to cap the store at ``_MAX_ITEMS`` datasets.
+            Budgets apply to the whole store, whatever the shard count.
+        shards: Number of independently locked partitions
+    """
+    global _df_max_bytes, _df_shards, _result_shards
+    if shards < 1:
+        raise ValueError("shards must be >= 1")
+    _df_max_bytes = max_bytes
+    _df_shards = _reshard(_df_shards, _df_totals, shards)
+    _result_shards = _reshard(_result_shards, _result_totals, shards)
+    for old in _evict_datasets():
+        dataset_dropped(old)
+    _evict(_result_shards, _result_totals, None)
+
+
 def configure_storage_backend(uri: str) -> None:
-    """Configure storage backend based on URI."""
+    """Configure storage backend based on URI.
+
+    ``memory?max_bytes=N&shards=M`` selects the in-memory backend with a byte
+    budget and ``M`` lock stripes,
+    ``tiered:///spill/dir`` keeps hot datasets in memory and spills the rest
+    to disk, and ``arrow:///dir`` serves memory-mapped Arrow files that can be
+    shared between worker processes. ``shm://namespace`` keeps datasets and
+    results in POSIX shared memory visible to every worker on the host, and
+    ``redis://host:port/db`` shares them between server replicas.
+    """
     global _data_backend, _validation_backend
 
     if uri.startswith("sqlite:///"):
@@ -94,9 +423,171 @@ def configure_storage_backend(uri: str) -> None:
         sqlite_backend.initialize(uri)
         _data_backend = sqlite_backend.DataStorage
         _validation_backend = sqlite_backend.ValidationStorage
+    elif uri.startswith("tiered:///"):
+        from gx_mcp_server.storage import tiered_backend
+
+        tiered_backend.initialize(uri)
+        _data_backend = tiered_backend.DataStorage
+        _validation_backend = _InMemoryValidationStorage
+    elif uri.startswith("arrow:///"):
+        from gx_mcp_server.storage import mmap_backend
+
+        mmap_backend.initialize(uri)
+        _data_backend = mmap_backend.DataStorage
+        _validation_backend = mmap_backend.ValidationStorage
+    elif uri.startswith("shm://"):
+        from gx_mcp_server.storage import shm_backend
+
+        shm_backend.initialize(uri)
+        _data_backend = shm_backend.DataStorage
+        _validation_backend = shm_backend.ValidationStorage
+    elif uri.startswith(("redis://", "rediss://")):
+        from gx_mcp_server.storage import redis_backend
+
+        redis_backend.initialize(uri)
+        _data_backend = redis_backend.DataStorage
+        _validation_backend = redis_backend.ValidationStorage
     else:
+        params = {k: v[-1] for k, v in parse_qs(uri.partition("?")[2]).items()}
+        configure_memory_store(
+            int(params["max_bytes"]) if "max_bytes" in params else None,
+            int(params.get("shards", _DEFAULT_SHARDS)),
+        )
         _data_backend = _InMemoryDataStorage
         _validation_backend = _InMemoryValidationStorage
+    _warn_shared_dedup()
+
+
+# ---------------------------------------------------------------------------
+# Content-addressed deduplication
+# ---------------------------------------------------------------------------
+_dedup_enabled = False
+_aliases: dict[str, str] = {}  # alias handle -> stored handle
+_digest_handles: dict[str, str] = {}  # content digest -> stored handle
+_handle_digests: dict[str, str] = {}  # stored handle -> content digest
+_refcounts: dict[str, int] = {}  # stored handle -> number of live handles
+_dedup_lock = threading.Lock()
+
+
+def configure_dataset_dedup(enabled: bool) -> None:
+    """Enable or disable content-addressed deduplication of datasets.
+
+    Aliases are tracked in process, so backends shared between processes
+    (``shared = True``) store every dataset on its own.
+    """
+    global _dedup_enabled
+    with _dedup_lock:
+        _dedup_enabled = enabled
+        _aliases.clear()
+        _digest_handles.clear()
+        _handle_digests.clear()
+        _refcounts.clear()
+    _warn_shared_dedup()
+
+
+def _backend_shared() -> bool:
+    return getattr(_data_backend, "shared", False)
+
+
+def _dedup_active() -> bool:
+    return _dedup_enabled and not _backend_shared()
+
+
+def _warn_shared_dedup() -> None:
+    if _dedup_enabled and not _dedup_active():
+        logger.warning(
+            "Dataset deduplication is disabled with a storage backend shared "
+            "between processes"
+        )
+
+
+def dataset_digest(df: pd.DataFrame) -> str | None:
+    """Hash the contents, column names and dtypes of ``df``.
+
+    Returns ``None`` for frames whose values cannot be hashed.
+    """
+    if is_polars_frame(df):
+        try:
+            values = df.hash_rows(seed=0).to_numpy()
+        except Exception:  # nested or object columns
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr([(c, str(t)) for c, t in df.schema.items()]).encode())
+        digest.update(values.tobytes())
+        return digest.hexdigest()
+    try:
+        values = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+    digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def _forget_stored(stored: str) -> None:
+    """Drop dedup bookkeeping for a stored handle. Needs ``_dedup_lock``."""
+    digest = _handle_digests.pop(stored, None)
+    if digest is not None and _digest_handles.get(digest) == stored:
+        del _digest_handles[digest]
+    _refcounts.pop(stored, None)
+    for alias in [a for a, s in _aliases.items() if s == stored]:
+        del _aliases[alias]
+
+
+def dataset_dropped(stored: str) -> None:
+    """Forget a dataset that its backend evicted or expired on its own."""
+    with _dedup_lock:
+        _forget_stored(stored)
+    exports.discard(stored)
+
+
+def _resolve(handle: str) -> str:
+    with _dedup_lock:
+        return _aliases.get(handle, handle)
+
+
+# ---------------------------------------------------------------------------
+# Lazy datasets
+# ---------------------------------------------------------------------------
+
+
+class _LazyDataset:
+    """A handle whose source is read on first use."""
+
+    def __init__(self, load: Callable[[], pd.DataFrame]) -> None:
+        self.load = load
+        self.lock = threading.Lock()
+        self.created = time.time()
+
+
+# Lazy handles that have not been materialized yet. They live in this process
+# only, so backends shared between processes never get any.
+_lazy: dict[str, _LazyDataset] = {}
+_lazy_lock = threading.Lock()
+
+
+def _materialize(handle: str) -> str:
+    """Return the stored handle for ``handle``, loading a lazy source first.
+
+    Concurrent first uses wait for a single load.
+    """
+    with _lazy_lock:
+        entry = _lazy.get(handle)
+    if entry is not None:
+        with entry.lock:
+            with _lazy_lock:
+                pending = _lazy.get(handle) is entry
+            if pending:
+                inner = DataStorage.add(entry.load())
+                with _dedup_lock:
+                    stored = _aliases.pop(inner, inner)
+                    _aliases[handle] = stored
+                    _refcounts.setdefault(stored, 1)
+                with _lazy_lock:
+                    _lazy.pop(handle, None)
+                logger.info("Materialized lazy dataset %s", handle)
+    return _resolve(handle)
 
 
 class DataStorage:
@@ -104,15 +595,108 @@ class DataStorage:
 
     @staticmethod
     def add(df: pd.DataFrame) -> str:
-        return _data_backend.add(df)
+        """Store a pandas or Polars frame and return its handle.
+
+        Polars frames are kept natively by backends that support it and
+        converted to pandas for the others.
+        """
+        if is_polars_frame(df) and not getattr(_data_backend, "native_polars", False):
+            df = df.to_pandas()
+        if not _dedup_active():
+            return _data_backend.add(df)
+
+        # With deduplication every handle is an alias of a stored copy
+        digest = dataset_digest(df)
+        handle = str(uuid.uuid4())
+        if digest is not None:
+            # Take the alias before checking the copy, so an eviction in
+            # between is seen either here or through dataset_dropped()
+            with _dedup_lock:
+                stored = _digest_handles.get(digest)
+                if stored is not None:
+                    _aliases[handle] = stored
+                    _refcounts[stored] += 1
+            if stored is not None:
+                if _data_backend.contains(stored):
+                    logger.info("Dataset %s deduplicated onto %s", handle, stored)
+                    return handle
+                with _dedup_lock:
+                    _forget_stored(stored)
+
+        stored = _data_backend.add(df)
+        with _dedup_lock:
+            if digest is not None:
+                stale = _digest_handles.get(digest)
+                if stale is not None:
+                    _forget_stored(stale)
+                _digest_handles[digest] = stored
+                _handle_digests[stored] = digest
+            _aliases[handle] = stored
+            _refcounts[stored] = 1
+        return handle
+
+    @staticmethod
+    def add_lazy(load: Callable[[], pd.DataFrame]) -> str:
+        """Return a handle whose dataset is produced by ``load`` on first use.
+
+        Backends shared between processes (``shared = True``) run ``load`` at
+        once, as other processes could not see the pending load.
+        """
+        if _backend_shared():
+            logger.info("Loading lazy dataset at once for a shared storage backend")
+            return DataStorage.add(load())
+        handle = str(uuid.uuid4())
+        with _lazy_lock:
+            _lazy[handle] = _LazyDataset(load)
+        return handle
+
+    @staticmethod
+    def get(handle: str, columns: Sequence[str] | None = None) -> pd.DataFrame:
+        """Retrieve a dataset as pandas, materializing only ``columns``."""
+        return _as_pandas(DataStorage.get_frame(handle, columns))
 
     @staticmethod
-    def get(handle: str) -> pd.DataFrame:
-        return _data_backend.get(handle)
+    def get_frame(handle: str, columns: Sequence[str] | None = None) -> Any:
+        """Retrieve a dataset as stored, which may be a Polars frame."""
+        stored = _materialize(handle)
+        try:
+            return _data_backend.get(stored, columns)
+        except KeyError:
+            if stored != handle:
+                with _dedup_lock:
+                    _forget_stored(stored)
+            raise KeyError(handle) from None
 
     @staticmethod
-    def get_handle_path(handle: str) -> str:
-        return _data_backend.get_handle_path(handle)
+    def delete(handle: str) -> None:
+        """Release a handle; data is dropped once no handle refers to it."""
+        with _lazy_lock:
+            if _lazy.pop(handle, None) is not None:
+                return
+        with _dedup_lock:
+            stored = _aliases.pop(handle, handle)
+            refs = _refcounts.get(stored, 1) - 1
+            if refs > 0:
+                _refcounts[stored] = refs
+                return
+            _forget_stored(stored)
+        _data_backend.delete(stored)
+        exports.discard(stored)
+
+    @staticmethod
+    def get_handle_path(handle: str, fmt: exports.ExportFormat = "csv") -> str:
+        """Return a file export of the dataset, written once and then reused.
+
+        Args:
+            handle: Dataset handle
+            fmt: ``"csv"`` (default), ``"parquet"`` or ``"arrow"``
+        """
+        stored = _materialize(handle)
+        if not _data_backend.contains(stored):
+            raise KeyError(handle)
+        return exports.export_path(
+            stored, fmt, lambda: _as_pandas(_data_backend.get(stored))
+        )
 
 
 class ValidationStorage:
@@ -135,3 +719,168 @@ class ValidationStorage:
     def set(vid: str, result: Any) -> None:
         """Store a validation result for a pre-reserved ID."""
         _validation_backend.set(vid, result)
+
+    @staticmethod
+    def get_summary(vid: str) -> dict:
+        """Retrieve a result without its per-expectation ``results`` list."""
+        return _validation_backend.get_summary(vid)
+
+
+# ---------------------------------------------------------------------------
+# Async facades
+# ---------------------------------------------------------------------------
+_IO_THREADS = 4
+_io_executor: ThreadPoolExecutor | None = None
+_io_executor_lock = threading.Lock()
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = ThreadPoolExecutor(
+                max_workers=_IO_THREADS, thread_name_prefix="gx-storage-io"
+            )
+        return _io_executor
+
+
+async def _run_io(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking storage call on the storage I/O pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_io_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+class AsyncDataStorage:
+    """Awaitable :class:`DataStorage` that keeps encoding and I/O off the loop.
+
+    Calls run on a dedicated pool so they never queue behind validations in
+    the default executor.
+    """
+
+    @staticmethod
+    async def add(df: pd.DataFrame) -> str:
+        return await _run_io(DataStorage.add, df)
+
+    @staticmethod
+    async def add_lazy(load: Callable[[], pd.DataFrame]) -> str:
+        return DataStorage.add_lazy(load)
+
+    @staticmethod
+    async def get(handle: str, columns: Sequence[str] | None = None) -> pd.DataFrame:
+        return await _run_io(DataStorage.get, handle, columns)
+
+    @staticmethod
+    async def get_frame(handle: str, columns: Sequence[str] | None = None) -> Any:
+        return await _run_io(DataStorage.get_frame, handle, columns)
+
+    @staticmethod
+    async def delete(handle: str) -> None:
+        await _run_io(DataStorage.delete, handle)
+
+    @staticmethod
+    async def get_handle_path(handle: str, fmt: exports.ExportFormat = "csv") -> str:
+        return await _run_io(DataStorage.get_handle_path, handle, fmt)
+
+
+class AsyncValidationStorage:
+    """Awaitable :class:`ValidationStorage` running on the storage I/O pool."""
+
+    @staticmethod
+    async def add(result: Any) -> str:
+        return await _run_io(ValidationStorage.add, result)
+
+    @staticmethod
+    async def get(vid: str) -> Any:
+        return await _run_io(ValidationStorage.get, vid)
+
+    @staticmethod
+    async def reserve() -> str:
+        return await _run_io(ValidationStorage.reserve)
+
+    @staticmethod
+    async def set(vid: str, result: Any) -> None:
+        await _run_io(ValidationStorage.set, vid, result)
+
+    @staticmethod
+    async def get_summary(vid: str) -> dict:
+        return await _run_io(ValidationStorage.get_summary, vid)
+
+
+# ---------------------------------------------------------------------------
+# Expiry
+# ---------------------------------------------------------------------------
+_MAX_SWEEP_INTERVAL = 60.0
+_dataset_ttl: float | None = None
+_result_ttl: float | None = None
+
+
+def configure_ttl(
+    dataset_seconds: float | None = None, result_seconds: float | None = None
+) -> None:
+    """Set how long datasets and validation results are kept.
+
+    Items are removed by :func:`sweep_expired` once their kind's TTL has
+    passed since they were last written; reading an item does not extend it.
+    ``None`` keeps them until the backend's own cap pushes them out.
+    """
+    global _dataset_ttl, _result_ttl
+    for ttl in (dataset_seconds, result_seconds):
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL must be positive")
+    _dataset_ttl = dataset_seconds
+    _result_ttl = result_seconds
+
+
+def sweep_expired(now: float | None = None) -> tuple[int, int]:
+    """Remove expired datasets and results from the configured backend.
+
+    Returns the number of datasets and results removed.
+    """
+    now = time.time() if now is None else now
+    datasets: list[str] = []
+    results: list[str] = []
+    if _dataset_ttl is not None:
+        cutoff = now - _dataset_ttl
+        with _lazy_lock:
+            for handle in [h for h, e in _lazy.items() if e.created < cutoff]:
+                del _lazy[handle]
+        datasets = _data_backend.purge(cutoff)
+        for stored in datasets:
+            dataset_dropped(stored)
+    if _result_ttl is not None:
+        results = _validation_backend.purge(now - _result_ttl)
+    if datasets or results:
+        logger.info("Expired %d datasets and %d results", len(datasets), len(results))
+    return len(datasets), len(results)
+
+
+@asynccontextmanager
+async def expiry_sweeper() -> AsyncIterator[None]:
+    """Run :func:`sweep_expired` in the background while the context is open.
+
+    Does nothing when no TTL is configured. Sweeps run on the storage I/O pool at
+    half the shortest TTL, at most every ``_MAX_SWEEP_INTERVAL`` seconds.
+    """
+    ttls = [ttl for ttl in (_dataset_ttl, _result_ttl) if ttl is not None]
+    if not ttls:
+        yield
+        return
+    interval = min(_MAX_SWEEP_INTERVAL, min(ttls) / 2)
+
+    async def sweep() -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await _run_io(sweep_expired)
+            except Exception:
+                logger.exception("Expiry sweep failed")
+
+    task = asyncio.create_task(sweep())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,21 @@
+# gx_mcp_server/metrics.py
+"""Prometheus metrics for the storage layer.
+
+Metrics are registered in the default registry, which is what the
+``/metrics`` endpoint on ``--metrics-port`` exposes.
+"""
+
+from prometheus_client import Counter, Gauge
+
+DATASET_STORE_BYTES = Gauge(
+    "gx_mcp_dataset_store_bytes",
+    "Approximate memory held by datasets in the in-memory store",
+)
+DATASET_STORE_ITEMS = Gauge(
+    "gx_mcp_dataset_store_items",
+    "Number of datasets held in the in-memory store",
+)
+DATASET_STORE_EVICTIONS = Counter(
+    "gx_mcp_dataset_store_evictions",
+    "Datasets evicted from the in-memory store",
+)
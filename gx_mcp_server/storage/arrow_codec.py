@@ -0,0 +1,80 @@
+"""Arrow IPC / Parquet encoding for persisted datasets."""
+
+from __future__ import annotations
+
+from typing import Literal, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DatasetFormat = Literal["arrow", "parquet"]
+
+ARROW_MAGIC = b"ARROW1"
+PARQUET_MAGIC = b"PAR1"
+
+
+def encode_dataframe(
+    df: pd.DataFrame,
+    fmt: DatasetFormat = "arrow",
+    compression: str | None = None,
+) -> bytes:
+    """Serialize ``df`` to an Arrow IPC file or Parquet blob.
+
+    Args:
+        df: DataFrame to encode
+        fmt: ``"arrow"`` for the Arrow IPC file format or ``"parquet"``
+        compression: Optional codec (``"zstd"``, ``"lz4"``...); ``None`` stores
+            uncompressed buffers
+    """
+    table = pa.Table.from_pandas(df, preserve_index=None)
+    sink = pa.BufferOutputStream()
+    if fmt == "parquet":
+        pq.write_table(table, sink, compression=compression or "none")
+    elif fmt == "arrow":
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+    else:
+        raise ValueError(f"Unsupported dataset format: {fmt}")
+    return sink.getvalue().to_pybytes()
+
+
+def decode_table(
+    blob: bytes | pa.Buffer, columns: Sequence[str] | None = None
+) -> pa.Table:
+    """Decode a blob written by :func:`encode_dataframe` into an Arrow table.
+
+    Only ``columns`` are read when given; the format is detected from the
+    leading magic bytes.
+    """
+    head = bytes(memoryview(blob)[:6])
+    source = pa.BufferReader(blob)
+    if head.startswith(PARQUET_MAGIC):
+        return pq.read_table(
+            source,
+            columns=list(columns) if columns is not None else None,
+            use_pandas_metadata=True,
+        )
+    if head.startswith(ARROW_MAGIC):
+        table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(list(columns))
+        return table
+    raise ValueError("Unsupported dataset encoding")
+
+
+def table_to_dataframe(table: pa.Table, arrow_dtypes: bool = False) -> pd.DataFrame:
+    """Convert ``table`` to pandas, optionally keeping Arrow-backed dtypes."""
+    if arrow_dtypes:
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return table.to_pandas()
+
+
+def decode_dataframe(
+    blob: bytes | pa.Buffer,
+    columns: Sequence[str] | None = None,
+    arrow_dtypes: bool = False,
+) -> pd.DataFrame:
+    """Decode a blob into a DataFrame, materializing only ``columns``."""
+    return table_to_dataframe(decode_table(blob, columns), arrow_dtypes)
@@ -0,0 +1,85 @@
+"""On-disk exports of stored datasets for tools that need a file path.
+
+Datasets are immutable, so each handle is exported at most once per format
+and the file is reused until the handle is evicted or deleted.
+"""
+
+import os
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Callable, Literal
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+ExportFormat = Literal["csv", "parquet", "arrow"]
+
+_SUFFIXES: dict[str, str] = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}
+
+_export_dir = Path(tempfile.gettempdir()) / "gx_mcp_exports"
+_handle_locks: dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _handle_lock(handle: str) -> threading.Lock:
+    with _locks_guard:
+        return _handle_locks.setdefault(handle, threading.Lock())
+
+
+def _path(handle: str, fmt: str) -> Path:
+    try:
+        uuid.UUID(handle)
+    except ValueError:
+        raise KeyError(handle) from None
+    return _export_dir / f"{handle}{_SUFFIXES[fmt]}"
+
+
+def _write(df: pd.DataFrame, path: Path, fmt: str) -> None:
+    if fmt == "csv":
+        df.to_csv(path, index=False)
+    elif fmt == "parquet":
+        df.to_parquet(path, index=False)
+    else:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        feather.write_feather(table, str(path), compression="uncompressed")
+
+
+def export_path(
+    handle: str, fmt: ExportFormat, load: Callable[[], pd.DataFrame]
+) -> str:
+    """Return the export of ``handle`` in ``fmt``, writing it on first use.
+
+    Args:
+        handle: Stored dataset handle
+        fmt: ``"csv"``, ``"parquet"`` or ``"arrow"`` (Arrow IPC file)
+        load: Called to fetch the dataset when no export exists yet
+    """
+    if fmt not in _SUFFIXES:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    path = _path(handle, fmt)
+    with _handle_lock(handle):
+        if not path.exists():
+            _export_dir.mkdir(parents=True, exist_ok=True)
+            # Write under a temporary name so readers never see a partial file
+            tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                _write(load(), tmp, fmt)
+                os.replace(tmp, path)
+            finally:
+                tmp.unlink(missing_ok=True)
+    return str(path)
+
+
+def discard(handle: str) -> None:
+    """Remove every export of ``handle``."""
+    with _handle_lock(handle):
+        for fmt in _SUFFIXES:
+            try:
+                _path(handle, fmt).unlink(missing_ok=True)
+            except KeyError:
+                break
+    with _locks_guard:
+        _handle_locks.pop(handle, None)
@@ -0,0 +1,192 @@
+"""Memory-mapped Arrow IPC storage shared through the OS page cache.
+
+Each dataset is written once to ``<dir>/<handle>.arrow`` and every ``get``
+maps the file and wraps its buffers without copying, so concurrent
+validations and separate worker processes share the same pages. Validation
+results are stored as a JSON summary plus compressed results next to the
+datasets.
+"""
+
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Sequence
+from urllib.parse import parse_qs
+
+import pandas as pd
+import pyarrow as pa
+
+from gx_mcp_server.storage import arrow_codec, exports, result_codec
+
+_MAX_ITEMS = 100
+
+_root: Path | None = None
+_arrow_dtypes = True
+_lock = threading.Lock()
+
+
+def initialize(uri: str) -> None:
+    """Initialize the backend given a URI like arrow:///path/to/dir.
+
+    ``dtype_backend=numpy`` converts to NumPy dtypes on read; numeric columns
+    without nulls are still zero-copy, other columns are copied.
+    """
+    global _root, _arrow_dtypes
+    path, _, query = uri[len("arrow:///") :].partition("?")
+    params = {k: v[-1] for k, v in parse_qs(query).items()}
+    root = Path(path)
+    (root / "results").mkdir(parents=True, exist_ok=True)
+    _root = root
+    _arrow_dtypes = params.get("dtype_backend", "pyarrow") == "pyarrow"
+
+
+def _dir(kind: str = "") -> Path:
+    if _root is None:
+        raise RuntimeError("Arrow mmap backend not initialized")
+    return _root / kind if kind else _root
+
+
+def _path(directory: Path, key: str, suffix: str) -> Path:
+    """Map a handle to its file, rejecting anything that is not a UUID."""
+    try:
+        uuid.UUID(key)
+    except ValueError:
+        raise KeyError(key) from None
+    return directory / f"{key}{suffix}"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _evict(directory: Path, pattern: str) -> list[str]:
+    """Remove the oldest files beyond ``_MAX_ITEMS`` and return their keys."""
+    with _lock:
+        entries = []
+        for p in directory.glob(pattern):
+            try:
+                entries.append((p.stat().st_mtime, p))
+            except FileNotFoundError:
+                continue
+        entries.sort()
+        evicted = entries[: max(0, len(entries) - _MAX_ITEMS)]
+        for _, p in evicted:
+            p.unlink(missing_ok=True)
+    return [p.stem for _, p in evicted]
+
+
+def _expire(directory: Path, pattern: str, cutoff: float) -> list[str]:
+    """Remove files last written before ``cutoff`` and return their keys."""
+    expired = []
+    with _lock:
+        for p in directory.glob(pattern):
+            try:
+                if p.stat().st_mtime >= cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
+            p.unlink(missing_ok=True)
+            expired.append(p.stem)
+    return expired
+
+
+class DataStorage:
+    # Seen by every process, so in-process dedup aliases would go stale
+    shared = True
+
+    @staticmethod
+    def add(df: pd.DataFrame) -> str:
+        handle = str(uuid.uuid4())
+        # Uncompressed so readers can map buffers directly
+        _write_atomic(_path(_dir(), handle, ".arrow"), arrow_codec.encode_dataframe(df))
+        for evicted in _evict(_dir(), "*.arrow"):
+            exports.discard(evicted)
+        return handle
+
+    @staticmethod
+    def get(handle: str, columns: Sequence[str] | None = None) -> pd.DataFrame:
+        try:
+            source = pa.memory_map(str(_path(_dir(), handle, ".arrow")), "r")
+        except FileNotFoundError:
+            raise KeyError(handle) from None
+        table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(list(columns))
+        if _arrow_dtypes:
+            return arrow_codec.table_to_dataframe(table, arrow_dtypes=True)
+        return table.to_pandas(split_blocks=True)
+
+    @staticmethod
+    def contains(handle: str) -> bool:
+        try:
+            return _path(_dir(), handle, ".arrow").exists()
+        except KeyError:
+            return False
+
+    @staticmethod
+    def delete(handle: str) -> None:
+        try:
+            _path(_dir(), handle, ".arrow").unlink(missing_ok=True)
+        except KeyError:
+            pass
+
+    @staticmethod
+    def purge(cutoff: float) -> list[str]:
+        """Remove datasets added before ``cutoff`` and return their handles."""
+        return _expire(_dir(), "*.arrow", cutoff)
+
+
+class ValidationStorage:
+    @staticmethod
+    def add(result: Any) -> str:
+        vid = str(uuid.uuid4())
+        ValidationStorage.set(vid, result)
+        for evicted in _evict(_dir("results"), "*.json"):
+            _path(_dir("results"), evicted, ".json.z").unlink(missing_ok=True)
+        return vid
+
+    @staticmethod
+    def reserve() -> str:
+        return ValidationStorage.add({"status": "pending"})
+
+    @staticmethod
+    def set(vid: str, result: Any) -> None:
+        summary, payload = result_codec.encode(result)
+        payload_path = _path(_dir("results"), vid, ".json.z")
+        # The summary is written last so readers never see it without results
+        if payload is None:
+            payload_path.unlink(missing_ok=True)
+        else:
+            _write_atomic(payload_path, payload)
+        _write_atomic(_path(_dir("results"), vid, ".json"), summary.encode())
+
+    @staticmethod
+    def get(vid: str) -> Any:
+        summary = ValidationStorage._read_summary(vid)
+        try:
+            payload = _path(_dir("results"), vid, ".json.z").read_bytes()
+        except FileNotFoundError:
+            payload = None
+        return result_codec.decode(summary, payload)
+
+    @staticmethod
+    def get_summary(vid: str) -> dict:
+        return result_codec.decode_summary(ValidationStorage._read_summary(vid))
+
+    @staticmethod
+    def purge(cutoff: float) -> list[str]:
+        """Remove results last written before ``cutoff`` and return their IDs."""
+        expired = _expire(_dir("results"), "*.json", cutoff)
+        for vid in expired:
+            _path(_dir("results"), vid, ".json.z").unlink(missing_ok=True)
+        return expired
+
+    @staticmethod
+    def _read_summary(vid: str) -> bytes:
+        try:
+            return _path(_dir("results"), vid, ".json").read_bytes()
+        except FileNotFoundError:
+            raise KeyError(vid) from None
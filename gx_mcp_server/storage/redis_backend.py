@@ -0,0 +1,196 @@
+"""Redis storage shared by every server replica or worker.
+
+Datasets are stored as Arrow IPC blobs and validation results as a hash of
+a JSON summary plus compressed results. Sorted-set indexes ordered by
+insertion time drive count-based eviction. All clients share one
+connection pool and multi-key writes are pipelined into a single round trip.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from typing import Any, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import pandas as pd
+
+from gx_mcp_server.storage import arrow_codec, exports, result_codec
+
+_MAX_ITEMS = 100
+# Query parameters consumed here rather than passed on to redis-py
+_OPTIONS = ("prefix", "format", "compression", "dtype_backend")
+
+_client: Any = None
+_prefix = "gx"
+_format: arrow_codec.DatasetFormat = "arrow"
+_compression: str | None = None
+_arrow_dtypes = False
+
+
+def initialize(uri: str) -> None:
+    """Initialize the backend given a URI like redis://host:6379/0.
+
+    Optional query parameters: ``prefix`` for all keys (default ``gx``),
+    ``format``/``compression`` for dataset blobs and ``dtype_backend=pyarrow``
+    to return Arrow-backed frames. Other parameters (e.g. ``max_connections``)
+    configure the redis-py connection pool.
+    """
+    global _client, _prefix, _format, _compression, _arrow_dtypes
+    try:
+        import redis  # type: ignore[import]
+    except Exception as exc:  # pragma: no cover - optional dependency
+        raise ImportError("redis is required for redis:// storage URIs") from exc
+
+    parts = urlsplit(uri)
+    query = parse_qsl(parts.query)
+    params = {k: v for k, v in query if k in _OPTIONS}
+    fmt = params.get("format", "arrow")
+    if fmt not in ("arrow", "parquet"):
+        raise ValueError(f"Unsupported dataset format: {fmt}")
+    compression = params.get("compression", "none")
+    pool_uri = urlunsplit(
+        parts._replace(query=urlencode([(k, v) for k, v in query if k not in params]))
+    )
+
+    if _client is not None:
+        _client.connection_pool.disconnect()
+    _client = redis.Redis(connection_pool=redis.ConnectionPool.from_url(pool_uri))
+    _prefix = params.get("prefix", "gx")
+    _format = fmt  # type: ignore[assignment]
+    _compression = None if compression == "none" else compression
+    _arrow_dtypes = params.get("dtype_backend") == "pyarrow"
+
+
+def _get_client() -> Any:
+    if _client is None:
+        raise RuntimeError("Redis backend not initialized")
+    return _client
+
+
+def _key(kind: str, key: str = "") -> str:
+    return f"{_prefix}:{kind}:{key}" if key else f"{_prefix}:{kind}:index"
+
+
+def _insert(kind: str, key: str, write: Any) -> list[str]:
+    """Pipeline ``write(pipe)`` with the index update and evict old entries.
+
+    Returns the evicted keys.
+    """
+    client = _get_client()
+    index = _key(kind)
+    pipe = client.pipeline(transaction=False)
+    write(pipe)
+    pipe.zadd(index, {key: time.time()})
+    pipe.zcard(index)
+    count = pipe.execute()[-1]
+    if count <= _MAX_ITEMS:
+        return []
+    evicted = [
+        member.decode() for member, _ in client.zpopmin(index, count - _MAX_ITEMS)
+    ]
+    if evicted:
+        client.delete(*(_key(kind, k) for k in evicted))
+    return evicted
+
+
+def _purge(kind: str, cutoff: float) -> list[str]:
+    """Remove entries indexed before ``cutoff`` and return their keys."""
+    client = _get_client()
+    index = _key(kind)
+    expired = [m.decode() for m in client.zrangebyscore(index, "-inf", f"({cutoff}")]
+    if expired:
+        pipe = client.pipeline(transaction=False)
+        pipe.delete(*(_key(kind, k) for k in expired))
+        pipe.zrem(index, *expired)
+        pipe.execute()
+    return expired
+
+
+class DataStorage:
+    # Seen by every process, so in-process dedup aliases would go stale
+    shared = True
+
+    @staticmethod
+    def add(df: pd.DataFrame) -> str:
+        handle = str(uuid.uuid4())
+        blob = arrow_codec.encode_dataframe(df, _format, _compression)
+        evicted = _insert("ds", handle, lambda p: p.set(_key("ds", handle), blob))
+        for old in evicted:
+            exports.discard(old)
+        return handle
+
+    @staticmethod
+    def get(handle: str, columns: Sequence[str] | None = None) -> pd.DataFrame:
+        blob = _get_client().get(_key("ds", handle))
+        if blob is None:
+            raise KeyError(handle)
+        return arrow_codec.decode_dataframe(blob, columns, _arrow_dtypes)
+
+    @staticmethod
+    def contains(handle: str) -> bool:
+        return bool(_get_client().exists(_key("ds", handle)))
+
+    @staticmethod
+    def delete(handle: str) -> None:
+        pipe = _get_client().pipeline(transaction=False)
+        pipe.delete(_key("ds", handle))
+        pipe.zrem(_key("ds"), handle)
+        pipe.execute()
+
+    @staticmethod
+    def purge(cutoff: float) -> list[str]:
+        """Remove datasets added before ``cutoff`` and return their handles."""
+        return _purge("ds", cutoff)
+
+
+class ValidationStorage:
+    @staticmethod
+    def add(result: Any) -> str:
+        vid = str(uuid.uuid4())
+        mapping = ValidationStorage._encode(result)
+        _insert("res", vid, lambda p: p.hset(_key("res", vid), mapping=mapping))
+        return vid
+
+    @staticmethod
+    def reserve() -> str:
+        """Reserve an ID for an asynchronous validation run."""
+        return ValidationStorage.add({"status": "pending"})
+
+    @staticmethod
+    def set(vid: str, result: Any) -> None:
+        """Store a validation result for a pre-reserved ID."""
+        mapping = ValidationStorage._encode(result)
+
+        def write(pipe: Any) -> None:
+            pipe.delete(_key("res", vid))
+            pipe.hset(_key("res", vid), mapping=mapping)
+
+        _insert("res", vid, write)
+
+    @staticmethod
+    def get(vid: str) -> Any:
+        summary, payload = _get_client().hmget(_key("res", vid), "summary", "data")
+        if summary is None:
+            raise KeyError(vid)
+        return result_codec.decode(summary, payload)
+
+    @staticmethod
+    def get_summary(vid: str) -> dict:
+        summary = _get_client().hget(_key("res", vid), "summary")
+        if summary is None:
+            raise KeyError(vid)
+        return result_codec.decode_summary(summary)
+
+    @staticmethod
+    def purge(cutoff: float) -> list[str]:
+        """Remove results last written before ``cutoff`` and return their IDs."""
+        return _purge("res", cutoff)
+
+    @staticmethod
+    def _encode(result: Any) -> dict[str, Any]:
+        summary, payload = result_codec.encode(result)
+        mapping: dict[str, Any] = {"summary": summary}
+        if payload is not None:
+            mapping["data"] = payload
+        return mapping
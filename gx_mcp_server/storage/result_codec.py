@@ -0,0 +1,40 @@
+"""Compact encoding for validation results.
+
+A result is split into a small JSON summary (everything except the
+per-expectation ``results`` list) and a zlib-compressed JSON payload holding
+that list, so status polls and statistics never decode the full payload.
+"""
+
+import json
+import zlib
+from typing import Any
+
+_COMPRESSION_LEVEL = 6
+
+
+def to_dict(result: Any) -> dict:
+    """Normalize a stored result (dict or GX result object) to a dict."""
+    return result if isinstance(result, dict) else result.to_json_dict()
+
+
+def encode(result: Any) -> tuple[str, bytes | None]:
+    """Return ``(summary_json, compressed_results)`` for ``result``."""
+    data = to_dict(result)
+    summary = {k: v for k, v in data.items() if k != "results"}
+    payload = None
+    if "results" in data:
+        raw = json.dumps(data["results"]).encode("utf-8")
+        payload = zlib.compress(raw, _COMPRESSION_LEVEL)
+    return json.dumps(summary), payload
+
+
+def decode_summary(summary: str | bytes) -> dict:
+    return json.loads(summary)
+
+
+def decode(summary: str | bytes, payload: bytes | None) -> dict:
+    """Rebuild the full result dict from its encoded parts."""
+    data = decode_summary(summary)
+    if payload is not None:
+        data["results"] = json.loads(zlib.decompress(payload))
+    return data
@@ -0,0 +1,318 @@
+"""POSIX shared-memory storage shared by server worker processes on one host.
+
+Each dataset is an uncompressed Arrow IPC file in its own
+``multiprocessing.shared_memory`` segment, and validation results are a JSON
+summary plus compressed results in theirs. A small JSON index per namespace,
+guarded by an ``fcntl`` lock, maps each key to its write time in insertion
+order, so a handle loaded by one worker can be validated by another. Readers
+share the lock and only writers take it exclusively. Reads wrap the mapped
+segment without copying it.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+from urllib.parse import parse_qs
+
+import pandas as pd
+import pyarrow as pa
+
+from gx_mcp_server.storage import arrow_codec, exports, result_codec
+
+_MAX_ITEMS = 100
+_KINDS = {"ds": "d", "res": "r"}
+# Dataset segments: blob length. Result segments: summary and payload lengths.
+_DS_HEADER = struct.Struct("<Q")
+_RES_HEADER = struct.Struct("<QQ")
+
+_namespace = "gx"
+_index_path: Path | None = None
+_arrow_dtypes = True
+# Dataset segments attached by this process, kept open while frames use them
+_attached: dict[str, shared_memory.SharedMemory] = {}
+_retired: list[shared_memory.SharedMemory] = []
+_attach_lock = threading.Lock()
+
+
+def initialize(uri: str) -> None:
+    """Initialize the backend given a URI like shm://namespace.
+
+    Workers using the same namespace share datasets and results. The index
+    lives in ``dir`` (default: the system temp directory) and
+    ``dtype_backend=numpy`` converts to NumPy dtypes on read.
+    """
+    global _namespace, _index_path, _arrow_dtypes
+    namespace, _, query = uri[len("shm://") :].partition("?")
+    namespace = namespace.strip("/") or "gx"
+    if not re.fullmatch(r"[A-Za-z0-9_-]+", namespace):
+        raise ValueError(f"Invalid shared-memory namespace: {namespace}")
+    params = {k: v[-1] for k, v in parse_qs(query).items()}
+    root = Path(params.get("dir", Path(tempfile.gettempdir()) / "gx_mcp_shm"))
+    root.mkdir(parents=True, exist_ok=True)
+    _release_attached()
+    _namespace = namespace
+    _index_path = root / f"{namespace}.json"
+    _arrow_dtypes = params.get("dtype_backend", "pyarrow") == "pyarrow"
+
+
+@contextmanager
+def _index(exclusive: bool = True) -> Iterator[dict[str, dict[str, float]]]:
+    """Yield the shared index under the namespace lock.
+
+    Changes are persisted when ``exclusive``; otherwise the lock is shared
+    with other readers and the index must not be modified.
+    """
+    if _index_path is None:
+        raise RuntimeError("Shared-memory backend not initialized")
+    fd = os.open(f"{_index_path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            index = json.loads(_index_path.read_bytes())
+        except FileNotFoundError:
+            index = {}
+        for kind in _KINDS:
+            index.setdefault(kind, {})
+        before = json.dumps(index)
+        yield index
+        if exclusive and json.dumps(index) != before:
+            tmp = _index_path.with_name(f".{_index_path.name}.tmp")
+            tmp.write_text(json.dumps(index))
+            os.replace(tmp, _index_path)
+    finally:
+        os.close(fd)
+
+
+def _segment_name(kind: str, key: str) -> str:
+    try:
+        return f"{_namespace}_{_KINDS[kind]}_{uuid.UUID(key).hex}"
+    except ValueError:
+        raise KeyError(key) from None
+
+
+def _buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    buf = shm.buf
+    assert buf is not None, f"Segment {shm.name} is closed"
+    return buf
+
+
+def _untrack(shm: shared_memory.SharedMemory) -> None:
+    # Segments must outlive the worker that created or attached them
+    resource_tracker.unregister(getattr(shm, "_name", shm.name), "shared_memory")
+
+
+def _create(kind: str, key: str, header: bytes, *parts: bytes) -> None:
+    size = len(header) + sum(len(p) for p in parts)
+    shm = shared_memory.SharedMemory(_segment_name(kind, key), create=True, size=size)
+    _untrack(shm)
+    buf = _buffer(shm)
+    offset = 0
+    for chunk in (header, *parts):
+        buf[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+    shm.close()
+
+
+def _open(kind: str, key: str, track: bool = False) -> shared_memory.SharedMemory:
+    try:
+        shm = shared_memory.SharedMemory(_segment_name(kind, key))
+    except FileNotFoundError:
+        raise KeyError(key) from None
+    if not track:
+        _untrack(shm)
+    return shm
+
+
+def _unlink(kind: str, key: str) -> None:
+    try:
+        # unlink() unregisters the segment from the resource tracker itself
+        shm = _open(kind, key, track=True)
+    except KeyError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+def _insert(index: dict[str, dict[str, float]], kind: str, key: str) -> list[str]:
+    """Append ``key`` to the index, unlinking entries past ``_MAX_ITEMS``."""
+    keys = index[kind]
+    keys[key] = time.time()
+    evicted = list(keys)[: max(0, len(keys) - _MAX_ITEMS)]
+    for old in evicted:
+        del keys[old]
+        _unlink(kind, old)
+    return evicted
+
+
+def _purge(kind: str, cutoff: float) -> list[str]:
+    """Unlink entries written before ``cutoff`` and return their keys."""
+    with _index() as index:
+        keys = index[kind]
+        expired = [key for key, stamp in keys.items() if stamp < cutoff]
+        for key in expired:
+            del keys[key]
+            _unlink(kind, key)
+    return expired
+
+
+def _close(shm: shared_memory.SharedMemory) -> None:
+    try:
+        shm.close()
+    except BufferError:
+        _retired.append(shm)  # still referenced by a returned frame
+
+
+def _release_attached(live: set[str] | frozenset[str] = frozenset()) -> None:
+    """Close attachments to datasets that are no longer in the index."""
+    with _attach_lock:
+        for handle in [h for h in _attached if h not in live]:
+            _close(_attached.pop(handle))
+        retired = _retired[:]
+        _retired.clear()
+        for shm in retired:
+            _close(shm)
+
+
+class DataStorage:
+    # Seen by every process, so in-process dedup aliases would go stale
+    shared = True
+
+    @staticmethod
+    def add(df: pd.DataFrame) -> str:
+        handle = str(uuid.uuid4())
+        blob = arrow_codec.encode_dataframe(df)
+        _create("ds", handle, _DS_HEADER.pack(len(blob)), blob)
+        with _index() as index:
+            evicted = _insert(index, "ds", handle)
+            live = set(index["ds"])
+        for old in evicted:
+            exports.discard(old)
+        _release_attached(live)
+        return handle
+
+    @staticmethod
+    def get(handle: str, columns: Sequence[str] | None = None) -> pd.DataFrame:
+        with _index(exclusive=False) as index:
+            if handle not in index["ds"]:
+                raise KeyError(handle)
+            with _attach_lock:
+                shm = _attached.get(handle)
+                if shm is None:
+                    shm = _attached[handle] = _open("ds", handle)
+                # Wrapped under the locks: once exported, the mapping cannot
+                # be closed by a concurrent delete in this process
+                (size,) = _DS_HEADER.unpack_from(_buffer(shm))
+                buf = pa.py_buffer(_buffer(shm)).slice(_DS_HEADER.size, size)
+        table = pa.ipc.open_file(buf).read_all()
+        if columns is not None:
+            table = table.select(list(columns))
+        if _arrow_dtypes:
+            return arrow_codec.table_to_dataframe(table, arrow_dtypes=True)
+        return table.to_pandas(split_blocks=True)
+
+    @staticmethod
+    def contains(handle: str) -> bool:
+        with _index(exclusive=False) as index:
+            return handle in index["ds"]
+
+    @staticmethod
+    def delete(handle: str) -> None:
+        with _index() as index:
+            if handle in index["ds"]:
+                del index["ds"][handle]
+                _unlink("ds", handle)
+            live = set(index["ds"])
+        _release_attached(live)
+
+    @staticmethod
+    def purge(cutoff: float) -> list[str]:
+        """Remove datasets added before ``cutoff`` and return their handles."""
+        expired = _purge("ds", cutoff)
+        with _index(exclusive=False) as index:
+            live = set(index["ds"])
+        _release_attached(live)
+        return expired
+
+
+class ValidationStorage:
+    @staticmethod
+    def add(result: Any) -> str:
+        vid = str(uuid.uuid4())
+        ValidationStorage._write(vid, result, new=True)
+        return vid
+
+    @staticmethod
+    def reserve() -> str:
+        return ValidationStorage.add({"status": "pending"})
+
+    @staticmethod
+    def set(vid: str, result: Any) -> None:
+        ValidationStorage._write(vid, result, new=False)
+
+    @staticmethod
+    def get(vid: str) -> Any:
+        return result_codec.decode(*ValidationStorage._read(vid, payload=True))
+
+    @staticmethod
+    def get_summary(vid: str) -> dict:
+        return result_codec.decode_summary(ValidationStorage._read(vid)[0])
+
+    @staticmethod
+    def purge(cutoff: float) -> list[str]:
+        """Remove results last written before ``cutoff`` and return their IDs."""
+        return _purge("res", cutoff)
+
+    @staticmethod
+    def _write(vid: str, result: Any, new: bool) -> None:
+        summary, payload = result_codec.encode(result)
+        data = summary.encode()
+        header = _RES_HEADER.pack(len(data), len(payload or b""))
+        with _index() as index:
+            # Results change size when set, so the segment is replaced
+            if not new and vid in index["res"]:
+                del index["res"][vid]
+                _unlink("res", vid)
+            _create("res", vid, header, data, payload or b"")
+            _insert(index, "res", vid)
+
+    @staticmethod
+    def _read(vid: str, payload: bool = False) -> tuple[bytes, bytes | None]:
+        # Results are small and copied out, so segments are closed right away
+        with _index(exclusive=False) as index:
+            if vid not in index["res"]:
+                raise KeyError(vid)
+            shm = _open("res", vid)
+        try:
+            buf = _buffer(shm)
+            summary_len, payload_len = _RES_HEADER.unpack_from(buf)
+            start = _RES_HEADER.size
+            summary = bytes(buf[start : start + summary_len])
+            data = None
+            if payload and payload_len:
+                start += summary_len
+                data = bytes(buf[start : start + payload_len])
+            return summary, data
+        finally:
+            shm.close()
+
+
+def destroy() -> None:
+    """Unlink every segment in the current namespace and clear its index."""
+    with _index() as index:
+        for kind in _KINDS:
+            for key in index[kind]:
+                _unlink(kind, key)
+            index[kind] = {}
+    _release_attached()
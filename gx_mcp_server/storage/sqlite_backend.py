@@ -2,108 +2,258 @@ import os
 import sqlite3
 import threading
 import uuid
-import pickle
-from typing import Any
+import weakref
+from typing import Any, Sequence
+from urllib.parse import parse_qs
 
 import pandas as pd
 
-_conn: sqlite3.Connection | None = None
+from gx_mcp_server.core import storage
+from gx_mcp_server.storage import arrow_codec, result_codec
+
 _db_path: str | None = None
+# Each thread reads through its own connection; writes are serialized
+_local = threading.local()
+# Open connections of live threads, closed when their thread exits
+_connections: set[sqlite3.Connection] = set()
+_generation = 0
 _lock = threading.Lock()
 _MAX_ITEMS = 100
 
+# Dataset encoding, configurable through the URI query string
+_format: arrow_codec.DatasetFormat = "arrow"
+_compression: str | None = None
+_arrow_dtypes = False
+
+
+def _parse_options(query: str) -> None:
+    global _format, _compression, _arrow_dtypes
+    params = {k: v[-1] for k, v in parse_qs(query).items()}
+    fmt = params.get("format", "arrow")
+    if fmt not in ("arrow", "parquet"):
+        raise ValueError(f"Unsupported dataset format: {fmt}")
+    _format = fmt  # type: ignore[assignment]
+    compression = params.get("compression", "none")
+    _compression = None if compression == "none" else compression
+    _arrow_dtypes = params.get("dtype_backend") == "pyarrow"
+
 
 def initialize(uri: str) -> None:
-    """Initialize the SQLite backend given a URI like sqlite:///path/to/db."""
-    global _conn, _db_path
-    path = uri[len("sqlite:///") :]
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    _db_path = path
-    if _conn is not None:
-        _conn.close()
-    _conn = sqlite3.connect(path, check_same_thread=False)
-    _conn.execute(
-        "CREATE TABLE IF NOT EXISTS datasets (id TEXT PRIMARY KEY, data BLOB, created INTEGER)"
-    )
-    _conn.execute(
-        "CREATE TABLE IF NOT EXISTS validations (id TEXT PRIMARY KEY, data BLOB, created INTEGER)"
-    )
-    _conn.commit()
+    """Initialize the SQLite backend given a URI like sqlite:///path/to/db.
+
+    Optional query parameters control how datasets are stored:
+    ``format`` (``arrow`` or ``parquet``), ``compression`` (e.g. ``zstd``)
+    and ``dtype_backend=pyarrow`` to return Arrow-backed frames, e.g.
+    ``sqlite:///gx.db?format=parquet&compression=zstd``.
+    """
+    global _db_path, _generation
+    path, _, query = uri[len("sqlite:///") :].partition("?")
+    _parse_options(query)
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with _lock:
+        stale = list(_connections)
+        _connections.clear()
+        for conn in stale:
+            conn.close()
+        _db_path = path
+        _generation += 1
+    conn = _get_conn()
+    # Incremental auto-vacuum lets expiry hand freed pages back to the OS.
+    # Switching modes takes a one-off VACUUM (cheap on a new database).
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("VACUUM")
+    with conn:
+        for table in ("datasets", "validations"):
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(id TEXT PRIMARY KEY, data BLOB, created INTEGER)"
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_created ON {table} (created)"
+            )
+        # Databases written before the Arrow encoding hold pickled datasets.
+        # They are dropped rather than unpickled, and read as missing handles.
+        conn.execute(
+            "DELETE FROM datasets WHERE substr(data, 1, ?) != ? "
+            "AND substr(data, 1, ?) != ?",
+            (
+                len(arrow_codec.ARROW_MAGIC),
+                arrow_codec.ARROW_MAGIC,
+                len(arrow_codec.PARQUET_MAGIC),
+                arrow_codec.PARQUET_MAGIC,
+            ),
+        )
+        # Result summaries are kept apart from the compressed per-expectation
+        # results so status polls never decode the full payload
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(validations)")}
+        if "summary" not in columns:
+            conn.execute("ALTER TABLE validations ADD COLUMN summary TEXT")
+        # Every write sets a summary; rows without one hold pickled results
+        # from before the split and read as missing, like legacy datasets
+        conn.execute("DELETE FROM validations WHERE summary IS NULL")
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    # Connections stay on their thread; check_same_thread=False only lets
+    # initialize() close them during reconfiguration.
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class _ThreadConnection:
+    """A thread's connection, closed once the thread's locals are released."""
+
+    def __init__(self, conn: sqlite3.Connection, generation: int) -> None:
+        self.conn = conn
+        self.generation = generation
+        weakref.finalize(self, _release, conn)
+
+
+def _release(conn: sqlite3.Connection) -> None:
+    # May run from garbage collection on any thread, so no lock is taken
+    _connections.discard(conn)
+    conn.close()
 
 
 def _get_conn() -> sqlite3.Connection:
-    if _conn is None:
-        if _db_path is None:
-            raise RuntimeError("SQLite backend not initialized")
-        initialize(f"sqlite:///{_db_path}")
-    assert _conn is not None
-    return _conn
+    """Return this thread's connection, opening it on first use."""
+    holder = getattr(_local, "holder", None)
+    if holder is not None and holder.generation == _generation:
+        return holder.conn
+    if _db_path is None:
+        raise RuntimeError("SQLite backend not initialized")
+    conn = _connect(_db_path)
+    with _lock:
+        _connections.add(conn)
+    _local.holder = _ThreadConnection(conn, _generation)
+    return conn
+
+
+def _insert(table: str, key: str, values: dict[str, Any]) -> list[str]:
+    """Insert a row and evict the oldest beyond ``_MAX_ITEMS`` in one commit.
+
+    Returns the evicted ids.
+    """
+    columns = "".join(f"{name}, " for name in values)
+    marks = "?, " * len(values)
+    conn = _get_conn()
+    with _lock, conn:
+        conn.execute(
+            f"INSERT INTO {table} (id, {columns}created) "
+            f"VALUES (?, {marks}strftime('%s','now'))",
+            (key, *values.values()),
+        )
+        rows = conn.execute(
+            f"DELETE FROM {table} WHERE id IN (SELECT id FROM {table} "
+            "ORDER BY created DESC, rowid DESC LIMIT -1 OFFSET ?) RETURNING id",
+            (_MAX_ITEMS,),
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+def _select(table: str, key: str, column: str = "data") -> Any:
+    row = (
+        _get_conn()
+        .execute(f"SELECT {column} FROM {table} WHERE id=?", (key,))
+        .fetchone()
+    )
+    if row is None:
+        raise KeyError(key)
+    return row[0] if len(row) == 1 else row
+
+
+def _purge(table: str, cutoff: float) -> list[str]:
+    """Delete rows written before ``cutoff`` and release their pages."""
+    conn = _get_conn()
+    with _lock, conn:
+        rows = conn.execute(
+            f"DELETE FROM {table} WHERE created < ? RETURNING id", (int(cutoff),)
+        ).fetchall()
+    if rows:
+        with _lock:
+            # executescript steps the pragma to completion; execute() would
+            # free a single page
+            conn.executescript("PRAGMA incremental_vacuum")
+    return [row[0] for row in rows]
 
 
 class DataStorage:
     @staticmethod
     def add(df: pd.DataFrame) -> str:
         handle = str(uuid.uuid4())
-        blob = pickle.dumps(df)
-        with _lock:
-            conn = _get_conn()
-            conn.execute(
-                "INSERT INTO datasets (id, data, created) VALUES (?, ?, strftime('%s','now'))",
-                (handle, blob),
-            )
-            conn.commit()
-            count = conn.execute("SELECT COUNT(*) FROM datasets").fetchone()[0]
-            if count > _MAX_ITEMS:
-                to_delete = conn.execute(
-                    "SELECT id FROM datasets ORDER BY created ASC LIMIT ?",
-                    (count - _MAX_ITEMS,),
-                ).fetchall()
-                conn.executemany("DELETE FROM datasets WHERE id = ?", to_delete)
-                conn.commit()
+        blob = arrow_codec.encode_dataframe(df, _format, _compression)
+        for evicted in _insert("datasets", handle, {"data": blob}):
+            storage.dataset_dropped(evicted)
         return handle
 
     @staticmethod
-    def get(handle: str) -> pd.DataFrame:
+    def get(handle: str, columns: Sequence[str] | None = None) -> pd.DataFrame:
+        blob = _select("datasets", handle)
+        return arrow_codec.decode_dataframe(blob, columns, _arrow_dtypes)
+
+    @staticmethod
+    def contains(handle: str) -> bool:
+        row = (
+            _get_conn()
+            .execute("SELECT 1 FROM datasets WHERE id=?", (handle,))
+            .fetchone()
+        )
+        return row is not None
+
+    @staticmethod
+    def delete(handle: str) -> None:
         conn = _get_conn()
-        row = conn.execute("SELECT data FROM datasets WHERE id=?", (handle,)).fetchone()
-        if row is None:
-            raise KeyError(handle)
-        return pickle.loads(row[0])
+        with _lock, conn:
+            conn.execute("DELETE FROM datasets WHERE id=?", (handle,))
 
     @staticmethod
-    def get_handle_path(handle: str) -> str:
-        df = DataStorage.get(handle)
-        path = f"/tmp/{handle}.csv"
-        df.to_csv(path, index=False)
-        return path
+    def purge(cutoff: float) -> list[str]:
+        """Remove datasets added before ``cutoff`` and return their handles."""
+        return _purge("datasets", cutoff)
 
 
 class ValidationStorage:
     @staticmethod
     def add(result: Any) -> str:
         vid = str(uuid.uuid4())
-        blob = pickle.dumps(result)
-        with _lock:
-            conn = _get_conn()
-            conn.execute(
-                "INSERT INTO validations (id, data, created) VALUES (?, ?, strftime('%s','now'))",
-                (vid, blob),
-            )
-            conn.commit()
-            count = conn.execute("SELECT COUNT(*) FROM validations").fetchone()[0]
-            if count > _MAX_ITEMS:
-                to_delete = conn.execute(
-                    "SELECT id FROM validations ORDER BY created ASC LIMIT ?",
-                    (count - _MAX_ITEMS,),
-                ).fetchall()
-                conn.executemany("DELETE FROM validations WHERE id = ?", to_delete)
-                conn.commit()
+        summary, payload = result_codec.encode(result)
+        _insert("validations", vid, {"summary": summary, "data": payload})
         return vid
 
     @staticmethod
-    def get(vid: str) -> Any:
+    def reserve() -> str:
+        """Reserve an ID for an asynchronous validation run."""
+        return ValidationStorage.add({"status": "pending"})
+
+    @staticmethod
+    def set(vid: str, result: Any) -> None:
+        """Store a validation result for a pre-reserved ID."""
+        summary, payload = result_codec.encode(result)
         conn = _get_conn()
-        row = conn.execute("SELECT data FROM validations WHERE id=?", (vid,)).fetchone()
-        if row is None:
-            raise KeyError(vid)
-        return pickle.loads(row[0])
+        with _lock, conn:
+            updated = conn.execute(
+                "UPDATE validations SET summary=?, data=?, "
+                "created=strftime('%s','now') WHERE id=?",
+                (summary, payload, vid),
+            ).rowcount
+        if not updated:
+            _insert("validations", vid, {"summary": summary, "data": payload})
+
+    @staticmethod
+    def get(vid: str) -> Any:
+        summary, payload = _select("validations", vid, "summary, data")
+        return result_codec.decode(summary, payload)
+
+    @staticmethod
+    def get_summary(vid: str) -> dict:
+        """Return the result without its per-expectation ``results``."""
+        return result_codec.decode_summary(_select("validations", vid, "summary"))
+
+    @staticmethod
+    def purge(cutoff: float) -> list[str]:
+        """Remove results last written before ``cutoff`` and return their IDs."""
+        return _purge("validations", cutoff)
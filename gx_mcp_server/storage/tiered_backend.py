@@ -0,0 +1,215 @@
+"""Two-tier dataset storage: a RAM hot tier that spills to local disk.
+
+Datasets evicted from the hot tier are written once to
+``<spill_dir>/<handle>.arrow`` (or ``.parquet``) and paged back in on access, so handles outlive the memory budget.
+Validation results are kept in memory.
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Sequence
+from urllib.parse import parse_qs
+
+import pandas as pd
+
+from gx_mcp_server.core import storage
+from gx_mcp_server.logging import logger
+from gx_mcp_server.storage import arrow_codec
+
+_MAX_HOT_ITEMS = 100
+_MAX_SPILLED_ITEMS = 10_000
+_SUFFIXES = {"arrow": ".arrow", "parquet": ".parquet"}
+
+_spill_dir: Path | None = None
+_format: arrow_codec.DatasetFormat = "arrow"
+_compression: str | None = None
+_max_bytes: int | None = None
+
+_hot: OrderedDict[str, pd.DataFrame] = OrderedDict()
+_hot_sizes: dict[str, int] = {}
+_hot_bytes = 0
+# Spill files on disk by handle, least recently spilled first
+_spilled: OrderedDict[str, Path] = OrderedDict()
+# Evicted datasets whose spill file is still being written
+_spilling: dict[str, pd.DataFrame] = {}
+# When each handle was written, in either tier, for expiry
+_written: dict[str, float] = {}
+_lock = threading.Lock()
+
+
+def initialize(uri: str) -> None:
+    """Initialize the backend given a URI like tiered:///path/to/spill.
+
+    Optional query parameters: ``max_bytes`` (hot tier byte budget, default is
+    a count cap of ``_MAX_HOT_ITEMS``), ``format`` and ``compression`` for the
+    spill files. Spill files left by a previous process are picked up again.
+    """
+    global _spill_dir, _format, _compression, _max_bytes, _hot_bytes
+    path, _, query = uri[len("tiered:///") :].partition("?")
+    params = {k: v[-1] for k, v in parse_qs(query).items()}
+    fmt = params.get("format", "arrow")
+    if fmt not in ("arrow", "parquet"):
+        raise ValueError(f"Unsupported dataset format: {fmt}")
+    compression = params.get("compression", "none")
+
+    spill_dir = Path(path)
+    spill_dir.mkdir(parents=True, exist_ok=True)
+    existing = sorted(
+        (p.stat().st_mtime, p)
+        for suffix in _SUFFIXES.values()
+        for p in spill_dir.glob(f"*{suffix}")
+    )
+    with _lock:
+        _spill_dir = spill_dir
+        _format = fmt  # type: ignore[assignment]
+        _compression = None if compression == "none" else compression
+        _max_bytes = int(params["max_bytes"]) if "max_bytes" in params else None
+        _hot.clear()
+        _hot_sizes.clear()
+        _hot_bytes = 0
+        _spilled.clear()
+        _spilling.clear()
+        _written.clear()
+        for mtime, p in existing:
+            _spilled[p.stem] = p
+            _written[p.stem] = mtime
+
+
+def _spill_path(handle: str) -> Path:
+    if _spill_dir is None:
+        raise RuntimeError("Tiered backend not initialized")
+    return _spill_dir / f"{handle}{_SUFFIXES[_format]}"
+
+
+def _over_budget() -> bool:
+    if _max_bytes is not None:
+        return _hot_bytes > _max_bytes
+    return len(_hot) > _MAX_HOT_ITEMS
+
+
+def _put_hot(handle: str, df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """Insert into the hot tier and return evicted datasets needing a spill file.
+
+    Must be called with ``_lock`` held.
+    """
+    global _hot_bytes
+    if handle in _hot:
+        _hot.move_to_end(handle)
+        return {}
+    size = int(df.memory_usage(deep=True).sum())
+    _hot[handle] = df
+    _hot_sizes[handle] = size
+    _hot_bytes += size
+    to_spill: dict[str, pd.DataFrame] = {}
+    while len(_hot) > 1 and _over_budget():
+        victim, victim_df = _hot.popitem(last=False)
+        _hot_bytes -= _hot_sizes.pop(victim, 0)
+        # Datasets are immutable, so an existing spill file is still valid
+        if victim not in _spilled:
+            _spilling[victim] = victim_df
+            to_spill[victim] = victim_df
+    return to_spill
+
+
+def _spill(to_spill: dict[str, pd.DataFrame]) -> None:
+    """Write evicted datasets to disk outside of the lock."""
+    for handle, df in to_spill.items():
+        path = _spill_path(handle)
+        tmp = path.with_suffix(".tmp")
+        written = False
+        try:
+            tmp.write_bytes(arrow_codec.encode_dataframe(df, _format, _compression))
+            os.replace(tmp, path)
+            written = True
+            logger.debug("Spilled dataset %s to %s", handle, path)
+        except Exception:
+            # The dataset has already left the hot tier, so it is lost
+            logger.exception("Failed to spill dataset %s", handle)
+            tmp.unlink(missing_ok=True)
+        finally:
+            expired: list[tuple[str, Path]] = []
+            with _lock:
+                if _spilling.pop(handle, None) is None or not written:
+                    # Deleted while the spill file was being written, or failed
+                    _written.pop(handle, None)
+                    expired.append((handle, path))
+                else:
+                    _spilled[handle] = path
+                while len(_spilled) > _MAX_SPILLED_ITEMS:
+                    victim, victim_path = _spilled.popitem(last=False)
+                    _hot_remove(victim)
+                    _written.pop(victim, None)
+                    expired.append((victim, victim_path))
+            for victim, victim_path in expired:
+                victim_path.unlink(missing_ok=True)
+                storage.dataset_dropped(victim)
+
+
+def _hot_remove(handle: str) -> None:
+    global _hot_bytes
+    if _hot.pop(handle, None) is not None:
+        _hot_bytes -= _hot_sizes.pop(handle, 0)
+
+
+class DataStorage:
+    @staticmethod
+    def add(df: pd.DataFrame) -> str:
+        handle = str(uuid.uuid4())
+        with _lock:
+            _written[handle] = time.time()
+            to_spill = _put_hot(handle, df)
+        _spill(to_spill)
+        return handle
+
+    @staticmethod
+    def get(handle: str, columns: Sequence[str] | None = None) -> pd.DataFrame:
+        with _lock:
+            df = _hot.get(handle)
+            if df is not None:
+                _hot.move_to_end(handle)
+            else:
+                df = _spilling.get(handle)
+                path = _spilled.get(handle)
+                if df is None and path is None:
+                    raise KeyError(handle)
+        if df is None:
+            try:
+                blob = path.read_bytes()  # type: ignore[union-attr]
+            except FileNotFoundError:
+                raise KeyError(handle) from None
+            if columns is not None:
+                # Partial reads are served from disk without promotion
+                return arrow_codec.decode_dataframe(blob, columns)
+            df = arrow_codec.decode_dataframe(blob)
+            with _lock:
+                to_spill = _put_hot(handle, df)
+            _spill(to_spill)
+        return df if columns is None else df[list(columns)]
+
+    @staticmethod
+    def contains(handle: str) -> bool:
+        with _lock:
+            return handle in _hot or handle in _spilling or handle in _spilled
+
+    @staticmethod
+    def delete(handle: str) -> None:
+        with _lock:
+            _hot_remove(handle)
+            _spilling.pop(handle, None)
+            _written.pop(handle, None)
+            path = _spilled.pop(handle, None)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def purge(cutoff: float) -> list[str]:
+        """Remove datasets added before ``cutoff`` from both tiers."""
+        with _lock:
+            expired = [h for h, written in _written.items() if written < cutoff]
+        for handle in expired:
+            DataStorage.delete(handle)
+        return expired
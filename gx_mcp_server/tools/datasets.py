@@ -1,8 +1,9 @@
 # gx_mcp_server/tools/datasets.py
+import glob
 import io
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
 
 import pandas as pd
 
@@ -18,12 +19,26 @@ from gx_mcp_server.connectors import bigquery as bigquery_conn
 from gx_mcp_server.connectors import snowflake as snowflake_conn
 
 from gx_mcp_server.logging import logger
-from gx_mcp_server.core import schema, storage
+from gx_mcp_server.core import (
+    downcast,
+    http_fetch,
+    ingest,
+    offload,
+    predicates,
+    schema,
+    storage,
+)
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
 
+# ``engine="auto"`` reads files of at least max(1 MB, 32 MB / cores) with
+# pyarrow; smaller ones keep pandas and its NumPy dtypes
+_PYARROW_MIN_BYTES = 1024 * 1024
+_PYARROW_BYTES_PER_CORE = 32 * 1024 * 1024
+
+
 def get_csv_size_limit_bytes() -> int:
     """
     Get CSV size limit in bytes from the environment, defaulting to 50MB.
@@ -41,133 +56,452 @@ def get_csv_size_limit_bytes() -> int:
     return mb * 1024 * 1024
 
 
+def get_decompressed_size_limit_bytes() -> int:
+    """
+    Get the decompressed size limit for compressed sources in bytes from the
+    environment, defaulting to 10x the CSV size limit.
+    Limits to range [1, 10240] MB.
+    """
+    default_mb = 10 * get_csv_size_limit_bytes() // (1024 * 1024)
+    min_mb, max_mb = 1, 10240
+    value = os.getenv("MCP_DECOMPRESSED_SIZE_LIMIT_MB")
+    try:
+        mb = int(value) if value else default_mb
+        if mb < min_mb or mb > max_mb:
+            mb = default_mb
+    except Exception:
+        mb = default_mb
+    return mb * 1024 * 1024
+
+
+def _expand_files(source: str) -> Optional[List[Path]]:
+    """Return the files of a directory or glob source, or ``None`` for one file.
+
+    Directories contribute their data files (known extensions, not hidden or
+    ``_``-prefixed markers such as ``_SUCCESS``); globs may use ``**``.
+    """
+    path = Path(source)
+    if path.is_dir():
+        return sorted(
+            p
+            for p in path.iterdir()
+            if p.is_file()
+            and not p.name.startswith((".", "_"))
+            and ingest.has_known_extension(p.name)
+        )
+    if not path.exists() and glob.has_magic(source):
+        return sorted(
+            Path(p) for p in glob.glob(source, recursive=True) if Path(p).is_file()
+        )
+    return None
+
+
+class _SourceRejected(Exception):
+    """A source refused before or while reading it (size limit, bad scheme)."""
+
+
+def _check_source(source: str, source_type: str, limit_bytes: int) -> None:
+    """Apply the checks that need no full read of ``source``."""
+    limit_mb = limit_bytes // (1024 * 1024)
+    if source.startswith(("snowflake://", "bigquery://")):
+        return
+    # Reject large inline payloads
+    if source_type == "inline" and len(source.encode("utf-8")) > limit_bytes:
+        logger.warning(
+            "Inline CSV too large: %d bytes (limit: %d MB)", len(source), limit_mb
+        )
+        raise _SourceRejected(f"Inline CSV exceeds {limit_mb} MB limit")
+    if source_type == "file":
+        path = Path(source)
+        files = _expand_files(source)
+        if files is not None:
+            if not files:
+                raise _SourceRejected(f"No data files match {source}")
+            total = sum(f.stat().st_size for f in files)
+            if total > limit_bytes:
+                logger.warning(
+                    "Local files too large: %d bytes in %d files (limit: %d MB)",
+                    total,
+                    len(files),
+                    limit_mb,
+                )
+                raise _SourceRejected(f"Local files exceed {limit_mb} MB limit")
+        elif path.is_file() and path.stat().st_size > limit_bytes:
+            logger.warning(
+                "Local CSV too large: %d bytes (limit: %d MB)",
+                path.stat().st_size,
+                limit_mb,
+            )
+            raise _SourceRejected(f"Local CSV exceeds {limit_mb} MB limit")
+    elif source_type == "url":
+        from urllib.parse import urlparse
+
+        if urlparse(source).scheme not in {"http", "https"}:
+            raise _SourceRejected("Only http(s) URLs are allowed")
+    elif source_type != "inline":
+        logger.error("Unknown source_type: %s", source_type)
+        raise _SourceRejected(f"Unknown source_type: {source_type}")
+
+
+def _choose_engine(
+    engine: Optional[str], use_polars: bool, size_bytes: Optional[int] = None
+) -> str:
+    """Resolve the CSV engine; "auto" weighs the file size against the cores."""
+    if engine is None:
+        return "polars" if use_polars else "pandas"
+    if engine != "auto":
+        return engine
+    # Arrow's reader parses blocks of the input on all cores, so the more
+    # cores the smaller the file that is worth switching dtype families for
+    cores = os.cpu_count() or 1
+    threshold = max(_PYARROW_MIN_BYTES, _PYARROW_BYTES_PER_CORE // cores)
+    if size_bytes is not None and size_bytes >= threshold:
+        return "pyarrow"
+    return "pandas"
+
+
+def _scan_csv_polars(
+    paths: "Path | List[Path]",
+    columns: Optional[List[str]],
+    max_rows: Optional[int],
+    filters: Optional[List[Any]] = None,
+) -> "pl.DataFrame":
+    scan = pl.scan_csv(paths)
+    dnf = predicates.normalize(filters)
+    if dnf is not None:
+        # Pushed into the scan, so rows are dropped as they are parsed
+        scan = scan.filter(predicates.to_polars(dnf))
+    if columns is not None:
+        scan = scan.select(columns)
+    if max_rows is not None:
+        scan = scan.head(max_rows)
+    return scan.collect()
+
+
+def _read_source(
+    source: str,
+    source_type: str,
+    limit_bytes: int,
+    max_rows: Optional[int] = None,
+    use_polars: bool = False,
+    source_format: str = "auto",
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[List[Any]]] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+    dtype_backend: Optional[Literal["numpy_nullable", "pyarrow"]] = None,
+    sample: Optional[schema.SampleOptions] = None,
+    engine: Optional[str] = None,
+) -> "pd.DataFrame | pl.DataFrame":
+    """Read a source that passed :func:`_check_source` into a frame.
+
+    Polars CSV file reads without dtype options return a Polars frame, which
+    storage keeps natively where the backend supports it.
+    """
+    limit_mb = limit_bytes // (1024 * 1024)
+    inflated_limit_bytes = get_decompressed_size_limit_bytes()
+    if source.startswith("snowflake://"):
+        return snowflake_conn.load(source)
+    if source.startswith("bigquery://"):
+        return bigquery_conn.load(source)
+
+    fmt = ingest.normalize_format(source_format)
+    if source_type == "file":
+        files = _expand_files(source)
+        paths = files if files is not None else [Path(source)]
+        engine = _choose_engine(
+            engine, use_polars, sum(p.stat().st_size for p in paths)
+        )
+        polars_csv = (
+            engine == "polars"
+            and HAS_POLARS
+            and dtypes is None
+            and dtype_backend is None
+            and sample is None
+        )
+        csv_engine: ingest.CsvEngine = "pyarrow" if engine == "pyarrow" else "pandas"
+        if files is not None:
+            if polars_csv and all(
+                (ingest.detect_file_format(f) if fmt == "auto" else fmt) == "csv"
+                and ingest.file_compression(f) is None
+                for f in files
+            ):
+                return _scan_csv_polars(files, columns, max_rows, filters)
+            # Parsed in parallel and concatenated into one frame
+            return ingest.read_files(
+                files,
+                fmt,
+                max_rows,
+                columns,
+                filters,
+                dtypes,
+                dtype_backend or ("pyarrow" if engine == "pyarrow" else None),
+                limit_bytes=inflated_limit_bytes,
+                sample=sample,
+            )
+        path = Path(source)
+        compression = ingest.file_compression(path)
+        if compression is not None:
+            # Inflated while parsing, never written out or held whole
+            with open(path, "rb") as raw:
+                stream = ingest.decompressed_stream(
+                    raw, compression, inflated_limit_bytes
+                )
+                if fmt == "auto":
+                    fmt = ingest.detect_format(source, stream.peek(8)[:8])
+                return ingest.read_frame(
+                    stream,
+                    fmt,
+                    max_rows,
+                    columns,
+                    filters,
+                    dtypes,
+                    dtype_backend,
+                    sample,
+                    csv_engine,
+                )
+        if fmt == "auto":
+            fmt = ingest.detect_file_format(path)
+        if fmt == "csv" and polars_csv:
+            return _scan_csv_polars(path, columns, max_rows, filters)
+        return ingest.read_frame(
+            path,
+            fmt,
+            max_rows,
+            columns,
+            filters,
+            dtypes,
+            dtype_backend,
+            sample,
+            csv_engine,
+        )
+    if source_type == "url":
+        csv_engine = (
+            "pyarrow" if _choose_engine(engine, False) == "pyarrow" else "pandas"
+        )
+        options = {
+            "source_format": fmt,
+            "max_rows": max_rows,
+            "columns": columns,
+            "filters": filters,
+            "dtypes": dtypes,
+            "dtype_backend": dtype_backend,
+            "sample": sample.model_dump() if sample is not None else None,
+            "engine": csv_engine,
+        }
+        # Parse while downloading so memory stays flat and oversized bodies
+        # are cut off at the limit; unchanged bodies come from the cache
+        try:
+            with http_fetch.open_url(source, limit_bytes) as download:
+                if download.not_modified and download.version is not None:
+                    cached = http_fetch.load_frame(source, download.version, options)
+                    if cached is not None:
+                        logger.info("Using cached frame for unchanged %s", source)
+                        return cached
+                stream = ingest.maybe_decompress(
+                    download.stream, source, inflated_limit_bytes
+                )
+                if fmt == "auto":
+                    fmt = ingest.detect_format(source, stream.peek(8)[:8])
+                df = ingest.read_frame(
+                    stream,
+                    fmt,
+                    max_rows,
+                    columns,
+                    filters,
+                    dtypes,
+                    dtype_backend,
+                    sample,
+                    csv_engine,
+                )
+        except ingest.DecompressedSizeLimitExceeded:
+            raise
+        except ingest.SizeLimitExceeded:
+            logger.warning("Remote CSV exceeds %d MB limit", limit_mb)
+            raise _SourceRejected(f"Remote CSV exceeds {limit_mb} MB limit") from None
+        if download.version is not None:
+            http_fetch.store_frame(source, download.version, options, df)
+        return df
+
+    # Inline: CSV or JSON Lines text, or base64-encoded Parquet/Arrow
+    data = ingest.decode_inline(source, fmt)
+    if data is not None:
+        if fmt == "auto":
+            fmt = ingest.detect_format(None, data[:8])
+        return ingest.read_frame(
+            data, fmt, max_rows, columns, filters, dtypes, dtype_backend, sample
+        )
+    if fmt == "auto":
+        fmt = ingest.detect_format(None, source[:64].encode("utf-8"))
+    csv_engine = (
+        "pyarrow"
+        if _choose_engine(engine, False, len(source)) == "pyarrow"
+        else "pandas"
+    )
+    text: Any = io.StringIO(source)
+    if csv_engine == "pyarrow":
+        text = source.encode("utf-8")  # Arrow's CSV reader takes bytes
+    return ingest.read_frame(
+        text,
+        fmt,
+        max_rows,
+        columns,
+        filters,
+        dtypes,
+        dtype_backend,
+        sample,
+        csv_engine,
+    )
+
+
 def load_dataset(
     source: str,
     source_type: Literal["file", "url", "inline"] = "file",
     max_rows: Optional[int] = None,
     use_polars: bool = False,
+    lazy: bool = False,
+    source_format: Literal[
+        "auto", "csv", "parquet", "arrow", "feather", "jsonl"
+    ] = "auto",
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[List[Any]]] = None,
+    filter: Optional[str] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+    dtype_backend: Optional[Literal["numpy_nullable", "pyarrow"]] = None,
+    optimize: bool = False,
+    sample: Optional[schema.SampleOptions] = None,
+    engine: Optional[Literal["auto", "pandas", "pyarrow", "polars"]] = None,
 ) -> schema.DatasetHandle | dict:
-    """Load data (CSV string, URL, or local file) into memory and return a handle.
+    """Load a dataset (CSV, Parquet, Arrow/Feather or JSON Lines) and return a handle.
 
     Args:
-        source: Path to file, URL, or inline CSV string
-        source_type: Type of source - "file", "url", or "inline"
-
-    Args:
-        source: Path to file, URL, or inline CSV string
+        source: Path to a file, directory or glob pattern (e.g.
+            ``data/2024-*.csv``, read in parallel into one dataset), URL, or
+            inline data (CSV/JSON Lines text, or base64-encoded Parquet/Arrow)
         source_type: Type of source - "file", "url", or "inline"
         max_rows: Maximum rows to read (None for all)
-        use_polars: Use ``polars.scan_csv`` for reading if available
+        use_polars: Use ``polars.scan_csv`` for reading CSV files if
+            available; same as ``engine="polars"``
+        lazy: Only check that the source is accessible and defer reading it
+            until the dataset is first used, e.g. by ``run_checkpoint``.
+            Storage backends shared between processes read it at once
+        source_format: Data format; "auto" detects it from the file extension
+            or the leading magic bytes
+        columns: Only load these columns
+        filters: Row filters as ``[column, op, value]`` triples, all of
+            which must hold; Parquet row groups that cannot match are
+            skipped and text sources are filtered while they are parsed.
+            ``max_rows`` then counts matching rows
+        filter: Row filter expression combined with ``filters``, e.g.
+            ``"country == 'US' and ts >= '2024-01-01'"``; supports
+            comparisons of a column with a literal, ``in``/``not in`` a
+            list, ``and``, ``or`` and parentheses
+        dtypes: Column dtypes such as ``{"id": "int32", "state": "category"}``;
+            CSV and JSON Lines columns listed here skip type inference
+        dtype_backend: "numpy_nullable" or "pyarrow" to load into pandas
+            nullable or Arrow-backed dtypes
+        optimize: Shrink the frame after loading: low-cardinality strings
+            become categoricals, numbers are downcast where no value changes.
+            The response reports ``memory_bytes`` and ``memory_saved_bytes``
+        sample: Load a seeded random sample taken in one pass over the source,
+            e.g. ``{"method": "reservoir", "size": 10000}``,
+            ``{"method": "bernoulli", "fraction": 0.01}`` or
+            ``{"method": "stratified", "column": "region", "size": 500}``;
+            ``max_rows`` then caps the rows scanned
+        engine: CSV parser for file, URL and inline sources: "pandas" (the
+            default), "pyarrow" (multithreaded, Arrow-backed dtypes), "polars"
+            (files only) or "auto", which picks pyarrow for local files and
+            inline text of at least 32 MB divided by the core count (1 MB
+            minimum), else pandas
 
     Returns:
         DatasetHandle: Handle to the loaded dataset for use in other tools
 
     Examples:
         - File: load_dataset("/path/to/data.csv", "file")
+        - Partitions: load_dataset("data/2024-*.csv", "file")
+        - Compressed: load_dataset("/exports/day.csv.zst", "file")
+        - Parquet: load_dataset("/path/to/data.parquet", columns=["id"],
+          filters=[["year", ">=", 2020]])
+        - Filtered: load_dataset("/exports/orders.csv", columns=["id", "total"],
+          filter="country == 'US' and ts >= '2024-01-01'")
         - URL: load_dataset("https://example.com/data.csv", "url")
         - Inline: load_dataset("x,y\\n1,2\\n3,4", "inline")
     """
     logger.info(
-        "Called load_dataset(source_type=%s, max_rows=%s, use_polars=%s)",
+        "Called load_dataset(source_type=%s, source_format=%s, max_rows=%s, "
+        "use_polars=%s, engine=%s, lazy=%s)",
         source_type,
+        source_format,
         max_rows,
         use_polars,
+        engine,
+        lazy,
     )
-    LIMIT_BYTES = get_csv_size_limit_bytes()
-    limit_mb = LIMIT_BYTES // (1024 * 1024)
+    limit_bytes = get_csv_size_limit_bytes()
+    if isinstance(sample, dict):
+        try:
+            sample = schema.SampleOptions.model_validate(sample)
+        except ValueError as e:
+            return {"error": f"Invalid sample options: {e}"}
+    if filter is not None:
+        try:
+            filters = predicates.combine(filters, predicates.parse(filter))
+        except ValueError as e:
+            return {"error": f"Invalid filter: {e}"}
+    read_options: dict[str, Any] = {
+        "max_rows": max_rows,
+        "use_polars": use_polars,
+        "source_format": source_format,
+        "columns": columns,
+        "filters": filters,
+        "dtypes": dtypes,
+        "dtype_backend": dtype_backend,
+        "sample": sample,
+        "engine": engine,
+    }
     try:
-        if source.startswith("snowflake://"):
-            df = snowflake_conn.load(source)
-            handle = storage.DataStorage.add(df)
-            logger.info(
-                "Loaded dataset from Snowflake handle=%s (shape=%s)",
-                handle,
-                df.shape,
-            )
-            return schema.DatasetHandle(handle=handle)
-        if source.startswith("bigquery://"):
-            df = bigquery_conn.load(source)
-            handle = storage.DataStorage.add(df)
-            logger.info(
-                "Loaded dataset from BigQuery handle=%s (shape=%s)",
-                handle,
-                df.shape,
-            )
+        _check_source(source, source_type, limit_bytes)
+        if lazy:
+            if (
+                source_type == "file"
+                and not source.startswith(("snowflake://", "bigquery://"))
+                and _expand_files(source) is None
+            ):
+                # Fail now on missing or unreadable files
+                with open(source, "rb"):
+                    pass
+
+            def load() -> "pd.DataFrame | pl.DataFrame":
+                # The source may have changed since it was registered
+                _check_source(source, source_type, limit_bytes)
+                df = _read_source(source, source_type, limit_bytes, **read_options)
+                return downcast.optimize(df) if optimize else df
+
+            handle = storage.DataStorage.add_lazy(load)
+            logger.info("Registered lazy dataset handle=%s", handle)
             return schema.DatasetHandle(handle=handle)
-        # Reject large inline payloads
-        if source_type == "inline" and len(source.encode("utf-8")) > LIMIT_BYTES:
-            logger.warning(
-                "Inline CSV too large: %d bytes (limit: %d MB)", len(source), limit_mb
-            )
-            return {"error": f"Inline CSV exceeds {limit_mb} MB limit"}
-
-        if source_type == "file":
-            path = Path(source)
-            if path.is_file():
-                if path.stat().st_size > LIMIT_BYTES:
-                    logger.warning(
-                        "Local CSV too large: %d bytes (limit: %d MB)",
-                        path.stat().st_size,
-                        limit_mb,
-                    )
-                    return {"error": f"Local CSV exceeds {limit_mb} MB limit"}
-            if use_polars and HAS_POLARS:
-                scan = pl.scan_csv(path)
-                if max_rows is not None:
-                    pl_df = scan.fetch(max_rows)
-                else:
-                    pl_df = scan.collect()
-                df = pl_df.to_pandas()
-            else:
-                df = pd.read_csv(path, nrows=max_rows)
-        elif source_type == "url":
-            import requests  # type: ignore[import]
-            from urllib.parse import urlparse
-
-            parsed = urlparse(source)
-            if parsed.scheme not in {"http", "https"}:
-                return {"error": "Only http(s) URLs are allowed"}
-
-            resp = requests.get(source, timeout=30, stream=True)
-            resp.raise_for_status()
-            # Enforce Content-Length if provided
-            size = int(resp.headers.get("Content-Length", 0))
-            if size > LIMIT_BYTES:
-                logger.warning(
-                    "Remote CSV too large: %d bytes (limit: %d MB)", size, limit_mb
-                )
-                return {"error": f"Remote CSV exceeds {limit_mb} MB limit"}
-            if size == 0:
-                # Stream download up to limit
-                chunks = []
-                total = 0
-                for chunk in resp.iter_content(chunk_size=8192, decode_unicode=True):
-                    if chunk:
-                        total += len(chunk.encode("utf-8"))
-                        if total > LIMIT_BYTES:
-                            logger.warning(
-                                "Remote CSV streamed exceeds %d MB limit", limit_mb
-                            )
-                            return {"error": f"Remote CSV exceeds {limit_mb} MB limit"}
-                        chunks.append(chunk)
-                txt = "".join(chunks)
-            else:
-                txt = resp.text
-            df = pd.read_csv(io.StringIO(txt), nrows=max_rows)
-        elif source_type == "inline":
-            df = pd.read_csv(io.StringIO(source), nrows=max_rows)
-        else:
-            logger.error("Unknown source_type: %s", source_type)
-            return {"error": f"Unknown source_type: {source_type}"}
 
+        df = _read_source(source, source_type, limit_bytes, **read_options)
+        sizes: dict[str, int] = {}
+        if optimize:
+            before = storage.frame_size(df)
+            df = downcast.optimize(df)
+            sizes["memory_bytes"] = storage.frame_size(df)
+            sizes["memory_saved_bytes"] = before - sizes["memory_bytes"]
         handle = storage.DataStorage.add(df)
         logger.info(
             "Loaded dataset handle=%s (shape=%s, columns=%s)",
             handle,
             df.shape,
-            df.columns.tolist(),
+            list(df.columns),
         )
-        return schema.DatasetHandle(handle=handle)
+        return schema.DatasetHandle(handle=handle, **sizes)
+    except _SourceRejected as e:
+        return {"error": str(e)}
+    except ingest.DecompressedSizeLimitExceeded as e:
+        limit_mb = e.limit_bytes // (1024 * 1024)
+        logger.warning("Decompressed source exceeds %d MB limit", limit_mb)
+        return {"error": f"Decompressed data exceeds {limit_mb} MB limit"}
     except Exception as e:
         logger.error("Failed to load dataset: %s", str(e))
         return {"error": f"Dataset loading failed: {str(e)}"}
@@ -175,4 +509,4 @@ def load_dataset(
 
 def register(mcp_instance: "FastMCP") -> None:
     """Register dataset tools with the MCP instance."""
-    mcp_instance.tool()(load_dataset)
+    mcp_instance.tool()(offload.offload(load_dataset))
@@ -11,7 +11,7 @@ from great_expectations.core import ExpectationSuite
 from great_expectations.exceptions import DataContextError
 
 from gx_mcp_server.logging import logger
-from gx_mcp_server.core import schema
+from gx_mcp_server.core import offload, schema
 from gx_mcp_server.core.context import get_shared_context
 from importlib.metadata import version
 
@@ -134,5 +134,5 @@ def add_expectation(
 def register(mcp_instance: "FastMCP") -> None:
     """Register expectation tools with the MCP instance."""
     mcp_instance.tool()(create_suite)
-    mcp_instance.tool()(add_expectation)
+    mcp_instance.tool()(offload.offload(add_expectation))
     mcp_instance.tool()(get_version)
@@ -9,7 +9,7 @@ from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.validator.validator import Validator
 
 from gx_mcp_server.logging import logger
-from gx_mcp_server.core import schema, storage
+from gx_mcp_server.core import offload, schema, storage
 from gx_mcp_server.core.context import get_shared_context
 
 
@@ -25,13 +25,22 @@ def _execute_validation(
 
     # For dummy handles or missing dataset, skip GE and return success
     try:
-        df = storage.DataStorage.get(dataset_handle)
+        df = storage.DataStorage.get_frame(dataset_handle)
     except KeyError:
         logger.warning(
             "Dataset handle '%s' not found, returning dummy success result",
             dataset_handle,
         )
         return {"statistics": {}, "results": [], "success": True}
+    except Exception as e:
+        # Lazy handles read their source here, so loading can still fail
+        logger.error("Failed to load dataset '%s': %s", dataset_handle, str(e))
+        return {
+            "statistics": {"evaluated_expectations": 0},
+            "results": [],
+            "success": False,
+            "error": f"Dataset loading failed: {str(e)}",
+        }
 
     try:
         context = get_shared_context()
@@ -66,6 +75,16 @@ def _execute_validation(
             "error": f"Validation failed: {str(e)}",
         }
 
+    if storage.is_polars_frame(df):
+        from gx_mcp_server.core import polars_validation
+
+        result = polars_validation.validate(df, suite)
+        if result is not None:
+            logger.info("Validated dataset '%s' natively with Polars", dataset_handle)
+            return result
+        # Some expectation has no native implementation
+        df = df.to_pandas()
+
     execution_engine = PandasExecutionEngine()
     batch_request = RuntimeBatchRequest(
         datasource_name="runtime_pandas_datasource",
@@ -118,7 +137,7 @@ def run_checkpoint(
         result = await asyncio.to_thread(
             _execute_validation, suite_name, dataset_handle, checkpoint_name
         )
-        storage.ValidationStorage.set(vid, result)
+        await storage.AsyncValidationStorage.set(vid, result)
 
     background_tasks.add_task(_task)
     logger.info("Validation scheduled asynchronously with ID: %s", vid)
@@ -162,7 +181,37 @@ def get_validation_result(
         )
 
 
+def get_validation_summary(validation_id: str) -> schema.ValidationSummary:
+    """Fetch the status and statistics of a validation run.
+
+    Cheaper than get_validation_result() for polling: the per-expectation
+    results are not decoded.
+
+    Args:
+        validation_id: ID returned from run_checkpoint()
+
+    Returns:
+        ValidationSummary: "pending", "completed" or "not_found" with statistics
+    """
+    logger.info("Retrieving validation summary for ID: %s", validation_id)
+    try:
+        summary = storage.ValidationStorage.get_summary(validation_id)
+    except KeyError:
+        logger.error("Validation result not found for ID: %s", validation_id)
+        return schema.ValidationSummary(
+            status="not_found",
+            error=f"Validation result not found for ID: {validation_id}",
+        )
+    return schema.ValidationSummary(
+        status=summary.get("status", "completed"),
+        statistics=summary.get("statistics", {}),
+        success=summary.get("success"),
+        error=summary.get("error"),
+    )
+
+
 def register(mcp_instance: "FastMCP") -> None:
     """Register validation tools with the MCP instance."""
-    mcp_instance.tool()(run_checkpoint)
+    mcp_instance.tool()(offload.offload(run_checkpoint))
     mcp_instance.tool()(get_validation_result)
+    mcp_instance.tool()(get_validation_summary)
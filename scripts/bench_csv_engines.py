@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+bench_csv_engines.py  –  compare the load_dataset CSV engines.
+
+Writes synthetic CSVs of the given sizes (mixed int, float, low-cardinality
+string and free-text columns) to a temp directory, loads each with every
+engine through ``load_dataset`` and reports the best wall time, throughput
+and resulting frame size. ``auto`` shows which engine it picked.
+
+    python scripts/bench_csv_engines.py                 # 10 MB, 100 MB, ~1 GB
+    python scripts/bench_csv_engines.py 10 100 --repeat 5
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gx_mcp_server.core import storage
+from gx_mcp_server.tools.datasets import load_dataset
+
+ENGINES = ["pandas", "pyarrow", "polars", "auto"]
+_ROWS_PER_BLOCK = 200_000
+
+
+def write_csv(path: Path, size_mb: int) -> int:
+    """Append synthetic blocks to ``path`` until it reaches ``size_mb``."""
+    rng = np.random.default_rng(0)
+    target = size_mb * 1024 * 1024
+    rows = 0
+    with open(path, "w") as f:
+        header = True
+        while f.tell() < target:
+            block = pd.DataFrame(
+                {
+                    "id": np.arange(rows, rows + _ROWS_PER_BLOCK),
+                    "amount": rng.normal(100, 25, _ROWS_PER_BLOCK).round(2),
+                    "state": rng.choice(["CA", "NY", "TX", "WA"], _ROWS_PER_BLOCK),
+                    "note": rng.integers(0, 10**9, _ROWS_PER_BLOCK).astype(str),
+                }
+            )
+            block.to_csv(f, index=False, header=header)
+            header = False
+            rows += _ROWS_PER_BLOCK
+    return rows
+
+
+def run(path: Path, engine: str, repeat: int) -> tuple[float, int, str]:
+    best = float("inf")
+    size = 0
+    kind = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        res = load_dataset(str(path), engine=engine)
+        best = min(best, time.perf_counter() - start)
+        if isinstance(res, dict):
+            raise RuntimeError(res["error"])
+        frame = storage.DataStorage.get_frame(res.handle)
+        size = storage.frame_size(frame)
+        if storage.is_polars_frame(frame):
+            kind = "polars"
+        elif isinstance(frame.dtypes.iloc[0], pd.ArrowDtype):
+            kind = "pyarrow"
+        else:
+            kind = "pandas"
+        storage.DataStorage.delete(res.handle)
+    return best, size, kind
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sizes_mb", nargs="*", type=int, default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--engines", nargs="+", default=ENGINES, choices=ENGINES)
+    args = parser.parse_args()
+
+    # The benchmark files are larger than the default limit (max 1024 MB)
+    os.environ.setdefault("MCP_CSV_SIZE_LIMIT_MB", "1024")
+    storage.configure_storage_backend("memory")
+    print(f"cores: {os.cpu_count()}")
+    print(
+        f"{'size':>7} {'engine':>8} {'picked':>8} {'best s':>8} {'MB/s':>8} {'frame MB':>9}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for size_mb in args.sizes_mb:
+            path = Path(tmp) / f"bench_{size_mb}mb.csv"
+            write_csv(path, size_mb)
+            on_disk = path.stat().st_size / 2**20
+            for engine in args.engines:
+                try:
+                    seconds, frame_bytes, picked = run(path, engine, args.repeat)
+                except Exception as e:
+                    print(f"{size_mb:>5}MB {engine:>8} failed: {e}")
+                    continue
+                print(
+                    f"{size_mb:>5}MB {engine:>8} {picked:>8} {seconds:>8.2f} "
+                    f"{on_disk / seconds:>8.0f} {frame_bytes / 2**20:>9.0f}"
+                )
+            path.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+bench_storage_contention.py  –  measure lock contention in the in-memory store.
+
+Runs load / validate / poll traffic against ``core.storage`` from several
+threads, once with a single lock and once per shard count given on the
+command line, and reports throughput, lock acquisitions per operation
+(shard and store-wide locks) and the share of acquisitions that had to wait.
+
+    python scripts/bench_storage_contention.py --threads 8 --seconds 3 16 64
+"""
+
+import argparse
+import threading
+import time
+
+import pandas as pd
+
+from gx_mcp_server.core import storage
+
+
+class CountingLock:
+    """Lock wrapper counting acquisitions that found the lock held."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.contended = 0
+
+    def __enter__(self) -> "CountingLock":
+        if not self._lock.acquire(blocking=False):
+            self.contended += 1
+            self._lock.acquire()
+        self.acquired += 1
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._lock.release()
+
+
+def run(shards: int, threads: int, seconds: float) -> tuple[float, float, int, float]:
+    storage.configure_storage_backend(f"memory?shards={shards}")
+    locks = []
+    for shard in storage._df_shards + storage._result_shards:
+        shard.lock = CountingLock()  # type: ignore[assignment]
+        locks.append(shard.lock)
+    for totals in (storage._df_totals, storage._result_totals):
+        totals.lock = CountingLock()  # type: ignore[assignment]
+        totals.evict_lock = CountingLock()  # type: ignore[assignment]
+        locks += [totals.lock, totals.evict_lock]
+
+    df = pd.DataFrame({"a": range(100)})
+    stop = time.monotonic() + seconds
+    ops = [0] * threads
+
+    def worker(n: int) -> None:
+        while time.monotonic() < stop:
+            handle = storage.DataStorage.add(df)  # load_dataset
+            try:
+                storage.DataStorage.get(handle)  # run_checkpoint
+            except KeyError:
+                pass  # already evicted by other threads' loads
+            vid = storage.ValidationStorage.reserve()  # background validation
+            for _ in range(4):  # get_validation_result polling
+                storage.ValidationStorage.get(vid)
+            storage.ValidationStorage.set(vid, {"success": True})
+            ops[n] += 8
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+
+    acquired = sum(lock.acquired for lock in locks)
+    contended = sum(lock.contended for lock in locks)
+    share = 100.0 * contended / max(1, acquired)
+    return sum(ops) / seconds, acquired / max(1, sum(ops)), contended, share
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("shards", nargs="*", type=int, default=[16])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(f"{'shards':>6} {'ops/s':>12} {'locks/op':>9} {'waits':>8} {'contended':>10}")
+    for shards in [1, *args.shards]:
+        rate, per_op, waits, share = run(shards, args.threads, args.seconds)
+        print(f"{shards:>6} {rate:>12,.0f} {per_op:>9.2f} {waits:>8} {share:>9.3f}%")
+
+
+if __name__ == "__main__":
+    main()
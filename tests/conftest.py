@@ -1,5 +1,6 @@
 import pytest
 
+from gx_mcp_server.core import storage
 from gx_mcp_server.core.context import get_shared_context, reset_context
 
 
@@ -9,3 +10,12 @@ def shared_gx_context():
     get_shared_context()  # Initialize context
     yield
     reset_context()  # Cleanup after test
+
+
+@pytest.fixture(autouse=True)
+def restore_storage():
+    """Put back the default in-memory store after tests that reconfigure it."""
+    yield
+    storage.configure_ttl(None, None)
+    storage.configure_dataset_dedup(False)
+    storage.configure_storage_backend("memory")
@@ -0,0 +1,37 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from gx_mcp_server.core import storage
+
+
+async def test_async_facades_roundtrip():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    handle = await storage.AsyncDataStorage.add(df)
+    assert (await storage.AsyncDataStorage.get(handle)).equals(df)
+    assert list((await storage.AsyncDataStorage.get(handle, ["b"])).columns) == ["b"]
+    assert (await storage.AsyncDataStorage.get_handle_path(handle)).endswith(".csv")
+    await storage.AsyncDataStorage.delete(handle)
+    with pytest.raises(KeyError):
+        await storage.AsyncDataStorage.get(handle)
+
+    vid = await storage.AsyncValidationStorage.reserve()
+    assert await storage.AsyncValidationStorage.get_summary(vid) == {
+        "status": "pending"
+    }
+    await storage.AsyncValidationStorage.set(vid, {"success": True})
+    assert await storage.AsyncValidationStorage.get(vid) == {"success": True}
+    other = await storage.AsyncValidationStorage.add({"success": False})
+    assert await storage.AsyncValidationStorage.get(other) == {"success": False}
+
+
+async def test_async_calls_run_on_storage_pool(monkeypatch):
+    threads = []
+
+    def record(vid, result):
+        threads.append(threading.current_thread().name)
+
+    monkeypatch.setattr(storage.ValidationStorage, "set", staticmethod(record))
+    await storage.AsyncValidationStorage.set("vid", {})
+    assert threads[0].startswith("gx-storage-io")
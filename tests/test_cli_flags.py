@@ -12,3 +12,11 @@ def test_inspector_auth_value(monkeypatch):
     monkeypatch.setattr(sys, "argv", ["prog", "--inspector-auth", "secret"])
     args = parse_args()
     assert args.inspector_auth == "secret"
+
+
+def test_ttl_from_env(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["prog", "--result-ttl", "60"])
+    monkeypatch.setenv("MCP_DATASET_TTL_SECONDS", "3600")
+    args = parse_args()
+    assert args.dataset_ttl == 3600.0
+    assert args.result_ttl == 60.0
@@ -0,0 +1,126 @@
+import bz2
+import gzip
+import io
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from gx_mcp_server.core import http_fetch, ingest
+from gx_mcp_server.core.schema import SampleOptions
+from gx_mcp_server.core.storage import DataStorage
+from gx_mcp_server.tools.datasets import load_dataset
+
+ROWS = 50_000
+BODY = b"id,name\n" + b"".join(b"%d,row%d\n" % (i, i) for i in range(ROWS))
+
+
+def _zstd(data):
+    sink = pa.BufferOutputStream()
+    with pa.CompressedOutputStream(sink, "zstd") as out:
+        out.write(data)
+    return sink.getvalue().to_pybytes()
+
+
+COMPRESSORS = {".gz": gzip.compress, ".bz2": bz2.compress, ".zst": _zstd}
+
+
+@pytest.mark.parametrize("suffix", list(COMPRESSORS))
+def test_compressed_files(tmp_path, suffix):
+    path = tmp_path / f"data.csv{suffix}"
+    path.write_bytes(COMPRESSORS[suffix](BODY))
+    df = DataStorage.get(load_dataset(str(path)).handle)
+    assert len(df) == ROWS
+    assert df["name"].iloc[-1] == f"row{ROWS - 1}"
+
+
+def test_compression_detected_from_magic_bytes(tmp_path):
+    path = tmp_path / "export"
+    buf = io.BytesIO()
+    pd.DataFrame({"a": [1, 2]}).to_parquet(buf)
+    path.write_bytes(_zstd(buf.getvalue()))
+    df = DataStorage.get(load_dataset(str(path), max_rows=1).handle)
+    assert df["a"].tolist() == [1]
+
+
+def test_decompressed_limit(tmp_path, monkeypatch):
+    monkeypatch.setenv("MCP_DECOMPRESSED_SIZE_LIMIT_MB", "1")
+    path = tmp_path / "bomb.csv.gz"
+    path.write_bytes(gzip.compress(b"a\n" + b"0\n" * 2_000_000))
+    assert path.stat().st_size < 1024 * 1024
+    res = load_dataset(str(path))
+    assert res == {"error": "Decompressed data exceeds 1 MB limit"}
+
+
+def test_compressed_partitions(tmp_path, monkeypatch):
+    for day, compress in enumerate(COMPRESSORS.values()):
+        (tmp_path / f"day{day}.csv{list(COMPRESSORS)[day]}").write_bytes(
+            compress(b"id,date\n%d,2024-01-0%d\n" % (day, day + 1))
+        )
+    df = DataStorage.get(load_dataset(str(tmp_path)).handle)
+    assert df["id"].tolist() == [0, 1, 2]
+    assert df["date"].tolist()[0] == "2024-01-01"
+
+    monkeypatch.setenv("MCP_DECOMPRESSED_SIZE_LIMIT_MB", "1")
+    (tmp_path / "day9.csv.gz").write_bytes(gzip.compress(b"id\n" + b"0\n" * 10**6))
+    res = load_dataset(str(tmp_path / "*.csv.gz"))
+    assert res == {"error": "Decompressed data exceeds 1 MB limit"}
+
+
+@pytest.mark.parametrize("sample", [None, SampleOptions(size=5)])
+def test_decompressed_limit_spans_partitions(tmp_path, sample):
+    # Each partition is under the limit, together they are over it
+    for part in range(3):
+        body = b"id\n" + b"%d\n" % part * 200_000
+        (tmp_path / f"part{part}.csv.gz").write_bytes(gzip.compress(body))
+    paths = sorted(tmp_path.glob("*.csv.gz"))
+    assert len(ingest.read_files(paths[:1], limit_bytes=1024 * 1024)) == 200_000
+    with pytest.raises(ingest.DecompressedSizeLimitExceeded):
+        ingest.read_files(paths, limit_bytes=1024 * 1024, sample=sample)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        data = b"a\n" + b"0\n" * 10**6 if self.path == "/big.csv.gz" else BODY
+        body = gzip.compress(data)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url(monkeypatch):
+    monkeypatch.setattr(http_fetch, "_cache_dir", None)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("path", ["/data.csv.gz", "/download"])
+def test_compressed_url(base_url, path):
+    df = DataStorage.get(load_dataset(base_url + path, "url").handle)
+    assert len(df) == ROWS
+
+
+def test_compressed_url_limit(base_url, monkeypatch):
+    monkeypatch.setenv("MCP_DECOMPRESSED_SIZE_LIMIT_MB", "1")
+    res = load_dataset(base_url + "/big.csv.gz", "url")
+    assert res == {"error": "Decompressed data exceeds 1 MB limit"}
+
+
+def test_detect_compression():
+    assert ingest.detect_compression("s3.test/x.CSV.ZST") == "zstd"
+    assert ingest.detect_compression(None, b"BZh9") == "bz2"
+    assert ingest.detect_compression(None, b"BZhx") is None
+    assert ingest.detect_format("x.jsonl.gz") == "jsonl"
+    assert ingest.has_known_extension("x.parquet.bz2")
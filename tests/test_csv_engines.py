@@ -0,0 +1,115 @@
+import gzip
+
+import pandas as pd
+import pytest
+
+from gx_mcp_server.core.storage import DataStorage
+from gx_mcp_server.tools import datasets
+from gx_mcp_server.tools.datasets import load_dataset
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    rows = "".join(f"{i},name{i % 7},{i / 4}\n" for i in range(50_000))
+    path.write_text("id,name,value\n" + rows)
+    return path
+
+
+def test_pyarrow_engine_uses_arrow_dtypes(csv_path):
+    res = load_dataset(str(csv_path), engine="pyarrow")
+    df = DataStorage.get_frame(res.handle)
+    assert isinstance(df["id"].dtype, pd.ArrowDtype)
+    assert str(df["value"].dtype) == "double[pyarrow]"
+    expected = pd.read_csv(csv_path)
+    pd.testing.assert_frame_equal(
+        df.astype({"id": "int64", "name": object, "value": "float64"}), expected
+    )
+
+
+def test_pyarrow_engine_options(csv_path):
+    res = load_dataset(
+        str(csv_path),
+        engine="pyarrow",
+        max_rows=10,
+        columns=["id"],
+        dtype_backend="numpy_nullable",
+    )
+    df = DataStorage.get_frame(res.handle)
+    assert df["id"].tolist() == list(range(10))
+    assert str(df["id"].dtype) == "Int64"
+
+
+def test_pyarrow_engine_compressed(tmp_path, csv_path):
+    path = tmp_path / "data.csv.gz"
+    path.write_bytes(gzip.compress(csv_path.read_bytes()))
+    df = DataStorage.get_frame(load_dataset(str(path), engine="pyarrow").handle)
+    assert len(df) == 50_000
+
+
+def test_polars_engine_matches_use_polars(csv_path):
+    pl = pytest.importorskip("polars")
+    for kwargs in ({"engine": "polars"}, {"use_polars": True}):
+        frame = DataStorage.get_frame(load_dataset(str(csv_path), **kwargs).handle)
+        assert isinstance(frame, pl.DataFrame)
+
+
+def test_auto_engine(csv_path, monkeypatch):
+    df = DataStorage.get_frame(load_dataset(str(csv_path), engine="auto").handle)
+    assert df["id"].dtype == "int64"  # small file: pandas
+
+    size = csv_path.stat().st_size
+    monkeypatch.setattr(datasets, "_PYARROW_MIN_BYTES", 1)
+    monkeypatch.setattr(datasets, "_PYARROW_BYTES_PER_CORE", 4 * size)
+    monkeypatch.setattr(datasets.os, "cpu_count", lambda: 4)
+    df = DataStorage.get_frame(load_dataset(str(csv_path), engine="auto").handle)
+    assert isinstance(df["id"].dtype, pd.ArrowDtype)
+
+    monkeypatch.setattr(datasets.os, "cpu_count", lambda: 2)
+    df = DataStorage.get_frame(load_dataset(str(csv_path), engine="auto").handle)
+    assert df["id"].dtype == "int64"
+
+
+def test_pyarrow_engine_for_partitions(tmp_path, csv_path):
+    for part in range(2):
+        (tmp_path / f"p{part}.csv").write_bytes(csv_path.read_bytes())
+    df = DataStorage.get_frame(
+        load_dataset(str(tmp_path / "p*.csv"), engine="pyarrow").handle
+    )
+    assert len(df) == 100_000
+    assert isinstance(df["name"].dtype, pd.ArrowDtype)
+
+
+@pytest.mark.parametrize("max_rows", [None, 3])
+def test_pyarrow_engine_reads_like_pandas(tmp_path, max_rows):
+    path = tmp_path / "events.csv"
+    path.write_text("id,name,day\n1,a,2024-01-01\n2,,2024-01-02\n3,NA,\n")
+    res = load_dataset(str(path), engine="pyarrow", max_rows=max_rows)
+    df = DataStorage.get_frame(res.handle)
+    expected = pd.read_csv(path)
+    assert df["name"].isna().tolist() == expected["name"].isna().tolist()
+    # Dates stay text, as with the pandas engine
+    assert str(df["day"].dtype) == "string[pyarrow]"
+    assert df["day"].tolist()[:2] == expected["day"].tolist()[:2]
+
+
+@pytest.mark.parametrize("suffix", ["csv", "csv.gz"])
+def test_pyarrow_engine_widens_types_after_first_block(tmp_path, suffix):
+    # Arrow fixes column types from the first 1 MiB block
+    data = ("n\n" + "".join(f"{i}\n" for i in range(300_000)) + "1.5\n").encode()
+    path = tmp_path / f"late.{suffix}"
+    path.write_bytes(gzip.compress(data) if suffix.endswith("gz") else data)
+    res = load_dataset(str(path), engine="pyarrow", max_rows=300_001)
+    df = DataStorage.get_frame(res.handle)
+    assert str(df["n"].dtype) == "double[pyarrow]"
+    assert len(df) == 300_001
+    assert df["n"].iloc[-1] == 1.5
+
+
+def test_engine_applies_to_inline_csv():
+    text = "id,name\n1,a\n2,\n"
+    df = DataStorage.get_frame(load_dataset(text, "inline", engine="pyarrow").handle)
+    assert isinstance(df["id"].dtype, pd.ArrowDtype)
+    assert df["name"].isna().tolist() == [False, True]
+    df = DataStorage.get_frame(load_dataset(text, "inline", engine="auto").handle)
+    assert df["id"].dtype == "int64"
@@ -0,0 +1,86 @@
+import pandas as pd
+import pytest
+
+from gx_mcp_server.core import storage
+from gx_mcp_server.tools.datasets import load_dataset
+
+
+@pytest.fixture(autouse=True)
+def dedup_enabled():
+    storage.configure_dataset_dedup(True)
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite", "tiered"])
+def test_identical_loads_share_one_copy(tmp_path, backend):
+    uri = {
+        "memory": "memory",
+        "sqlite": f"sqlite:///{tmp_path / 'gx.db'}",
+        "tiered": f"tiered:///{tmp_path}",
+    }[backend]
+    storage.configure_storage_backend(uri)
+    first = load_dataset("a,b\n1,x\n2,y", source_type="inline").handle
+    second = load_dataset("a,b\n1,x\n2,y", source_type="inline").handle
+    other = load_dataset("a,b\n1,x\n3,y", source_type="inline").handle
+
+    assert first != second
+    assert storage._aliases[first] == storage._aliases[second]
+    assert storage._aliases[other] != storage._aliases[first]
+    stored = storage._aliases[first]
+    assert storage._refcounts[stored] == 2
+
+    storage.DataStorage.delete(first)
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(first)
+    assert storage.DataStorage.get(second)["a"].tolist() == [1, 2]
+
+    storage.DataStorage.delete(second)
+    assert not storage._data_backend.contains(stored)
+
+
+def test_shared_backends_do_not_dedup(tmp_path):
+    storage.configure_storage_backend(f"arrow:///{tmp_path}")
+    first = load_dataset("a\n1", source_type="inline").handle
+    second = load_dataset("a\n1", source_type="inline").handle
+    assert not storage._aliases
+    storage.DataStorage.delete(first)
+    assert storage.DataStorage.get(second)["a"].tolist() == [1]
+
+
+def test_column_order_and_dtypes_are_part_of_the_digest():
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    assert storage.dataset_digest(df) != storage.dataset_digest(df[["b", "a"]])
+    assert storage.dataset_digest(df) != storage.dataset_digest(df.astype(float))
+    assert storage.dataset_digest(df) == storage.dataset_digest(df.copy())
+
+
+def test_evicted_copy_is_stored_again(monkeypatch):
+    monkeypatch.setattr(storage, "_MAX_ITEMS", 1)
+    storage.configure_storage_backend("memory?shards=1")
+    df = pd.DataFrame({"a": [1]})
+    first = storage.DataStorage.add(df)
+    storage.DataStorage.add(pd.DataFrame({"a": [2]}))
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(first)
+
+    again = storage.DataStorage.add(df)
+    assert storage.DataStorage.get(again).equals(df)
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_eviction_forgets_aliases(tmp_path, monkeypatch, backend):
+    from gx_mcp_server.storage import sqlite_backend
+
+    monkeypatch.setattr(storage, "_MAX_ITEMS", 1)
+    monkeypatch.setattr(sqlite_backend, "_MAX_ITEMS", 1)
+    uri = {"memory": "memory", "sqlite": f"sqlite:///{tmp_path / 'gx.db'}"}[backend]
+    storage.configure_storage_backend(uri)
+    first = storage.DataStorage.add(pd.DataFrame({"a": [1]}))
+    stored = storage._aliases[first]
+    second = storage.DataStorage.add(pd.DataFrame({"a": [2]}))
+
+    assert first not in storage._aliases
+    assert stored not in storage._refcounts
+    assert stored not in storage._handle_digests.keys() | set(
+        storage._digest_handles.values()
+    )
+    assert list(storage._aliases) == [second]
@@ -0,0 +1,97 @@
+import pandas as pd
+import pytest
+
+from gx_mcp_server.core import downcast, storage
+from gx_mcp_server.tools.datasets import load_dataset
+from gx_mcp_server.tools.expectations import add_expectation, create_suite
+from gx_mcp_server.tools.validation import _execute_validation
+
+ROWS = 2_000
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    lines = ["id,state,score,amount,note"]
+    for i in range(ROWS):
+        state = ["CA", "NY", "TX"][i % 3]
+        lines.append(f"{i},{state},{i % 100},{i % 8 * 0.25},note{i}")
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def test_optimize_shrinks_frame_and_reports_savings(csv_path):
+    res = load_dataset(str(csv_path), optimize=True)
+    df = storage.DataStorage.get(res.handle)
+    assert df["state"].dtype == "category"
+    assert df["note"].dtype == object  # high cardinality stays as is
+    assert df["id"].dtype == "int16"
+    assert df["score"].dtype == "int8"
+    assert df["amount"].dtype == "float32"
+
+    plain = pd.read_csv(csv_path)
+    assert res.memory_bytes == storage.frame_size(df)
+    assert res.memory_saved_bytes == storage.frame_size(plain) - res.memory_bytes
+    assert res.memory_saved_bytes > 0
+    pd.testing.assert_frame_equal(
+        df.astype({"state": object}), plain, check_dtype=False
+    )
+
+
+def test_without_optimize_nothing_is_reported(csv_path):
+    res = load_dataset(str(csv_path))
+    assert res.memory_bytes is None and res.memory_saved_bytes is None
+
+
+def test_lossy_floats_and_wide_ints_are_kept():
+    df = pd.DataFrame({"f": [0.1, 0.2], "i": [0, 2**40], "b": [True, False]})
+    out = downcast.optimize(df)
+    assert out.dtypes.to_dict() == df.dtypes.to_dict()
+
+
+def test_dtype_hints_skip_inference(csv_path):
+    res = load_dataset(
+        str(csv_path), dtypes={"id": "int32", "state": "category", "score": "str"}
+    )
+    df = storage.DataStorage.get(res.handle)
+    assert df["id"].dtype == "int32"
+    assert df["state"].dtype == "category"
+    assert df["score"].iloc[1] == "1"
+
+
+def test_pyarrow_backend_keeps_arrow_dtypes(csv_path):
+    res = load_dataset(
+        str(csv_path), dtype_backend="pyarrow", optimize=True, use_polars=True
+    )
+    df = storage.DataStorage.get_frame(res.handle)
+    assert isinstance(df, pd.DataFrame)
+    assert str(df["score"].dtype) == "int8[pyarrow]"
+    assert str(df["amount"].dtype) == "float[pyarrow]"
+    assert df["state"].dtype == "category"
+    assert res.memory_saved_bytes > 0
+
+
+def test_polars_frames_are_optimized(csv_path):
+    pl = pytest.importorskip("polars")
+    res = load_dataset(str(csv_path), use_polars=True, optimize=True)
+    df = storage.DataStorage.get_frame(res.handle)
+    assert df.schema["state"] == pl.Categorical
+    assert df.schema["score"] == pl.Int8
+    assert res.memory_saved_bytes > 0
+
+
+def test_optimized_frames_validate(csv_path):
+    create_suite("optimized", "dummy")
+    add_expectation(
+        "optimized",
+        "expect_column_values_to_be_in_set",
+        {"column": "state", "value_set": ["CA", "NY", "TX"]},
+    )
+    add_expectation(
+        "optimized",
+        "expect_column_values_to_be_between",
+        {"column": "amount", "min_value": 0, "max_value": 1.75},
+    )
+    handle = load_dataset(str(csv_path), optimize=True).handle
+    result = _execute_validation("optimized", handle)
+    assert result["success"] is True
@@ -0,0 +1,49 @@
+import os
+
+import pandas as pd
+import pytest
+
+from gx_mcp_server.core import storage
+
+
+def test_export_is_written_once_and_reused():
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    handle = storage.DataStorage.add(df)
+
+    path = storage.DataStorage.get_handle_path(handle)
+    mtime = os.stat(path).st_mtime_ns
+    assert pd.read_csv(path).equals(df)
+    assert storage.DataStorage.get_handle_path(handle) == path
+    assert os.stat(path).st_mtime_ns == mtime
+
+    parquet = storage.DataStorage.get_handle_path(handle, fmt="parquet")
+    assert pd.read_parquet(parquet).equals(df)
+    arrow = storage.DataStorage.get_handle_path(handle, fmt="arrow")
+    assert pd.read_feather(arrow).equals(df)
+
+    storage.DataStorage.delete(handle)
+    assert not any(os.path.exists(p) for p in (path, parquet, arrow))
+    with pytest.raises(KeyError):
+        storage.DataStorage.get_handle_path(handle)
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_export_removed_on_eviction(tmp_path, monkeypatch, backend):
+    from gx_mcp_server.storage import sqlite_backend
+
+    monkeypatch.setattr(storage, "_MAX_ITEMS", 1)
+    monkeypatch.setattr(sqlite_backend, "_MAX_ITEMS", 1)
+    storage.configure_storage_backend(
+        "memory?shards=1" if backend == "memory" else f"sqlite:///{tmp_path / 'gx.db'}"
+    )
+    handle = storage.DataStorage.add(pd.DataFrame({"a": [1]}))
+    path = storage.DataStorage.get_handle_path(handle)
+
+    storage.DataStorage.add(pd.DataFrame({"a": [2]}))
+    assert not os.path.exists(path)
+
+
+def test_unknown_export_format():
+    handle = storage.DataStorage.add(pd.DataFrame({"a": [1]}))
+    with pytest.raises(ValueError):
+        storage.DataStorage.get_handle_path(handle, fmt="xlsx")
@@ -0,0 +1,132 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from gx_mcp_server.core import ingest, predicates
+from gx_mcp_server.core.storage import DataStorage
+from gx_mcp_server.tools.datasets import load_dataset
+
+FRAME = pd.DataFrame(
+    {
+        "id": range(300),
+        "country": [["US", "DE", "FR"][i % 3] for i in range(300)],
+        "ts": [
+            f"2023-{1 + i % 12:02d}-15" if i < 200 else "2024-03-01" for i in range(300)
+        ],
+        "amount": [i * 1.5 for i in range(300)],
+    }
+)
+EXPRESSION = "country == 'US' and ts >= '2023-06-01'"
+EXPECTED = FRAME[(FRAME.country == "US") & (FRAME.ts >= "2023-06-01")]
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "export.csv"
+    FRAME.to_csv(path, index=False)
+    return path
+
+
+def test_parse_to_dnf():
+    assert predicates.parse(EXPRESSION) == [
+        [("country", "==", "US"), ("ts", ">=", "2023-06-01")]
+    ]
+    assert predicates.parse("1 <= id < 5 or country in ('DE', 'FR')") == [
+        [("id", ">=", 1), ("id", "<", 5)],
+        [("country", "in", ["DE", "FR"])],
+    ]
+    # ``and`` distributes over ``or``
+    assert predicates.parse("(a == 1 or a == 2) and b != 'x'") == [
+        [("a", "==", 1), ("b", "!=", "x")],
+        [("a", "==", 2), ("b", "!=", "x")],
+    ]
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "__import__('os').system('true')",
+        "amount * 2 > 1",
+        "not id == 1",
+        "id == other",
+        "id in 5",
+        "id ==",
+    ],
+)
+def test_parse_rejects(expression):
+    with pytest.raises(ValueError):
+        predicates.parse(expression)
+    res = load_dataset("id\n1\n", "inline", filter=expression)
+    assert res["error"].startswith("Invalid filter:")
+
+
+@pytest.mark.parametrize("engine", ["pandas", "pyarrow", "polars"])
+def test_csv_filter_and_projection(csv_path, engine):
+    if engine == "polars":
+        pytest.importorskip("polars")
+    res = load_dataset(
+        str(csv_path), columns=["id", "amount"], filter=EXPRESSION, engine=engine
+    )
+    df = DataStorage.get(res.handle)
+    # The filter columns are read for the predicate but not kept
+    assert list(df.columns) == ["id", "amount"]
+    assert df["id"].tolist() == EXPECTED["id"].tolist()
+
+
+def test_csv_filter_is_applied_per_chunk(csv_path, monkeypatch):
+    monkeypatch.setattr("gx_mcp_server.core.ingest._CHUNK_ROWS", 7)
+    res = load_dataset(str(csv_path), filter="id >= 295 or id == 3", max_rows=4)
+    # ``max_rows`` counts matching rows
+    assert DataStorage.get(res.handle)["id"].tolist() == [3, 295, 296, 297]
+
+    res = load_dataset(str(csv_path), filter="id > 1000", columns=["id"])
+    assert list(DataStorage.get(res.handle).columns) == ["id"]
+    assert DataStorage.get(res.handle).empty
+
+
+def test_nulls_never_match():
+    res = load_dataset("a,b\n1,x\n2,\n3,y\n", "inline", filter="b != 'x'")
+    assert DataStorage.get(res.handle)["a"].tolist() == [3]
+    res = load_dataset("a,b\n1,x\n2,\n3,y\n", "inline", filter="b not in ['x']")
+    assert DataStorage.get(res.handle)["a"].tolist() == [3]
+
+
+def test_filter_combines_with_filters(csv_path):
+    res = load_dataset(
+        str(csv_path), filters=[["id", "<", 100]], filter="country in ['DE', 'FR']"
+    )
+    df = DataStorage.get(res.handle)
+    assert df["id"].tolist() == [i for i in range(100) if i % 3]
+
+
+def test_jsonl_filter(tmp_path):
+    path = tmp_path / "rows.jsonl"
+    FRAME.to_json(path, orient="records", lines=True)
+    res = load_dataset(str(path), columns=["id"], filter=EXPRESSION)
+    assert DataStorage.get(res.handle)["id"].tolist() == EXPECTED["id"].tolist()
+
+
+def test_parquet_filter_casts_date_literals(tmp_path):
+    path = tmp_path / "events.parquet"
+    table = pa.Table.from_pandas(FRAME.assign(ts=pd.to_datetime(FRAME.ts)))
+    pq.write_table(table, path, row_group_size=50)
+    res = load_dataset(str(path), columns=["id"], filter=EXPRESSION)
+    assert DataStorage.get(res.handle)["id"].tolist() == EXPECTED["id"].tolist()
+
+    res = load_dataset(str(path), filter="ts >= 'not a date'")
+    assert "Cannot compare column ts" in res["error"]
+
+
+def test_multi_file_filter(tmp_path):
+    FRAME.iloc[:150].to_csv(tmp_path / "part-1.csv", index=False)
+    FRAME.iloc[150:].to_parquet(tmp_path / "part-2.parquet")
+    res = load_dataset(str(tmp_path), columns=["id"], filter=EXPRESSION)
+    assert DataStorage.get(res.handle)["id"].tolist() == EXPECTED["id"].tolist()
+
+
+def test_empty_filters_read_every_row(tmp_path):
+    path = tmp_path / "events.parquet"
+    FRAME.to_parquet(path)
+    table = ingest.read_table(path, "parquet", columns=["id"], filters=[])
+    assert table.column("id").to_pylist() == FRAME["id"].tolist()
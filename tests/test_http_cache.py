@@ -0,0 +1,128 @@
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from gx_mcp_server.core import http_fetch, ingest
+from gx_mcp_server.core.storage import DataStorage
+from gx_mcp_server.tools.datasets import load_dataset
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = b"id,name\n1,a\n2,b\n"
+    etag = '"v1"'
+    log: list = []
+
+    def do_GET(self):
+        validators = {"/etag": ("ETag", self.etag)}
+        validators["/modified"] = ("Last-Modified", formatdate(0, usegmt=True))
+        header = validators.get(self.path)
+        conditional = self.headers.get("If-None-Match") or self.headers.get(
+            "If-Modified-Since"
+        )
+        status = 304 if header and conditional == header[1] else 200
+        self.log.append((self.path, status, self.client_address[1]))
+        self.send_response(status)
+        if header:
+            self.send_header(*header)
+        if status == 304:
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_fetch, "_cache_dir", tmp_path / "cache")
+    _Handler.log = []
+    _Handler.body = b"id,name\n1,a\n2,b\n"
+    _Handler.etag = '"v1"'
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+    http_fetch.close()
+
+
+def _names(res):
+    return DataStorage.get(res.handle)["name"].tolist()
+
+
+@pytest.mark.parametrize("path", ["/etag", "/modified"])
+def test_unchanged_url_is_revalidated_not_reparsed(server, path, monkeypatch):
+    assert _names(load_dataset(server + path, "url")) == ["a", "b"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached frame should be used")
+
+    monkeypatch.setattr(ingest, "read_frame", fail)
+    assert _names(load_dataset(server + path, "url")) == ["a", "b"]
+    assert [status for _, status, _ in _Handler.log] == [200, 304]
+
+
+def test_changed_url_is_downloaded_again(server):
+    load_dataset(server + "/etag", "url")
+    _Handler.body, _Handler.etag = b"id,name\n3,c\n", '"v2"'
+    assert _names(load_dataset(server + "/etag", "url")) == ["c"]
+    assert _names(load_dataset(server + "/etag", "url")) == ["c"]
+    assert [status for _, status, _ in _Handler.log] == [200, 200, 304]
+
+
+def test_cached_body_is_parsed_with_new_options(server):
+    load_dataset(server + "/etag", "url")
+    res = load_dataset(server + "/etag", "url", columns=["name"], max_rows=1)
+    assert list(DataStorage.get(res.handle).columns) == ["name"]
+    assert _names(res) == ["a"]
+    assert [status for _, status, _ in _Handler.log] == [200, 304]
+
+
+def test_uncacheable_responses_and_connection_reuse(server):
+    load_dataset(server + "/plain", "url")
+    load_dataset(server + "/plain", "url")
+    assert [status for _, status, _ in _Handler.log] == [200, 200]
+    # Both requests went over the same pooled connection
+    assert len({port for _, _, port in _Handler.log}) == 1
+
+
+def test_partial_reads_are_not_cached(server):
+    _Handler.body = b"id,name\n" + b"".join(b"%d,x\n" % i for i in range(1_000_000))
+    assert _names(load_dataset(server + "/etag", "url", max_rows=1)) == ["x"]
+    load_dataset(server + "/etag", "url", max_rows=1)
+    assert [status for _, status, _ in _Handler.log] == [200, 200]
+
+
+def test_cache_can_be_disabled(server):
+    http_fetch.configure_cache(None)
+    load_dataset(server + "/etag", "url")
+    load_dataset(server + "/etag", "url")
+    assert [status for _, status, _ in _Handler.log] == [200, 200]
+
+
+def test_cache_dir_is_private(server, tmp_path):
+    cache = tmp_path / "cache"
+    load_dataset(server + "/etag", "url")
+    assert cache.stat().st_mode & 0o777 == 0o700
+
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    http_fetch.configure_cache(shared)
+    load_dataset(server + "/etag", "url")
+    load_dataset(server + "/etag", "url")
+    assert not list(shared.iterdir())
+
+
+def test_parsed_frames_per_url_are_capped(server, tmp_path):
+    for rows in range(1, 8):
+        load_dataset(server + "/etag", "url", max_rows=rows)
+    frames = list((tmp_path / "cache").glob("*.arrow"))
+    assert len(frames) == http_fetch._MAX_FRAMES_PER_URL
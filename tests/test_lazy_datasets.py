@@ -0,0 +1,131 @@
+import subprocess
+import sys
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from gx_mcp_server.core import storage
+from gx_mcp_server.tools.datasets import load_dataset
+from gx_mcp_server.tools.expectations import add_expectation, create_suite
+from gx_mcp_server.tools.validation import get_validation_result, run_checkpoint
+
+
+def test_lazy_file_is_read_on_first_use(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,x\n2,y\n")
+    res = load_dataset(str(path), lazy=True)
+
+    # Changes made before first use are picked up
+    path.write_text("a,b\n1,x\n2,y\n3,z\n")
+    assert storage.DataStorage.get(res.handle)["a"].tolist() == [1, 2, 3]
+    path.unlink()
+    assert len(storage.DataStorage.get(res.handle)) == 3
+
+
+def test_lazy_checks_access_up_front(tmp_path):
+    res = load_dataset(str(tmp_path / "missing.csv"), lazy=True)
+    assert "error" in res
+    res = load_dataset("ftp://example.com/data.csv", source_type="url", lazy=True)
+    assert res == {"error": "Only http(s) URLs are allowed"}
+
+
+def test_lazy_source_is_checked_again_on_first_use(tmp_path, monkeypatch):
+    monkeypatch.setenv("MCP_CSV_SIZE_LIMIT_MB", "1")
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n")
+    handle = load_dataset(str(path), lazy=True).handle
+
+    path.write_text("a\n" + "1\n" * 600_000)
+    with pytest.raises(Exception, match="exceeds 1 MB limit"):
+        storage.DataStorage.get(handle)
+
+
+def test_lazy_handle_validates(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n2\n")
+    handle = load_dataset(str(path), lazy=True).handle
+    create_suite("lazy_suite", handle)
+    add_expectation(
+        "lazy_suite", "expect_column_values_to_not_be_null", {"column": "a"}
+    )
+    vid = run_checkpoint("lazy_suite", handle).validation_id
+    assert get_validation_result(vid).success
+
+
+def test_concurrent_first_uses_load_once():
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.05)
+        return pd.DataFrame({"a": [1, 2, 3]})
+
+    handle = storage.DataStorage.add_lazy(load)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(storage.DataStorage.get(handle)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert [len(df) for df in results] == [3] * 8
+
+
+def test_failed_load_can_be_retried_and_deleted():
+    attempts = []
+
+    def load():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OSError("source unavailable")
+        return pd.DataFrame({"a": [1]})
+
+    handle = storage.DataStorage.add_lazy(load)
+    with pytest.raises(OSError):
+        storage.DataStorage.get(handle)
+    assert storage.DataStorage.get(handle)["a"].tolist() == [1]
+    storage.DataStorage.delete(handle)
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(handle)
+
+    unused = storage.DataStorage.add_lazy(load)
+    storage.DataStorage.delete(unused)
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(unused)
+    assert len(attempts) == 2
+
+
+def test_lazy_load_failure_is_reported_by_validation(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n")
+    handle = load_dataset(str(path), lazy=True).handle
+    path.unlink()
+    vid = run_checkpoint("lazy_suite", handle).validation_id
+    detail = get_validation_result(vid)
+    assert detail.success is False
+    assert "Dataset loading failed" in detail.error
+
+
+def test_lazy_loads_at_once_with_shared_backend(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n2\n")
+    uri = f"arrow:///{tmp_path / 'store'}"
+    storage.configure_storage_backend(uri)
+    handle = load_dataset(str(path), lazy=True).handle
+    path.unlink()
+
+    # Another worker sharing the store sees the dataset
+    code = (
+        "from gx_mcp_server.core import storage;"
+        f"storage.configure_storage_backend('{uri}');"
+        f"print(storage.DataStorage.get('{handle}')['a'].sum())"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip().splitlines()[-1] == "3"
@@ -0,0 +1,121 @@
+import pandas as pd
+import pytest
+
+from gx_mcp_server import metrics
+from gx_mcp_server.core import storage
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"a": range(rows)})
+
+
+def test_byte_budget_evicts_least_recently_used():
+    size = int(_frame(1000).memory_usage(deep=True).sum())
+    storage.configure_storage_backend(f"memory?max_bytes={size * 2}&shards=1")
+
+    first = storage.DataStorage.add(_frame(1000))
+    second = storage.DataStorage.add(_frame(1000))
+    # Touch the first handle so the second becomes least recently used
+    storage.DataStorage.get(first)
+    evictions = metrics.DATASET_STORE_EVICTIONS._value.get()
+    third = storage.DataStorage.add(_frame(1000))
+
+    assert storage.DataStorage.get(first) is not None
+    assert storage.DataStorage.get(third) is not None
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(second)
+    assert metrics.DATASET_STORE_EVICTIONS._value.get() == evictions + 1
+    shards = storage._df_shards
+    assert metrics.DATASET_STORE_ITEMS._value.get() == sum(len(s.items) for s in shards)
+    assert metrics.DATASET_STORE_BYTES._value.get() == sum(s.bytes for s in shards)
+
+
+def test_byte_budget_ignores_item_count(monkeypatch):
+    monkeypatch.setattr(storage, "_MAX_ITEMS", 2)
+    storage.configure_storage_backend("memory?max_bytes=100000000")
+    handles = [storage.DataStorage.add(_frame(1)) for _ in range(5)]
+    for handle in handles:
+        assert storage.DataStorage.get(handle) is not None
+
+
+def test_oversized_dataset_is_kept():
+    storage.configure_storage_backend("memory?max_bytes=1")
+    handle = storage.DataStorage.add(_frame(100))
+    assert len(storage.DataStorage.get(handle)) == 100
+
+
+def test_sharded_store_spreads_handles_and_keeps_budget(monkeypatch):
+    monkeypatch.setattr(storage, "_MAX_ITEMS", 40)
+    storage.configure_storage_backend("memory?shards=4")
+    handles = [storage.DataStorage.add(_frame(1)) for _ in range(200)]
+
+    sizes = [len(s.items) for s in storage._df_shards]
+    assert len(sizes) == 4
+    assert all(size > 0 for size in sizes)
+    # The budget applies to the store, not to each shard
+    assert sum(sizes) == 40
+    for handle in handles[-40:]:
+        assert storage.DataStorage.get(handle) is not None
+
+    vids = [storage.ValidationStorage.add({"n": i}) for i in range(200)]
+    assert storage.ValidationStorage.get(vids[-1]) == {"n": 199}
+    assert sum(len(s.items) for s in storage._result_shards) == 40
+
+
+def test_sharded_store_keeps_default_item_count():
+    storage.configure_storage_backend("memory")
+    handles = [storage.DataStorage.add(_frame(1)) for _ in range(100)]
+    for handle in handles:
+        assert storage.DataStorage.get(handle) is not None
+    assert sum(len(s.items) for s in storage._df_shards) == 100
+
+
+def test_sharded_store_bounds_total_bytes():
+    size = int(_frame(1000).memory_usage(deep=True).sum())
+    storage.configure_storage_backend(f"memory?max_bytes={size * 3}&shards=16")
+    big = [storage.DataStorage.add(_frame(1000)) for _ in range(16)]
+
+    resident = sum(s.bytes for s in storage._df_shards)
+    assert resident <= size * 3
+    assert metrics.DATASET_STORE_BYTES._value.get() == resident
+    for handle in big[-3:]:
+        assert storage.DataStorage.get(handle) is not None
+
+    # Only the newest dataset may exceed the budget on its own
+    huge = storage.DataStorage.add(_frame(5000))
+    assert [len(s.items) for s in storage._df_shards if s.items] == [1]
+    assert len(storage.DataStorage.get(huge)) == 5000
+    storage.DataStorage.add(_frame(1000))
+    assert sum(len(s.items) for s in storage._df_shards) == 1
+
+
+def test_resharding_keeps_items():
+    storage.configure_storage_backend("memory?shards=8")
+    handle = storage.DataStorage.add(_frame(3))
+    vid = storage.ValidationStorage.add({"ok": True})
+    storage.configure_storage_backend("memory?shards=3")
+    assert len(storage.DataStorage.get(handle)) == 3
+    assert storage.ValidationStorage.get(vid) == {"ok": True}
+
+
+def test_eviction_follows_use_across_shards(monkeypatch):
+    monkeypatch.setattr(storage, "_MAX_ITEMS", 4)
+    storage.configure_storage_backend("memory?shards=8")
+    handles = [storage.DataStorage.add(_frame(1)) for _ in range(4)]
+    storage.DataStorage.get(handles[0])
+    # Resharding keeps the store-wide order
+    storage.configure_storage_backend("memory?shards=3")
+    fresh = storage.DataStorage.add(_frame(1))
+
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(handles[1])
+    for handle in [handles[0], *handles[2:], fresh]:
+        assert storage.DataStorage.get(handle) is not None
+
+    # Replaced results leave stale queue entries, which are compacted
+    vid = storage.ValidationStorage.reserve()
+    for i in range(1000):
+        storage.ValidationStorage.set(vid, {"n": i})
+    totals = storage._result_totals
+    assert len(totals.queue) <= 2 * len(totals.queued) + 64
+    assert storage.ValidationStorage.get(vid) == {"n": 999}
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from gx_mcp_server.core import storage
+
+
+def test_mmap_roundtrip(tmp_path):
+    storage.configure_storage_backend(f"arrow:///{tmp_path}")
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"]})
+    handle = storage.DataStorage.add(df)
+
+    loaded = storage.DataStorage.get(handle)
+    assert isinstance(loaded["a"].dtype, pd.ArrowDtype)
+    assert loaded["a"].tolist() == [1, 2, 3]
+    assert list(storage.DataStorage.get(handle, columns=["b"]).columns) == ["b"]
+
+    vid = storage.ValidationStorage.reserve()
+    assert storage.ValidationStorage.get(vid) == {"status": "pending"}
+    storage.ValidationStorage.set(vid, {"success": True})
+    assert storage.ValidationStorage.get(vid) == {"success": True}
+
+
+def test_mmap_numpy_dtypes(tmp_path):
+    storage.configure_storage_backend(f"arrow:///{tmp_path}?dtype_backend=numpy")
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    handle = storage.DataStorage.add(df)
+    assert storage.DataStorage.get(handle).equals(df)
+
+
+def test_mmap_rejects_non_uuid_handles(tmp_path):
+    storage.configure_storage_backend(f"arrow:///{tmp_path}")
+    with pytest.raises(KeyError):
+        storage.DataStorage.get("../../etc/passwd")
+    with pytest.raises(KeyError):
+        storage.ValidationStorage.get("missing")
+
+
+def test_mmap_handles_visible_to_other_processes(tmp_path):
+    storage.configure_storage_backend(f"arrow:///{tmp_path}")
+    handle = storage.DataStorage.add(pd.DataFrame({"a": [1, 2, 3]}))
+    code = (
+        "from gx_mcp_server.core import storage;"
+        f"storage.configure_storage_backend('arrow:///{tmp_path}');"
+        f"print(storage.DataStorage.get('{handle}')['a'].sum())"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip().endswith("6")
+
+
+def test_mmap_result_summary(tmp_path):
+    storage.configure_storage_backend(f"arrow:///{tmp_path}")
+    result = {"statistics": {"n": 1}, "results": [{"ok": True}], "success": True}
+    vid = storage.ValidationStorage.add(result)
+    assert storage.ValidationStorage.get(vid) == result
+    assert storage.ValidationStorage.get_summary(vid) == {
+        "statistics": {"n": 1},
+        "success": True,
+    }
@@ -0,0 +1,121 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from gx_mcp_server.core import ingest
+from gx_mcp_server.core.storage import DataStorage
+from gx_mcp_server.tools.datasets import load_dataset
+
+
+@pytest.fixture
+def partitions(tmp_path):
+    for day in range(1, 4):
+        rows = "".join(f"{day * 10 + i},2024-01-0{day},{i * 0.5}\n" for i in range(5))
+        (tmp_path / f"2024-01-0{day}.csv").write_text("id,date,value\n" + rows)
+    (tmp_path / "2023-12-31.csv").write_text("id,date,value\n0,2023-12-31,1.0\n")
+    (tmp_path / "_SUCCESS").write_text("")
+    return tmp_path
+
+
+def test_glob_loads_one_handle(partitions):
+    res = load_dataset(str(partitions / "2024-*.csv"))
+    df = DataStorage.get(res.handle)
+    assert len(df) == 15
+    assert df["id"].tolist()[:6] == [10, 11, 12, 13, 14, 20]
+    assert df["value"].dtype == "float64"
+
+
+def test_directory_skips_markers(partitions):
+    df = DataStorage.get(load_dataset(str(partitions)).handle)
+    assert len(df) == 16
+    assert df["id"].iloc[0] == 0  # sorted by name
+
+
+def test_columns_and_max_rows(partitions):
+    res = load_dataset(str(partitions / "*.csv"), columns=["id"], max_rows=3)
+    df = DataStorage.get(res.handle)
+    assert list(df.columns) == ["id"]
+    assert df["id"].tolist() == [0, 10, 11]
+
+
+def test_parquet_partitions_with_filters_and_types_unified(tmp_path):
+    pq.write_table(pa.table({"id": [1, 2], "x": [None, None]}), tmp_path / "a.parquet")
+    pq.write_table(pa.table({"id": [3, 4], "x": [1.5, 2.5]}), tmp_path / "b.parquet")
+    res = load_dataset(str(tmp_path / "*.parquet"), filters=[["id", ">", 1]])
+    df = DataStorage.get(res.handle)
+    assert df["id"].tolist() == [2, 3, 4]
+    assert df["x"].tolist()[1:] == [1.5, 2.5]
+
+
+def test_polars_reads_all_files(partitions):
+    pl = pytest.importorskip("polars")
+    res = load_dataset(str(partitions / "2024-*.csv"), use_polars=True)
+    frame = DataStorage.get_frame(res.handle)
+    assert isinstance(frame, pl.DataFrame)
+    assert frame.height == 15
+
+
+def test_no_matches_and_total_size_limit(partitions, monkeypatch):
+    res = load_dataset(str(partitions / "1999-*.csv"))
+    assert res == {"error": f"No data files match {partitions / '1999-*.csv'}"}
+
+    monkeypatch.setattr(
+        "gx_mcp_server.tools.datasets.get_csv_size_limit_bytes", lambda: 100
+    )
+    res = load_dataset(str(partitions / "*.csv"))
+    assert "Local files exceed" in res["error"]
+
+
+def test_lazy_glob(partitions):
+    res = load_dataset(str(partitions / "2024-*.csv"), lazy=True)
+    assert len(DataStorage.get(res.handle)) == 15
+
+
+def test_read_files_uses_parallel_workers(partitions):
+    paths = sorted(partitions.glob("2024-*.csv"))
+    df = ingest.read_files(paths, max_workers=2)
+    pd.testing.assert_frame_equal(
+        df, pd.concat([pd.read_csv(p) for p in paths], ignore_index=True)
+    )
+
+
+def test_glob_reads_empty_fields_as_nulls(tmp_path):
+    (tmp_path / "part-1.csv").write_text("id,name\n1,a\n")
+    (tmp_path / "part-2.csv").write_text("id,name\n2,\n3,NA\n4,b\n")
+    (tmp_path / "all.txt").write_text("id,name\n1,a\n2,\n3,NA\n4,b\n")
+    glob = DataStorage.get(load_dataset(str(tmp_path / "part-*.csv")).handle)
+    single = DataStorage.get(load_dataset(str(tmp_path / "all.txt")).handle)
+    assert glob["name"].isna().tolist() == [False, True, True, False]
+    assert glob.isna().equals(single.isna())
+    assert glob.dropna().equals(single.dropna())
+
+
+def test_max_rows_stops_reading_files(partitions, monkeypatch):
+    read = []
+    read_table = ingest.read_table
+
+    def counting(path, *args, **kwargs):
+        read.append(path)
+        return read_table(path, *args, **kwargs)
+
+    monkeypatch.setattr(ingest, "read_table", counting)
+    paths = sorted(partitions.glob("*.csv"))
+    df = ingest.read_files(paths, max_rows=3, max_workers=1)
+    assert df["id"].tolist() == [0, 10, 11]
+    assert read == paths[:2]
+
+
+@pytest.mark.parametrize("engine", ["pandas", "pyarrow"])
+def test_dtypes_skip_inference(tmp_path, engine):
+    (tmp_path / "part-1.csv").write_text("zip,n\n00123,1\n")
+    (tmp_path / "part-2.csv").write_text("zip,n\n04000,2\n,3\n")
+    sources = [str(tmp_path / "*.csv"), str(tmp_path / "part-2.csv")]
+    for source in sources:
+        res = load_dataset(source, dtypes={"zip": "str", "n": "int32"}, engine=engine)
+        df = DataStorage.get(res.handle)
+        assert df["zip"].dropna().tolist()[-1] == "04000"
+        assert df["zip"].isna().tolist()[-1]
+        assert df["n"].dtype == "int32"
+    df = DataStorage.get(load_dataset(sources[0], dtypes={"zip": "str"}).handle)
+    assert df["zip"].tolist()[0] == "00123"
@@ -0,0 +1,101 @@
+import pandas as pd
+import pytest
+
+from gx_mcp_server.core import storage
+from gx_mcp_server.tools.datasets import load_dataset
+from gx_mcp_server.tools.expectations import add_expectation, create_suite
+from gx_mcp_server.tools.validation import _execute_validation
+
+pl = pytest.importorskip("polars")
+
+EXPECTATIONS = [
+    ("expect_column_to_exist", {"column": "a"}),
+    ("expect_column_to_exist", {"column": "missing"}),
+    ("expect_column_values_to_not_be_null", {"column": "a"}),
+    ("expect_column_values_to_be_null", {"column": "a", "mostly": 0.2}),
+    ("expect_column_values_to_be_in_set", {"column": "b", "value_set": ["x", "y"]}),
+    ("expect_column_values_to_be_between", {"column": "a", "min_value": 1}),
+    (
+        "expect_column_values_to_be_between",
+        {"column": "a", "min_value": 1, "max_value": 3, "strict_max": True},
+    ),
+    ("expect_column_values_to_be_unique", {"column": "b", "mostly": 0.5}),
+    ("expect_table_row_count_to_be_between", {"min_value": 1, "max_value": 3}),
+    ("expect_table_column_count_to_equal", {"value": 2}),
+]
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,x\n2,z\n3,z\n,\n")
+    return path
+
+
+def _suite(name, expectations):
+    create_suite(name, "dummy")
+    for kind, kwargs in expectations:
+        add_expectation(name, kind, kwargs)
+
+
+def _by_config(result):
+    return {
+        (r["expectation_config"]["type"], repr(r["expectation_config"]["kwargs"])): (
+            r["success"],
+            r["result"],
+        )
+        for r in result["results"]
+    }
+
+
+def test_polars_frames_are_stored_natively(csv_path):
+    handle = load_dataset(str(csv_path), use_polars=True, max_rows=2).handle
+    assert isinstance(storage.DataStorage.get_frame(handle), pl.DataFrame)
+    # The pandas API is unchanged
+    assert storage.DataStorage.get(handle)["a"].tolist() == [1, 2]
+    assert storage.DataStorage.get_handle_path(handle).endswith(".csv")
+
+
+def test_native_results_match_gx(csv_path):
+    _suite("polars_parity", EXPECTATIONS)
+    native = _execute_validation(
+        "polars_parity", load_dataset(str(csv_path), use_polars=True).handle
+    )
+    assert native["meta"]["engine"] == "polars"
+    gx_result = _execute_validation("polars_parity", load_dataset(str(csv_path)).handle)
+    assert "engine" not in gx_result["meta"]
+
+    assert native["success"] == gx_result["success"]
+    assert native["statistics"] == gx_result["statistics"]
+    expected = _by_config(gx_result)
+    for key, (success, result) in _by_config(native).items():
+        gx_success, gx_values = expected[key]
+        assert success == gx_success, key
+        assert result.keys() == gx_values.keys(), key
+        for name in ("element_count", "unexpected_count", "missing_count"):
+            assert result.get(name) == gx_values.get(name), (key, name)
+
+
+def test_unsupported_expectation_falls_back_to_gx(csv_path):
+    _suite(
+        "polars_fallback",
+        [
+            ("expect_column_values_to_not_be_null", {"column": "a"}),
+            ("expect_column_mean_to_be_between", {"column": "a", "min_value": 1}),
+        ],
+    )
+    handle = load_dataset(str(csv_path), use_polars=True).handle
+    result = _execute_validation("polars_fallback", handle)
+    assert "engine" not in result["meta"]
+    assert result["statistics"]["evaluated_expectations"] == 2
+
+
+def test_non_native_backend_converts(tmp_path):
+    storage.configure_storage_backend(f"sqlite:///{tmp_path}/gx.db")
+    try:
+        handle = storage.DataStorage.add(pl.DataFrame({"a": [1, 2]}))
+        frame = storage.DataStorage.get_frame(handle)
+        assert isinstance(frame, pd.DataFrame)
+        assert frame["a"].tolist() == [1, 2]
+    finally:
+        storage.configure_storage_backend("memory")
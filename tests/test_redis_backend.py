@@ -0,0 +1,162 @@
+import socketserver
+import threading
+
+import pandas as pd
+import pytest
+
+from gx_mcp_server.core import storage
+
+pytest.importorskip("redis")
+
+
+class _StandInRedis(socketserver.ThreadingTCPServer):
+    """Minimal in-process RESP2 server covering the commands the backend uses."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _RespHandler)
+        self.lock = threading.Lock()
+        self.data: dict[bytes, object] = {}
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            args = []
+            for _ in range(int(line[1:])):
+                size = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(size + 2)[:-2])
+            with self.server.lock:  # type: ignore[attr-defined]
+                reply = self._run(args[0].upper().decode(), args[1:])
+            self.wfile.write(_encode(reply))
+
+    def _run(self, cmd: str, args: list[bytes]) -> object:
+        data = self.server.data  # type: ignore[attr-defined]
+        if cmd == "SET":
+            data[args[0]] = args[1]
+            return "OK"
+        if cmd == "GET":
+            return data.get(args[0])
+        if cmd == "EXISTS":
+            return sum(k in data for k in args)
+        if cmd == "DEL":
+            return sum(data.pop(k, None) is not None for k in args)
+        if cmd == "HSET":
+            h = data.setdefault(args[0], {})
+            for field, value in zip(args[1::2], args[2::2]):
+                h[field] = value  # type: ignore[index]
+            return len(args[1:]) // 2
+        if cmd == "HGET":
+            return data.get(args[0], {}).get(args[1])  # type: ignore[union-attr]
+        if cmd == "HMGET":
+            h = data.get(args[0], {})
+            return [h.get(f) for f in args[1:]]  # type: ignore[union-attr]
+        if cmd == "ZADD":
+            z = data.setdefault(args[0], {})
+            z[args[2]] = float(args[1])  # type: ignore[index]
+            return 1
+        if cmd == "ZCARD":
+            return len(data.get(args[0], {}))  # type: ignore[arg-type]
+        if cmd == "ZREM":
+            z = data.get(args[0], {})
+            return sum(z.pop(m, None) is not None for m in args[1:])  # type: ignore[union-attr]
+        if cmd == "ZRANGEBYSCORE":
+            z = data.get(args[0], {})
+            cutoff = float(args[2].lstrip(b"("))
+            return [m for m, s in sorted(z.items(), key=lambda kv: kv[1]) if s < cutoff]  # type: ignore[union-attr]
+        if cmd == "ZPOPMIN":
+            z = data.get(args[0], {})
+            members = sorted(z.items(), key=lambda kv: kv[1])  # type: ignore[union-attr]
+            popped = members[: int(args[1]) if len(args) > 1 else 1]
+            for member, _ in popped:
+                del z[member]  # type: ignore[union-attr]
+            return [x for m, s in popped for x in (m, repr(s).encode())]
+        return "OK"  # PING, CLIENT SETINFO, ...
+
+
+def _encode(reply: object) -> bytes:
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, str):
+        return f"+{reply}\r\n".encode()
+    if isinstance(reply, int):
+        return f":{reply}\r\n".encode()
+    if isinstance(reply, bytes):
+        return b"$%d\r\n%s\r\n" % (len(reply), reply)
+    items = list(reply)  # type: ignore[call-overload]
+    return b"*%d\r\n" % len(items) + b"".join(_encode(i) for i in items)
+
+
+@pytest.fixture
+def redis_uri():
+    server = _StandInRedis()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    # The stand-in only speaks RESP2
+    yield server, f"redis://127.0.0.1:{server.server_address[1]}/0?protocol=2"
+    storage.configure_storage_backend("memory")
+    server.shutdown()
+    server.server_close()
+
+
+def test_redis_datasets_and_results(redis_uri):
+    server, uri = redis_uri
+    storage.configure_storage_backend(f"{uri}&compression=zstd&prefix=test")
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    handle = storage.DataStorage.add(df)
+
+    assert storage.DataStorage.get(handle).equals(df)
+    assert storage.DataStorage.get(handle, columns=["b"]).equals(df[["b"]])
+    assert f"test:ds:{handle}".encode() in server.data
+
+    vid = storage.ValidationStorage.reserve()
+    assert storage.ValidationStorage.get_summary(vid) == {"status": "pending"}
+    result = {"statistics": {"n": 1}, "results": [{"ok": True}], "success": True}
+    storage.ValidationStorage.set(vid, result)
+    assert storage.ValidationStorage.get(vid) == result
+    assert storage.ValidationStorage.get_summary(vid)["success"] is True
+
+    storage.DataStorage.delete(handle)
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(handle)
+    with pytest.raises(KeyError):
+        storage.ValidationStorage.get("missing")
+
+
+def test_redis_handles_shared_between_replicas(redis_uri, monkeypatch):
+    from gx_mcp_server.storage import redis_backend
+
+    _, uri = redis_uri
+    monkeypatch.setattr(redis_backend, "_MAX_ITEMS", 2)
+    storage.configure_storage_backend(uri)
+    handles = [storage.DataStorage.add(pd.DataFrame({"a": [i]})) for i in range(3)]
+
+    # A second replica connecting to the same server sees the same handles
+    storage.configure_storage_backend(uri)
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(handles[0])
+    assert storage.DataStorage.get(handles[2])["a"].tolist() == [2]
+
+
+def test_redis_purge_expired(redis_uri):
+    import time
+
+    _, uri = redis_uri
+    storage.configure_storage_backend(uri)
+    storage.configure_ttl(dataset_seconds=60, result_seconds=60)
+    try:
+        handle = storage.DataStorage.add(pd.DataFrame({"a": [1]}))
+        vid = storage.ValidationStorage.add({"success": True})
+        assert storage.sweep_expired() == (0, 0)
+        assert storage.sweep_expired(now=time.time() + 120) == (1, 1)
+        with pytest.raises(KeyError):
+            storage.DataStorage.get(handle)
+        with pytest.raises(KeyError):
+            storage.ValidationStorage.get(vid)
+    finally:
+        storage.configure_ttl(None, None)
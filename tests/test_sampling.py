@@ -0,0 +1,123 @@
+import gzip
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from gx_mcp_server.core import sampling
+from gx_mcp_server.core.schema import SampleOptions
+from gx_mcp_server.core.storage import DataStorage
+from gx_mcp_server.tools.datasets import load_dataset
+
+ROWS = 250_000
+
+
+@pytest.fixture(scope="module")
+def csv_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("sample") / "events.csv.gz"
+    frame = pd.DataFrame(
+        {
+            "id": np.arange(ROWS),
+            # Time-ordered: a head sample would only ever see "early"
+            "phase": np.where(np.arange(ROWS) < ROWS * 0.9, "early", "late"),
+        }
+    )
+    path.write_bytes(gzip.compress(frame.to_csv(index=False).encode()))
+    return path
+
+
+def _load(path, **sample):
+    res = load_dataset(str(path), sample=sample)
+    return DataStorage.get(res.handle)
+
+
+def test_reservoir_is_uniform_and_ordered(csv_path):
+    df = _load(csv_path, method="reservoir", size=2_000, seed=7)
+    assert len(df) == 2_000
+    assert df["id"].is_monotonic_increasing
+    assert 0.05 < (df["phase"] == "late").mean() < 0.15
+    pd.testing.assert_frame_equal(
+        df, _load(csv_path, method="reservoir", size=2_000, seed=7)
+    )
+    assert not df.equals(_load(csv_path, method="reservoir", size=2_000, seed=8))
+
+
+def test_bernoulli_fraction(csv_path):
+    df = _load(csv_path, method="bernoulli", fraction=0.01, seed=1)
+    assert 2_000 < len(df) < 3_000
+    assert df["id"].is_monotonic_increasing
+
+
+def test_stratified_caps_each_stratum(csv_path):
+    df = _load(csv_path, method="stratified", column="phase", size=100)
+    assert df["phase"].value_counts().to_dict() == {"early": 100, "late": 100}
+
+
+def test_max_rows_caps_scan(csv_path):
+    df = _load(csv_path, method="reservoir", size=50)
+    assert df["id"].max() > 1_000
+    res = load_dataset(
+        str(csv_path), max_rows=1_000, sample={"method": "reservoir", "size": 50}
+    )
+    assert DataStorage.get(res.handle)["id"].max() < 1_000
+
+
+def test_reservoir_matches_sequential_algorithm_r():
+    frame = pd.DataFrame({"x": range(1_000)})
+    chunks = [frame.iloc[i : i + 37] for i in range(0, 1_000, 37)]
+    options = SampleOptions(size=10, seed=3)
+    got = sampling.sample(chunks, options)["x"].tolist()
+
+    # Replay the same draws one row at a time
+    rng = np.random.default_rng(3)
+    reservoir = []
+    seen = 0
+    for chunk in chunks:
+        index = np.arange(seen, seen + len(chunk))
+        draws = rng.integers(0, index + 1)
+        for i, j, x in zip(index, draws, chunk["x"]):
+            if i < 10:
+                reservoir.append(x)
+            elif j < 10:
+                reservoir[j] = x
+        seen += len(chunk)
+    assert got == sorted(reservoir)
+
+
+def test_parquet_sample_with_filters_and_columns(tmp_path):
+    path = tmp_path / "data.parquet"
+    table = pa.table(
+        {"id": range(10_000), "year": [2020 + i % 4 for i in range(10_000)]}
+    )
+    pq.write_table(table, path, row_group_size=1_000)
+    res = load_dataset(
+        str(path),
+        columns=["id"],
+        filters=[["year", "=", 2023]],
+        sample={"method": "reservoir", "size": 20},
+    )
+    df = DataStorage.get(res.handle)
+    assert list(df.columns) == ["id"]
+    assert len(df) == 20
+    assert (df["id"] % 4 == 3).all()
+
+
+def test_multi_file_sample(tmp_path):
+    for part in range(3):
+        ids = range(part * 100, part * 100 + 100)
+        pd.DataFrame({"id": ids}).to_csv(tmp_path / f"p{part}.csv", index=False)
+    res = load_dataset(
+        str(tmp_path / "*.csv"), sample={"method": "bernoulli", "fraction": 0.5}
+    )
+    df = DataStorage.get(res.handle)
+    assert 100 < len(df) < 200
+    assert df["id"].max() >= 200
+
+
+def test_invalid_options():
+    res = load_dataset("a\n1\n", "inline", sample={"method": "bernoulli"})
+    assert "needs a fraction" in res["error"]
+    res = load_dataset("a\n1\n", "inline", sample={"method": "stratified", "size": 1})
+    assert "needs a column" in res["error"]
@@ -0,0 +1,135 @@
+import subprocess
+import sys
+import uuid
+
+import pandas as pd
+import pytest
+
+from gx_mcp_server.core import storage
+
+pytest.importorskip("fcntl")
+
+
+@pytest.fixture
+def shm_uri(tmp_path):
+    from gx_mcp_server.storage import shm_backend
+
+    uri = f"shm://test-{uuid.uuid4().hex[:8]}?dir={tmp_path}"
+    yield uri
+    storage.configure_storage_backend(uri)
+    shm_backend.destroy()
+    storage.configure_storage_backend("memory")
+
+
+def test_shm_roundtrip(shm_uri):
+    storage.configure_storage_backend(shm_uri)
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"]})
+    handle = storage.DataStorage.add(df)
+
+    loaded = storage.DataStorage.get(handle)
+    assert isinstance(loaded["a"].dtype, pd.ArrowDtype)
+    assert loaded["a"].tolist() == [1, 2, 3]
+    assert list(storage.DataStorage.get(handle, columns=["b"]).columns) == ["b"]
+
+    vid = storage.ValidationStorage.reserve()
+    assert storage.ValidationStorage.get_summary(vid) == {"status": "pending"}
+    result = {"statistics": {"n": 1}, "results": [{"ok": True}], "success": True}
+    storage.ValidationStorage.set(vid, result)
+    assert storage.ValidationStorage.get(vid) == result
+
+    storage.DataStorage.delete(handle)
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(handle)
+    # The frame read earlier keeps its mapping after the segment is unlinked
+    assert loaded["a"].sum() == 6
+
+
+def test_shm_numpy_dtypes_and_eviction(shm_uri, monkeypatch):
+    from gx_mcp_server.storage import shm_backend
+
+    monkeypatch.setattr(shm_backend, "_MAX_ITEMS", 2)
+    storage.configure_storage_backend(f"{shm_uri}&dtype_backend=numpy")
+    frames = [pd.DataFrame({"a": [i, i + 1]}) for i in range(3)]
+    handles = [storage.DataStorage.add(df) for df in frames]
+
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(handles[0])
+    assert storage.DataStorage.get(handles[2]).equals(frames[2])
+    with pytest.raises(KeyError):
+        storage.DataStorage.get("../../etc/passwd")
+
+
+def test_shm_handles_outlive_creating_process(shm_uri):
+    code = (
+        "import pandas as pd;"
+        "from gx_mcp_server.core import storage;"
+        f"storage.configure_storage_backend('{shm_uri}');"
+        "print(storage.DataStorage.add(pd.DataFrame({'a': [1, 2, 3]})))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert "leaked" not in out.stderr
+    storage.configure_storage_backend(shm_uri)
+    handle = out.stdout.strip().splitlines()[-1]
+    assert storage.DataStorage.get(handle)["a"].sum() == 6
+
+
+def test_shm_readers_share_the_index_lock(shm_uri):
+    import fcntl
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    from gx_mcp_server.storage import shm_backend
+
+    storage.configure_storage_backend(shm_uri)
+    handle = storage.DataStorage.add(pd.DataFrame({"a": [1, 2]}))
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        fd = os.open(f"{shm_backend._index_path}.lock", os.O_RDWR)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH)
+            # Would wait for the lock above if reads took it exclusively
+            future = pool.submit(storage.DataStorage.get, handle)
+            assert future.result(timeout=5)["a"].tolist() == [1, 2]
+        finally:
+            os.close(fd)
+
+
+def test_shm_get_survives_concurrent_delete(shm_uri, monkeypatch):
+    import threading
+
+    from gx_mcp_server.storage import shm_backend
+
+    storage.configure_storage_backend(shm_uri)
+    handle = storage.DataStorage.add(pd.DataFrame({"a": [1, 2]}))
+    storage.DataStorage.get(handle)  # attach the segment in this process
+    reading, deleted = threading.Event(), threading.Event()
+    header = shm_backend._DS_HEADER
+
+    class PausingHeader:
+        size = header.size
+
+        def unpack_from(self, buffer):
+            reading.set()
+            deleted.wait(timeout=1)
+            return header.unpack_from(buffer)
+
+    monkeypatch.setattr(shm_backend, "_DS_HEADER", PausingHeader())
+    outcome = []
+
+    def read():
+        try:
+            outcome.append(storage.DataStorage.get(handle)["a"].tolist())
+        except KeyError:
+            outcome.append("missing")
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    assert reading.wait(timeout=5)
+    remover = threading.Thread(target=storage.DataStorage.delete, args=(handle,))
+    remover.start()
+    remover.join(timeout=0.5)
+    deleted.set()
+    reader.join(timeout=5)
+    remover.join(timeout=5)
+    assert outcome in ([[1, 2]], ["missing"])
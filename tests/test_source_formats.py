@@ -0,0 +1,105 @@
+import base64
+import io
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+import pytest
+
+from gx_mcp_server.core import ingest
+from gx_mcp_server.core.storage import DataStorage
+from gx_mcp_server.tools.datasets import load_dataset
+
+FRAME = pd.DataFrame(
+    {
+        "id": range(100),
+        "year": [2018 + i % 5 for i in range(100)],
+        "name": [f"row{i}" for i in range(100)],
+    }
+)
+
+
+@pytest.fixture
+def parquet_path(tmp_path):
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.Table.from_pandas(FRAME), path, row_group_size=10)
+    return path
+
+
+def test_parquet_columns_and_filters(parquet_path):
+    res = load_dataset(
+        str(parquet_path), columns=["id", "year"], filters=[["year", ">=", 2021]]
+    )
+    df = DataStorage.get(res.handle)
+    assert list(df.columns) == ["id", "year"]
+    assert len(df) == 40
+    assert (df["year"] >= 2021).all()
+
+
+def test_parquet_max_rows_reads_leading_rows(parquet_path):
+    df = DataStorage.get(load_dataset(str(parquet_path), max_rows=15).handle)
+    assert df["id"].tolist() == list(range(15))
+
+
+def test_feather(tmp_path):
+    path = tmp_path / "data.feather"
+    feather.write_feather(FRAME, path)
+    res = load_dataset(str(path), filters=[["name", "in", ["row1", "row2"]]])
+    assert DataStorage.get(res.handle)["id"].tolist() == [1, 2]
+
+
+def test_arrow_ipc_stream_detected_without_extension(tmp_path):
+    path = tmp_path / "data"
+    table = pa.Table.from_pandas(FRAME, preserve_index=False)
+    with pa.ipc.new_stream(path, table.schema) as writer:
+        writer.write_table(table)
+    df = DataStorage.get(load_dataset(str(path), max_rows=3).handle)
+    assert df["name"].tolist() == ["row0", "row1", "row2"]
+
+
+def test_parquet_detected_from_magic_bytes(tmp_path, parquet_path):
+    path = tmp_path / "blob.bin"
+    path.write_bytes(parquet_path.read_bytes())
+    assert len(DataStorage.get(load_dataset(str(path)).handle)) == 100
+
+
+def test_jsonl(tmp_path):
+    path = tmp_path / "data.jsonl"
+    FRAME.to_json(path, orient="records", lines=True)
+    df = DataStorage.get(load_dataset(str(path), columns=["name"]).handle)
+    assert list(df.columns) == ["name"]
+    assert len(df) == 100
+
+
+def test_inline_jsonl_and_base64_parquet():
+    res = load_dataset('{"a": 1}\n{"a": 2}\n', "inline")
+    assert DataStorage.get(res.handle)["a"].tolist() == [1, 2]
+
+    buf = io.BytesIO()
+    FRAME.to_parquet(buf)
+    encoded = base64.b64encode(buf.getvalue()).decode()
+    res = load_dataset(encoded, "inline", filters=[["id", "<", 5]])
+    assert DataStorage.get(res.handle)["id"].tolist() == list(range(5))
+
+
+def test_explicit_format_and_errors(tmp_path, parquet_path):
+    path = tmp_path / "data.txt"
+    path.write_bytes(parquet_path.read_bytes())
+    res = load_dataset(str(path), source_format="parquet", columns=["id"])
+    assert list(DataStorage.get(res.handle).columns) == ["id"]
+
+    res = load_dataset("a,b\n1,2\n3,4\n", "inline", filters=[["a", "==", 3]])
+    assert DataStorage.get(res.handle).to_dict("list") == {"a": [3], "b": [4]}
+    res = load_dataset("not base64!", "inline", source_format="parquet")
+    assert "must be base64" in res["error"]
+
+
+def test_detect_format():
+    assert ingest.detect_format("https://x.test/d.PARQUET?sig=1") == "parquet"
+    assert ingest.detect_format("data.ndjson") == "jsonl"
+    assert ingest.detect_format(None, b"ARROW1\x00\x00") == "arrow"
+    assert ingest.detect_format(None, b"a,b\n") == "csv"
+    assert ingest.normalize_format("Feather") == "arrow"
+    with pytest.raises(ValueError):
+        ingest.normalize_format("xlsx")
@@ -1,4 +1,10 @@
+import gc
+import pickle
+import sqlite3
+
 import pandas as pd
+import pytest
+
 from gx_mcp_server.core import storage
 
 
@@ -18,3 +24,130 @@ def test_sqlite_persistence(tmp_path):
 
     result_loaded = storage.ValidationStorage.get(vid)
     assert result_loaded == {"ok": True}
+
+
+def test_sqlite_columnar_formats(tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [0.5, 1.5, 2.5]})
+    for query in ("", "?compression=zstd", "?format=parquet&compression=zstd"):
+        db_path = tmp_path / f"gx{len(query)}.db"
+        storage.configure_storage_backend(f"sqlite:///{db_path}{query}")
+        handle = storage.DataStorage.add(df)
+
+        assert storage.DataStorage.get(handle).equals(df)
+        projected = storage.DataStorage.get(handle, columns=["c", "a"])
+        assert list(projected.columns) == ["c", "a"]
+        assert projected.equals(df[["c", "a"]])
+
+
+def test_sqlite_arrow_dtype_backend(tmp_path):
+    db_path = tmp_path / "gx.db"
+    storage.configure_storage_backend(f"sqlite:///{db_path}?dtype_backend=pyarrow")
+    handle = storage.DataStorage.add(pd.DataFrame({"a": [1, 2]}))
+    df_loaded = storage.DataStorage.get(handle)
+    assert isinstance(df_loaded["a"].dtype, pd.ArrowDtype)
+    assert df_loaded["a"].tolist() == [1, 2]
+
+
+def test_sqlite_wal_and_eviction(tmp_path, monkeypatch):
+    from gx_mcp_server.storage import sqlite_backend
+
+    monkeypatch.setattr(sqlite_backend, "_MAX_ITEMS", 3)
+    storage.configure_storage_backend(f"sqlite:///{tmp_path / 'gx.db'}")
+    conn = sqlite_backend._get_conn()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    handles = [storage.DataStorage.add(pd.DataFrame({"a": [i]})) for i in range(5)]
+    assert conn.execute("SELECT COUNT(*) FROM datasets").fetchone()[0] == 3
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(handles[1])
+    assert storage.DataStorage.get(handles[-1])["a"].tolist() == [4]
+
+
+def test_sqlite_concurrent_readers(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from gx_mcp_server.storage import sqlite_backend
+
+    storage.configure_storage_backend(f"sqlite:///{tmp_path / 'gx.db'}")
+    handle = storage.DataStorage.add(pd.DataFrame({"a": range(100)}))
+
+    used = set()
+
+    def read(_):
+        storage.DataStorage.add(pd.DataFrame({"b": [1]}))
+        used.add(sqlite_backend._get_conn())
+        return storage.DataStorage.get(handle)["a"].sum()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert set(pool.map(read, range(32))) == {4950}
+    assert len(used) > 1
+
+    # Connections of finished threads are closed
+    gc.collect()
+    assert sqlite_backend._connections == {sqlite_backend._get_conn()}
+    for conn in used:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_sqlite_result_summary_and_reservation(tmp_path):
+    from gx_mcp_server.storage import sqlite_backend
+
+    storage.configure_storage_backend(f"sqlite:///{tmp_path / 'gx.db'}")
+    vid = storage.ValidationStorage.reserve()
+    assert storage.ValidationStorage.get(vid) == {"status": "pending"}
+
+    result = {"statistics": {"n": 1}, "results": [{"x": "y" * 1000}], "success": True}
+    storage.ValidationStorage.set(vid, result)
+    assert storage.ValidationStorage.get(vid) == result
+    assert storage.ValidationStorage.get_summary(vid) == {
+        "statistics": {"n": 1},
+        "success": True,
+    }
+    blob = sqlite_backend._select("validations", vid)
+    assert len(blob) < 100
+
+
+def test_sqlite_drops_pickled_datasets(tmp_path):
+    from gx_mcp_server.storage import sqlite_backend
+
+    db_path = tmp_path / "gx.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE datasets (id TEXT PRIMARY KEY, data BLOB, created INTEGER)"
+    )
+    conn.execute(
+        "INSERT INTO datasets VALUES ('old', ?, strftime('%s','now'))",
+        (pickle.dumps(pd.DataFrame({"a": [1]})),),
+    )
+    conn.commit()
+    conn.close()
+
+    storage.configure_storage_backend(f"sqlite:///{db_path}")
+    assert not sqlite_backend.DataStorage.contains("old")
+    with pytest.raises(KeyError):
+        storage.DataStorage.get("old")
+    handle = storage.DataStorage.add(pd.DataFrame({"a": [2]}))
+    assert storage.DataStorage.get(handle)["a"].tolist() == [2]
+
+
+def test_sqlite_drops_results_without_summary(tmp_path):
+    db_path = tmp_path / "gx.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE validations (id TEXT PRIMARY KEY, data BLOB, created INTEGER)"
+    )
+    conn.execute(
+        "INSERT INTO validations VALUES ('old', ?, strftime('%s','now'))",
+        (pickle.dumps({"success": True}),),
+    )
+    conn.commit()
+    conn.close()
+
+    storage.configure_storage_backend(f"sqlite:///{db_path}")
+    with pytest.raises(KeyError):
+        storage.ValidationStorage.get("old")
+    with pytest.raises(KeyError):
+        storage.ValidationStorage.get_summary("old")
+    vid = storage.ValidationStorage.add({"success": False})
+    assert storage.ValidationStorage.get_summary(vid) == {"success": False}
@@ -0,0 +1,75 @@
+import gzip
+import io
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from gx_mcp_server.core import ingest
+from gx_mcp_server.core.storage import DataStorage
+from gx_mcp_server.tools.datasets import load_dataset
+
+ROWS = 200_000
+BODY = b"id,name\n" + b"".join(b"%d,row%d\n" % (i, i) for i in range(ROWS))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = gzip.compress(BODY) if self.path == "/gzip" else BODY
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        if self.path == "/gzip":
+            self.send_header("Content-Encoding", "gzip")
+        if self.path == "/sized":
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        # Chunked: the size is only known by reading the stream
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for start in range(0, len(body), 65536):
+            chunk = body[start : start + 65536]
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("path", ["/chunked", "/sized", "/gzip"])
+def test_url_is_parsed_while_streaming(base_url, path):
+    res = load_dataset(base_url + path, source_type="url")
+    df = DataStorage.get(res.handle)
+    assert len(df) == ROWS
+    assert df["id"].dtype == "int64"
+    assert df["name"].iloc[-1] == f"row{ROWS - 1}"
+
+
+def test_url_max_rows(base_url):
+    res = load_dataset(base_url + "/chunked", source_type="url", max_rows=10)
+    assert len(DataStorage.get(res.handle)) == 10
+
+
+def test_streamed_url_limit(base_url, monkeypatch):
+    monkeypatch.setenv("MCP_CSV_SIZE_LIMIT_MB", "1")
+    res = load_dataset(base_url + "/chunked", source_type="url")
+    assert res == {"error": "Remote CSV exceeds 1 MB limit"}
+
+
+def test_limited_reader_stops_at_limit():
+    stream = ingest.limited_stream(io.BytesIO(b"x" * 100), 10)
+    with pytest.raises(ingest.SizeLimitExceeded):
+        stream.read()
+    assert len(ingest.read_csv(io.BytesIO(b"a\n1\n2\n"), 6)) == 2
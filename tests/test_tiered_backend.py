@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from gx_mcp_server.core import storage
+from gx_mcp_server.storage import tiered_backend
+
+
+def test_cold_datasets_spill_and_page_back(tmp_path, monkeypatch):
+    monkeypatch.setattr(tiered_backend, "_MAX_HOT_ITEMS", 2)
+    storage.configure_storage_backend(f"tiered:///{tmp_path}")
+
+    frames = [pd.DataFrame({"a": [i, i + 1], "b": ["x", "y"]}) for i in range(5)]
+    handles = [storage.DataStorage.add(df) for df in frames]
+
+    assert len(tiered_backend._hot) == 2
+    assert {p.stem for p in tmp_path.glob("*.arrow")} == set(handles[:3])
+    for handle, df in zip(handles, frames):
+        assert storage.DataStorage.get(handle).equals(df)
+    assert storage.DataStorage.get(handles[0], columns=["b"]).equals(frames[0][["b"]])
+
+
+def test_spilled_datasets_survive_restart(tmp_path, monkeypatch):
+    monkeypatch.setattr(tiered_backend, "_MAX_HOT_ITEMS", 1)
+    uri = f"tiered:///{tmp_path}?format=parquet&compression=zstd"
+    storage.configure_storage_backend(uri)
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    handle = storage.DataStorage.add(df)
+    storage.DataStorage.add(pd.DataFrame({"a": [4]}))
+    assert [p.name for p in tmp_path.iterdir()] == [f"{handle}.parquet"]
+
+    storage.configure_storage_backend(uri)
+    assert storage.DataStorage.get(handle).equals(df)
+
+
+def test_failed_spill_drops_dataset(tmp_path, monkeypatch):
+    monkeypatch.setattr(tiered_backend, "_MAX_HOT_ITEMS", 1)
+    storage.configure_storage_backend(f"tiered:///{tmp_path}")
+    first = storage.DataStorage.add(pd.DataFrame({"a": [1]}))
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(tiered_backend.arrow_codec, "encode_dataframe", fail)
+    second = storage.DataStorage.add(pd.DataFrame({"a": [2]}))
+
+    assert not tiered_backend._spilling
+    assert not tiered_backend.DataStorage.contains(first)
+    assert storage.DataStorage.get(second)["a"].tolist() == [2]
+    assert not list(tmp_path.iterdir())
+
+
+def test_unknown_handle(tmp_path):
+    storage.configure_storage_backend(f"tiered:///{tmp_path}")
+    with pytest.raises(KeyError):
+        storage.DataStorage.get("missing")
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+
+import pytest
+from fastmcp import Client
+from fastmcp.tools.tool import FunctionTool
+
+from gx_mcp_server.core import offload
+from gx_mcp_server.server import create_server
+from gx_mcp_server.tools import datasets
+
+CSV = {"source": "a,b\n1,2\n", "source_type": "inline"}
+
+
+@pytest.fixture(autouse=True)
+def fresh_pools():
+    offload.shutdown()
+    yield
+    offload.shutdown()
+
+
+@pytest.fixture
+def blocked_reads(monkeypatch):
+    """Make dataset reads wait for ``release`` and count concurrent reads."""
+    state = {"running": 0, "peak": 0}
+    lock = threading.Lock()
+    release = threading.Event()
+    read_source = datasets._read_source
+
+    def slow_read(*args, **kwargs):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        try:
+            release.wait(10)
+            return read_source(*args, **kwargs)
+        finally:
+            with lock:
+                state["running"] -= 1
+
+    monkeypatch.setattr(datasets, "_read_source", slow_read)
+    return state, release
+
+
+async def test_slow_load_does_not_block_other_tools(blocked_reads):
+    state, release = blocked_reads
+    async with Client(create_server()) as client:
+        load = asyncio.create_task(client.call_tool("load_dataset", CSV))
+        while state["running"] == 0:
+            await asyncio.sleep(0.01)
+        # The loop stays free while the load waits on its worker thread
+        version = await asyncio.wait_for(client.call_tool("get_version", {}), 5)
+        assert "version" in version.data
+        assert not load.done()
+        release.set()
+        result = await load
+    assert result.structured_content["result"]["handle"]
+
+
+@pytest.mark.parametrize("limit", [1, 3])
+async def test_concurrency_limit_per_tool(blocked_reads, monkeypatch, limit):
+    monkeypatch.setenv("MCP_LOAD_DATASET_CONCURRENCY", str(limit))
+    state, release = blocked_reads
+    async with Client(create_server()) as client:
+        loads = [
+            asyncio.create_task(client.call_tool("load_dataset", CSV)) for _ in range(4)
+        ]
+        while state["running"] < limit:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        assert state["running"] == limit
+        release.set()
+        results = await asyncio.gather(*loads)
+    assert state["peak"] == limit
+    assert all(not r.is_error for r in results)
+
+
+def test_get_tool_concurrency(monkeypatch):
+    assert offload.get_tool_concurrency("load_dataset") == 2
+    assert offload.get_tool_concurrency("something_else") == 1
+    monkeypatch.setenv("MCP_RUN_CHECKPOINT_CONCURRENCY", "8")
+    assert offload.get_tool_concurrency("run_checkpoint") == 8
+    for value in ("0", "1000", "many"):
+        monkeypatch.setenv("MCP_RUN_CHECKPOINT_CONCURRENCY", value)
+        assert offload.get_tool_concurrency("run_checkpoint") == 2
+
+
+async def test_offloaded_tools_keep_their_schema():
+    tools = await create_server().get_tools()
+    for name in ("load_dataset", "run_checkpoint", "add_expectation"):
+        tool = tools[name]
+        assert tool.fn is not tool.fn.__wrapped__
+        plain = FunctionTool.from_function(tool.fn.__wrapped__)
+        assert tool.parameters == plain.parameters
+        assert tool.output_schema == plain.output_schema
+        assert tool.description == plain.description
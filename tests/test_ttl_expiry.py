@@ -0,0 +1,97 @@
+import asyncio
+import time
+import uuid
+
+import pandas as pd
+import pytest
+
+from gx_mcp_server.core import storage
+
+
+def _backend_uris(tmp_path):
+    return [
+        "memory",
+        f"sqlite:///{tmp_path}/gx.db",
+        f"tiered:///{tmp_path}/spill",
+        f"arrow:///{tmp_path}/arrow",
+        f"shm://ttl-{uuid.uuid4().hex[:8]}?dir={tmp_path}",
+    ]
+
+
+@pytest.mark.parametrize("index", range(5))
+def test_sweep_expires_by_kind(tmp_path, index):
+    uri = _backend_uris(tmp_path)[index]
+    storage.configure_storage_backend(uri)
+    storage.configure_ttl(dataset_seconds=60, result_seconds=None)
+    handle = storage.DataStorage.add(pd.DataFrame({"a": [1, 2]}))
+    vid = storage.ValidationStorage.add({"success": True})
+
+    # Nothing is old enough yet
+    assert storage.sweep_expired() == (0, 0)
+    assert storage.DataStorage.get(handle)["a"].tolist() == [1, 2]
+
+    # Results have no TTL, so only datasets go (other tests may share the
+    # in-memory store)
+    datasets, results = storage.sweep_expired(now=time.time() + 120)
+    assert datasets >= 1 and results == 0
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(handle)
+    assert storage.ValidationStorage.get(vid) == {"success": True}
+
+    storage.configure_ttl(dataset_seconds=None, result_seconds=60)
+    datasets, results = storage.sweep_expired(now=time.time() + 120)
+    assert datasets == 0 and results >= 1
+    with pytest.raises(KeyError):
+        storage.ValidationStorage.get(vid)
+
+    if uri.startswith("shm://"):
+        from gx_mcp_server.storage import shm_backend
+
+        shm_backend.destroy()
+
+
+def test_sweep_drops_dedup_aliases():
+    storage.configure_dataset_dedup(True)
+    storage.configure_ttl(dataset_seconds=60)
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    first = storage.DataStorage.add(df)
+    storage.DataStorage.add(df)
+    assert storage.sweep_expired(now=time.time() + 120)[0] >= 1
+    assert not storage._aliases
+    with pytest.raises(KeyError):
+        storage.DataStorage.get(first)
+
+
+def test_sqlite_expiry_vacuums_incrementally(tmp_path):
+    import sqlite3
+
+    storage.configure_storage_backend(f"sqlite:///{tmp_path}/gx.db")
+    storage.configure_ttl(dataset_seconds=60)
+    for _ in range(5):
+        storage.DataStorage.add(pd.DataFrame({"a": range(20_000)}))
+    conn = sqlite3.connect(tmp_path / "gx.db")
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    pages = conn.execute("PRAGMA page_count").fetchone()[0]
+
+    storage.sweep_expired(now=time.time() + 120)
+    assert conn.execute("PRAGMA page_count").fetchone()[0] < pages
+    assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+
+def test_expiry_sweeper_runs_in_background(monkeypatch):
+    monkeypatch.setattr(storage, "_MAX_SWEEP_INTERVAL", 0.01)
+    storage.configure_ttl(result_seconds=0.01)
+    vid = storage.ValidationStorage.add({"success": True})
+
+    async def main():
+        async with storage.expiry_sweeper():
+            await asyncio.sleep(0.2)
+
+    asyncio.run(main())
+    with pytest.raises(KeyError):
+        storage.ValidationStorage.get(vid)
+
+
+def test_ttl_must_be_positive():
+    with pytest.raises(ValueError):
+        storage.configure_ttl(dataset_seconds=0)
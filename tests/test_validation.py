@@ -5,3 +5,27 @@ def test_checkpoint_flow():
     vid = run_checkpoint(suite_name="test", dataset_handle="dummy").validation_id
     detail = get_validation_result(validation_id=vid)
     assert hasattr(detail, "success")
+
+
+def test_validation_summary_statuses():
+    from gx_mcp_server.core.storage import ValidationStorage
+    from gx_mcp_server.tools.validation import get_validation_summary
+
+    vid = ValidationStorage.reserve()
+    assert get_validation_summary(vid).status == "pending"
+
+    ValidationStorage.set(
+        vid,
+        {
+            "statistics": {"evaluated_expectations": 2},
+            "results": [{"success": True}, {"success": False}],
+            "success": False,
+        },
+    )
+    summary = get_validation_summary(vid)
+    assert summary.status == "completed"
+    assert summary.statistics == {"evaluated_expectations": 2}
+    assert summary.success is False
+    assert len(get_validation_result(vid).results) == 2
+
+    assert get_validation_summary("missing").status == "not_found"